@@ -0,0 +1,93 @@
+'''
+AllocationBenchmark class - measures with tracemalloc the memory allocated to start a game, with new controllers and
+repositories for every game or with the ones of a SessionPool reset in place
+'''
+
+from repository.repository import Repository
+from controller.playerController import PlayerController
+from controller.computerController import ComputerController
+from controller.gameController import GameController
+from controller.sessionPool import SessionPool
+from utilities.compactRandom import CompactRandom
+import argparse
+import time
+import tracemalloc
+import unittest
+
+class AllocationBenchmark:
+    @staticmethod
+    def createGameController():
+        return GameController(PlayerController(Repository()), ComputerController(Repository(), CompactRandom(0)))
+
+    @staticmethod
+    def __createStrategies():
+        '''
+        This function returns the measured ways to start a game
+        :return: dictionary of name: function
+        '''
+        pool = SessionPool(AllocationBenchmark.createGameController, 1)
+        repository = Repository()
+
+        def freshGame():
+            AllocationBenchmark.createGameController().initializeNewGame()
+
+        def pooledGame():
+            gameController = pool.acquire()
+            gameController.initializeNewGame()
+            pool.release(gameController)
+
+        return {"fresh game": freshGame, "pooled game": pooledGame, "grid reset": repository.initializeNewGame}
+
+    @staticmethod
+    def measure(gamesNumber = 1000):
+        '''
+        This function starts games in every way, after a warm-up game
+        :param gamesNumber: the number of started games - integer
+        :return: dictionary of name: (peak bytes above the starting point for one game, bytes kept after all the games,
+                 seconds per game without tracing)
+        '''
+        results = {}
+        for name, startGame in AllocationBenchmark.__createStrategies().items():
+            startGame()
+            startTime = time.perf_counter()
+            for i in range(gamesNumber):
+                startGame()
+            seconds = (time.perf_counter() - startTime) / gamesNumber
+            tracemalloc.start()
+            try:
+                startingBytes = tracemalloc.get_traced_memory()[0]
+                peakBytes = 0
+                for i in range(gamesNumber):
+                    tracemalloc.reset_peak()
+                    gameStartingBytes = tracemalloc.get_traced_memory()[0]
+                    startGame()
+                    peakBytes = max(peakBytes, tracemalloc.get_traced_memory()[1] - gameStartingBytes)
+                keptBytes = tracemalloc.get_traced_memory()[0] - startingBytes
+            finally:
+                tracemalloc.stop()
+            results[name] = (peakBytes, keptBytes, seconds)
+        return results
+
+    @staticmethod
+    def main(arguments = None):
+        '''
+        This function prints the measures of every way to start a game
+        :param arguments: the command line arguments - list of strings (sys.argv if None)
+        :return: nothing
+        '''
+        parser = argparse.ArgumentParser(description = "Planes game start allocations")
+        parser.add_argument("--games", type = int, default = 1000)
+        options = parser.parse_args(arguments)
+        for name, (peakBytes, keptBytes, seconds) in AllocationBenchmark.measure(options.games).items():
+            print("{:<12} peak {:>7} B/game  kept {:>6} B  {:>7.1f} us/game".format(name, peakBytes, keptBytes,
+                                                                                  seconds * 1e6))
+
+class TestAllocationBenchmark(unittest.TestCase):
+    def testPooledGamesAllocateLess(self):
+        results = AllocationBenchmark.measure(20)
+        self.assertLess(results["pooled game"][0] * 4, results["fresh game"][0])
+        self.assertLess(results["grid reset"][0], 120)
+        self.assertLess(results["grid reset"][1], 120)
+
+if __name__ == "__main__":
+    AllocationBenchmark.main()
@@ -0,0 +1,104 @@
+'''
+BoardScalingBenchmark class - measures how the cost of a move grows with the size of the board
+'''
+
+from repository.repository import Repository
+from repository.sparseRepository import SparseRepository
+from controller.playerController import PlayerController
+from controller.computerController import ComputerController
+from controller.gameController import GameController
+from utilities.gameConstants import GameConstants
+from utilities.layoutSampler import LayoutSampler
+from utilities.placementTable import PlacementTable
+from utilities.unknownCells import UnknownCells
+import argparse
+import random
+import time
+import unittest
+
+class BoardScalingBenchmark:
+    defaultSizes = [8, 16, 32, 64, 128, 256, 512, 1024]
+    storages = {"dense": Repository, "sparse": SparseRepository}
+
+    @staticmethod
+    def buildGame(size, planesNumber, seed, storage = "dense"):
+        '''
+        This function builds a game on a square board with the planes of both sides placed randomly
+        :param size: the number of rows and columns of the board - integer
+        :param planesNumber: the number of planes of every side - integer
+        :param seed: the seed of the game - integer
+        :param storage: the repository of both sides - "dense" or "sparse"
+        :return: gameController - GameController
+        '''
+        randomGenerator = random.Random(seed)
+        repositoryClass = BoardScalingBenchmark.storages[storage]
+        computerController = ComputerController(repositoryClass(size, size), randomGenerator, planesNumber)
+        gameController = GameController(PlayerController(repositoryClass(size, size)), computerController)
+        computerController.placePlanesRandomly()
+        table = PlacementTable.forBoard(size, size)
+        for placementId in LayoutSampler(planesNumber, table).sample(randomGenerator):
+            cabin = table.getCabin(placementId)
+            gameController.placePlayerPlane(GameConstants.coordinatesToCellString(cabin[0], cabin[1]),
+                                            table.getOrientation(placementId))
+        return gameController
+
+    @staticmethod
+    def measure(size, planesNumber = GameConstants.planesNumber, movesNumber = 200, seed = 0, storage = "dense"):
+        '''
+        This function times the moves of one game (a player hit and a computer hit in hunt mode)
+        :param size: the number of rows and columns of the board - integer
+        :param planesNumber: the number of planes of every side - integer
+        :param movesNumber: the maximum number of timed moves - integer
+        :param seed: the seed of the game - integer
+        :param storage: the repository of both sides - "dense" or "sparse"
+        :return: setupTime - the seconds spent building the game, moveTime - the mean seconds per move
+        '''
+        startTime = time.perf_counter()
+        gameController = BoardScalingBenchmark.buildGame(size, planesNumber, seed, storage)
+        setupTime = time.perf_counter() - startTime
+        randomGenerator = random.Random(seed + 1)
+        unknownCells = UnknownCells(size, size)
+        movesDone = 0
+        startTime = time.perf_counter()
+        while movesDone < movesNumber and gameController.getGameWinner() == "none":
+            cell = unknownCells.choice(randomGenerator)
+            unknownCells.remove(cell)
+            gameController.makePlayerHit(GameConstants.coordinatesToCellString(cell[0], cell[1]))
+            gameController.makeComputerHit()
+            movesDone += 1
+        moveTime = (time.perf_counter() - startTime) / max(movesDone, 1)
+        return setupTime, moveTime
+
+    @staticmethod
+    def main(arguments = None):
+        '''
+        This function prints the setup time and the per-move latency for every board size from the command line
+        :param arguments: the command line arguments - list of strings (sys.argv if None)
+        :return: nothing
+        '''
+        parser = argparse.ArgumentParser(description = "Planes per-move latency against the board size")
+        parser.add_argument("--sizes", type = int, nargs = "+", default = BoardScalingBenchmark.defaultSizes)
+        parser.add_argument("--planes", type = int, default = GameConstants.planesNumber)
+        parser.add_argument("--moves", type = int, default = 200)
+        parser.add_argument("--seed", type = int, default = 0)
+        parser.add_argument("--storage", choices = sorted(BoardScalingBenchmark.storages), default = "dense")
+        options = parser.parse_args(arguments)
+        for size in options.sizes:
+            setupTime, moveTime = BoardScalingBenchmark.measure(size, options.planes, options.moves, options.seed,
+                                                                options.storage)
+            print("{:>5}x{:<5} setup {:>10.2f} ms   move {:>10.2f} us".format(size, size, setupTime * 1e3, moveTime * 1e6))
+
+class TestBoardScalingBenchmark(unittest.TestCase):
+    def testMeasure(self):
+        for size in [8, 40]:
+            for storage in BoardScalingBenchmark.storages:
+                setupTime, moveTime = BoardScalingBenchmark.measure(size, 3, 20, 0, storage)
+                self.assertGreater(moveTime, 0)
+
+    def testBuildGame(self):
+        gameController = BoardScalingBenchmark.buildGame(20, 4, 1)
+        self.assertEqual(sum(line.count(1) for line in gameController.getPlayerPlanesGrid()), 40)
+        self.assertEqual(gameController.getGameWinner(), "none")
+
+if __name__ == "__main__":
+    BoardScalingBenchmark.main()
@@ -0,0 +1,201 @@
+'''
+HotPathsBenchmark class - times the hot paths of the game and compares them against a stored JSON baseline (the
+committed baseline.json was recorded on the tree before the performance work, its computer controllers drawing from
+the random module seeded with 0)
+'''
+
+from repository.repository import Repository
+from controller.playerController import PlayerController
+from controller.computerController import ComputerController
+from controller.gameController import GameController
+from validation.inputValidator import InputValidator
+from model.plane import Plane
+from utilities.gameConstants import GameConstants
+import argparse
+import json
+import os
+import random
+import sys
+import timeit
+import unittest
+
+class HotPathsBenchmark:
+    defaultBaselinePath = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+    defaultThreshold = 0.2
+
+    @staticmethod
+    def __planeGetPlaneCellsList():
+        plane = Plane("A5", "left")
+        return plane.getPlaneCellsList
+
+    @staticmethod
+    def __repositoryAddPlane():
+        repository = Repository()
+        firstPlane = Plane("A5", "left")
+        secondPlane = Plane("F8", "down")
+
+        def addPlanes():
+            repository.initializeNewGame()
+            repository.addPlane(firstPlane)
+            repository.addPlane(secondPlane)
+        return addPlanes
+
+    @staticmethod
+    def __computerControllerCheckCell():
+        computerController = ComputerController(Repository(), random.Random(0))
+        computerController.placePlanesRandomly()
+        cells = [(row, column) for row in range(8) for column in range(8)]
+
+        def checkCells():
+            for cell in cells:
+                computerController.checkCell(cell)
+        return checkCells
+
+    @staticmethod
+    def __computerControllerPlacePlanesRandomly():
+        computerController = ComputerController(Repository(), random.Random(0))
+
+        def placePlanes():
+            computerController.initializeNewGame()
+            computerController.placePlanesRandomly()
+        return placePlanes
+
+    @staticmethod
+    def __computerControllerGetNextHit():
+        computerController = ComputerController(Repository(), random.Random(0))
+        for row in range(8):
+            for column in range(7):
+                computerController.markMissedShot(row, column)
+        return computerController.getNextHit
+
+    @staticmethod
+    def __gameControllerMakeHits():
+        gameController = GameController(PlayerController(Repository()), ComputerController(Repository(), random.Random(0)))
+        cellStrings = [GameConstants.coordinatesToCellString(row, column) for row in range(8) for column in range(8)]
+
+        def playGame():
+            gameController.initializeNewGame()
+            gameController.placePlayerPlane("A5", "left")
+            gameController.placePlayerPlane("F8", "down")
+            for cellString in cellStrings:
+                gameController.makePlayerHit(cellString)
+                gameController.makeComputerHit()
+                if gameController.getGameWinner() != "none":
+                    break
+        return playGame
+
+    @staticmethod
+    def __inputValidatorCheckIfDrawnPlaneIsCorrect():
+        matrix = [[-1, -1, 2, -1, -1, -1, -1, -1],
+                  [2, 2, 2, 2, 2, -1, -1, -1],
+                  [-1, -1, 2, -1, -1, -1, -1, -1],
+                  [-1, 2, 2, 2, -1, -1, -1, -1],
+                  [-1, -1, -1, -1, -1, -1, -1, -1],
+                  [-1, -1, -1, -1, -1, -1, -1, -1],
+                  [-1, -1, -1, -1, -1, -1, -1, -1],
+                  [-1, -1, -1, -1, -1, -1, -1, -1]]
+        return lambda: InputValidator.checkIfDrawnPlaneIsCorrect(matrix)
+
+    @staticmethod
+    def getCases():
+        '''
+        This function returns the benchmarked hot paths
+        :return: cases - dictionary from the case name to a function which builds the timed callable
+        '''
+        return {"Plane.getPlaneCellsList": HotPathsBenchmark.__planeGetPlaneCellsList,
+                "Repository.addPlane (reset + two planes)": HotPathsBenchmark.__repositoryAddPlane,
+                "ComputerController.checkCell (64 cells)": HotPathsBenchmark.__computerControllerCheckCell,
+                "ComputerController.placePlanesRandomly (reset + placement)": HotPathsBenchmark.__computerControllerPlacePlanesRandomly,
+                "ComputerController.getNextHit": HotPathsBenchmark.__computerControllerGetNextHit,
+                "GameController.makePlayerHit/makeComputerHit (full game)": HotPathsBenchmark.__gameControllerMakeHits,
+                "InputValidator.checkIfDrawnPlaneIsCorrect": HotPathsBenchmark.__inputValidatorCheckIfDrawnPlaneIsCorrect}
+
+    @staticmethod
+    def run(repeat = 5, minimumTime = 0.2):
+        '''
+        This function times every hot path
+        :param repeat: the number of timing rounds of every case (the best round is kept) - integer
+        :param minimumTime: the minimum duration of a timing round in seconds - float
+        :return: results - dictionary from the case name to its best time per call in seconds
+        '''
+        results = {}
+        for name, buildCase in HotPathsBenchmark.getCases().items():
+            timer = timeit.Timer(buildCase())
+            callsNumber = 1
+            while timer.timeit(callsNumber) < minimumTime:
+                callsNumber *= 2
+            results[name] = min(timer.repeat(repeat, callsNumber)) / callsNumber
+        return results
+
+    @staticmethod
+    def compare(baseline, results, threshold = defaultThreshold):
+        '''
+        This function finds the cases which got slower than the baseline
+        :param baseline: the stored results - dictionary from the case name to seconds per call
+        :param results: the new results - dictionary from the case name to seconds per call
+        :param threshold: the accepted relative slowdown (0.2 means 20%) - float
+        :return: regressions - dictionary from the case name to its relative slowdown
+        '''
+        regressions = {}
+        for name, seconds in results.items():
+            if name in baseline and seconds > baseline[name] * (1 + threshold):
+                regressions[name] = seconds / baseline[name] - 1
+        return regressions
+
+    @staticmethod
+    def main(arguments = None):
+        '''
+        This function records or compares a baseline from the command line
+        :param arguments: the command line arguments - list of strings (sys.argv if None)
+        :return: the exit status - 1 if a regression was found, 2 if the baseline cannot be read, 0 otherwise
+        '''
+        parser = argparse.ArgumentParser(description = "Planes hot path benchmarks")
+        parser.add_argument("mode", choices = ["record", "compare"])
+        parser.add_argument("--baseline", default = HotPathsBenchmark.defaultBaselinePath)
+        parser.add_argument("--threshold", type = float, default = HotPathsBenchmark.defaultThreshold)
+        options = parser.parse_args(arguments)
+        baseline = {}
+        if options.mode == "compare":
+            try:
+                with open(options.baseline) as baselineFile:
+                    baseline = json.load(baselineFile)
+            except (OSError, ValueError) as error:
+                print("Cannot read the baseline {} ({}); record one first with the record mode".format(
+                    options.baseline, error), file = sys.stderr)
+                return 2
+        results = HotPathsBenchmark.run()
+        for name, seconds in results.items():
+            line = "{:<60} {:>12.2f} us".format(name, seconds * 1e6)
+            if name in baseline:
+                line += "  ({:+.1%} vs baseline)".format(seconds / baseline[name] - 1)
+            print(line)
+        if options.mode == "record":
+            with open(options.baseline, "w") as baselineFile:
+                json.dump(results, baselineFile, indent = 4)
+            return 0
+        regressions = HotPathsBenchmark.compare(baseline, results, options.threshold)
+        for name, slowdown in regressions.items():
+            print("REGRESSION: {} is {:.1%} slower than the baseline".format(name, slowdown))
+        return 1 if len(regressions) > 0 else 0
+
+class TestHotPathsBenchmark(unittest.TestCase):
+    def testCasesRun(self):
+        for name, buildCase in HotPathsBenchmark.getCases().items():
+            buildCase()()
+
+    def testCompare(self):
+        baseline = {"fast": 1.0, "slow": 1.0}
+        results = {"fast": 1.1, "slow": 1.5, "new": 9.0}
+        self.assertEqual(HotPathsBenchmark.compare(baseline, results, 0.2), {"slow": 0.5})
+
+    def testMissingBaseline(self):
+        import contextlib
+        import io
+        missingPath = os.path.join(os.path.dirname(HotPathsBenchmark.defaultBaselinePath), "missing-baseline.json")
+        errors = io.StringIO()
+        with contextlib.redirect_stderr(errors):
+            self.assertEqual(HotPathsBenchmark.main(["compare", "--baseline", missingPath]), 2)
+        self.assertIn("record", errors.getvalue())
+
+if __name__ == "__main__":
+    sys.exit(HotPathsBenchmark.main())
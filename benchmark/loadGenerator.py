@@ -0,0 +1,144 @@
+'''
+LoadGenerator class - plays many concurrent games against a GameServer (an in-process one on a free port unless an
+address is given) and reports the throughput and the latency of the requests
+'''
+
+from interface.gameServer import GameServer
+from utilities.gameConstants import GameConstants
+from utilities.layoutSampler import LayoutSampler
+from utilities.placementTable import PlacementTable
+import argparse
+import asyncio
+import random
+import time
+import unittest
+
+class LoadGenerator:
+    def __init__(self, clientsNumber = 10, sessionsPerClient = 10, gamesPerSession = 1, seed = 0):
+        '''
+        The initialiser of the LoadGenerator object
+        :param clientsNumber: the number of connections - integer
+        :param sessionsPerClient: the number of games every connection plays at the same time - integer
+        :param gamesPerSession: the number of games played one after another by every session - integer
+        :param seed: the seed of the placements and of the shots - integer
+        '''
+        self.__clientsNumber = clientsNumber
+        self.__sessionsPerClient = sessionsPerClient
+        self.__gamesPerSession = gamesPerSession
+        self.__random = random.Random(seed)
+        self.__latencies = []
+        self.__gamesNumber = 0
+
+    async def __request(self, connection, line):
+        '''
+        This function sends a request and waits for its response (the requests of a connection are sent one at a time)
+        :param connection: reader, writer, lock - the connection to the server
+        :param line: the request - string
+        :return: the words of the response - list of strings
+        '''
+        reader, writer, lock = connection
+        async with lock:
+            startTime = time.perf_counter()
+            writer.write(line.encode("ascii") + b"\n")
+            response = (await reader.readline()).decode("ascii")
+            self.__latencies.append(time.perf_counter() - startTime)
+        words = response.split()
+        if len(words) == 0 or words[0] != "OK":
+            raise RuntimeError("Request {!r} failed: {!r}".format(line, response))
+        return words
+
+    async def __playGame(self, connection):
+        '''
+        This function plays a game: a random layout of planes, then shots at random unshot cells until it ends
+        :param connection: reader, writer, lock - the connection to the server
+        :return: the winner - string
+        '''
+        words = await self.__request(connection, "NEW")
+        sessionId = words[1]
+        rowsNumber, columnsNumber, planesNumber = int(words[2]), int(words[3]), int(words[4])
+        table = PlacementTable.forBoard(rowsNumber, columnsNumber)
+        for placementId in LayoutSampler(planesNumber, table).sample(self.__random):
+            cabin = table.getCabin(placementId)
+            await self.__request(connection, "PLACE {} {} {}".format(
+                sessionId, GameConstants.coordinatesToCellString(cabin[0], cabin[1]), table.getOrientation(placementId)))
+        cells = self.__random.sample(range(rowsNumber * columnsNumber), rowsNumber * columnsNumber)
+        winner = "none"
+        while winner == "none":
+            cell = cells.pop()
+            cellString = GameConstants.coordinatesToCellString(cell // columnsNumber, cell % columnsNumber)
+            winner = (await self.__request(connection, "SHOT {} {}".format(sessionId, cellString)))[4]
+        await self.__request(connection, "QUIT " + sessionId)
+        self.__gamesNumber += 1
+        return winner
+
+    async def __runSession(self, connection):
+        for i in range(self.__gamesPerSession):
+            await self.__playGame(connection)
+
+    async def __runClient(self, host, port, unixPath):
+        if unixPath is not None:
+            reader, writer = await asyncio.open_unix_connection(unixPath)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        connection = (reader, writer, asyncio.Lock())
+        try:
+            await asyncio.gather(*[self.__runSession(connection) for i in range(self.__sessionsPerClient)])
+        finally:
+            writer.close()
+
+    async def run(self, host = "127.0.0.1", port = None, unixPath = None):
+        '''
+        This function plays all the games
+        :param host: the TCP host of the server - string
+        :param port: the TCP port of the server (an in-process server is started if neither it nor unixPath is given)
+        :param unixPath: the path of the Unix socket of the server - string
+        :return: statistics - dictionary with the number of games and requests, the seconds and the latencies
+        '''
+        server = None
+        if port is None and unixPath is None:
+            from main import createGameController
+            server = GameServer(createGameController, maximumSessions = self.__clientsNumber * self.__sessionsPerClient)
+            host, port = (await server.start(host))[:2]
+        self.__latencies = []
+        self.__gamesNumber = 0
+        startTime = time.perf_counter()
+        try:
+            await asyncio.gather(*[self.__runClient(host, port, unixPath) for i in range(self.__clientsNumber)])
+        finally:
+            if server is not None:
+                await server.stop()
+        latencies = sorted(self.__latencies)
+        return {"games": self.__gamesNumber, "requests": len(latencies), "seconds": time.perf_counter() - startTime,
+                "medianLatency": latencies[len(latencies) // 2], "maximumLatency": latencies[-1]}
+
+    @staticmethod
+    def main(arguments = None):
+        '''
+        This function runs a load configured from the command line and prints its statistics
+        :param arguments: the command line arguments - list of strings (sys.argv if None)
+        :return: nothing
+        '''
+        parser = argparse.ArgumentParser(description = "Planes server load generator")
+        parser.add_argument("--host", default = "127.0.0.1")
+        parser.add_argument("--port", type = int, default = None)
+        parser.add_argument("--unix", default = None)
+        parser.add_argument("--clients", type = int, default = 100)
+        parser.add_argument("--sessions", type = int, default = 100)
+        parser.add_argument("--games", type = int, default = 1)
+        parser.add_argument("--seed", type = int, default = 0)
+        options = parser.parse_args(arguments)
+        loadGenerator = LoadGenerator(options.clients, options.sessions, options.games, options.seed)
+        statistics = asyncio.run(loadGenerator.run(options.host, options.port, options.unix))
+        print("{} games, {} requests in {:.2f} s: {:.0f} requests/s, median latency {:.2f} ms, maximum {:.2f} ms".format(
+            statistics["games"], statistics["requests"], statistics["seconds"],
+            statistics["requests"] / statistics["seconds"], statistics["medianLatency"] * 1e3,
+            statistics["maximumLatency"] * 1e3))
+
+class TestLoadGenerator(unittest.IsolatedAsyncioTestCase):
+    async def testLocalServer(self):
+        statistics = await LoadGenerator(3, 4, 2, 7).run()
+        self.assertEqual(statistics["games"], 24)
+        self.assertGreater(statistics["requests"], 24 * 4)
+
+if __name__ == "__main__":
+    LoadGenerator.main()
@@ -0,0 +1,91 @@
+'''
+StartupBenchmark class - measures the cold start of main.py in fresh interpreters and lists the modules every mode
+imports
+'''
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import unittest
+
+class StartupBenchmark:
+    packagePath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    frontEndModules = ["tkinter", "texttable"]
+    commands = {"headless": "import main; main.main(['headless', '--games', '1', '--processes', '1'])",
+                "console": "import main; main.loadInterface('console')(main.createGameController())",
+                "gui": "import main; main.loadInterface('gui')",
+                "bare": "pass"}
+
+    @staticmethod
+    def __runPython(code):
+        '''
+        This function runs python code in a fresh interpreter started in the package directory
+        :param code: the code - string
+        :return: the standard output - string
+        '''
+        completedProcess = subprocess.run([sys.executable, "-c", code], cwd = StartupBenchmark.packagePath,
+                                          stdout = subprocess.PIPE, stderr = subprocess.DEVNULL, check = True,
+                                          universal_newlines = True)
+        return completedProcess.stdout
+
+    @staticmethod
+    def measure(mode, repeat = 10):
+        '''
+        This function times the start of a mode in fresh interpreters
+        :param mode: the started mode - a key of commands
+        :param repeat: the number of started interpreters (the best time is kept) - integer
+        :return: the best wall time in seconds - float
+        '''
+        bestTime = None
+        for i in range(repeat):
+            startTime = time.perf_counter()
+            StartupBenchmark.__runPython(StartupBenchmark.commands[mode])
+            elapsedTime = time.perf_counter() - startTime
+            bestTime = elapsedTime if bestTime is None else min(bestTime, elapsedTime)
+        return bestTime
+
+    @staticmethod
+    def getImportedModules(mode):
+        '''
+        This function returns the modules which are loaded once a mode has started
+        :param mode: the started mode - a key of commands
+        :return: the names of the modules - set of strings
+        '''
+        code = StartupBenchmark.commands[mode] + "\nimport sys, json\nprint(json.dumps(sorted(sys.modules)))"
+        return set(json.loads(StartupBenchmark.__runPython(code).splitlines()[-1]))
+
+    @staticmethod
+    def main(arguments = None):
+        '''
+        This function prints the start time and the loaded front end modules of every mode from the command line
+        :param arguments: the command line arguments - list of strings (sys.argv if None)
+        :return: nothing
+        '''
+        parser = argparse.ArgumentParser(description = "Planes cold start benchmark")
+        parser.add_argument("--repeat", type = int, default = 10)
+        options = parser.parse_args(arguments)
+        for mode in StartupBenchmark.commands:
+            seconds = StartupBenchmark.measure(mode, options.repeat)
+            modules = StartupBenchmark.getImportedModules(mode)
+            frontEnd = [module for module in StartupBenchmark.frontEndModules if module in modules]
+            print("{:<10} {:>8.1f} ms  {:>4} modules  front end: {}".format(mode, seconds * 1e3, len(modules),
+                                                                         ", ".join(frontEnd) or "none"))
+
+class TestStartupBenchmark(unittest.TestCase):
+    def testHeadlessImportsNoFrontEnd(self):
+        modules = StartupBenchmark.getImportedModules("headless")
+        self.assertIn("simulation.selfPlay", modules)
+        for module in StartupBenchmark.frontEndModules + ["interface.gameConsoleInterface"]:
+            self.assertNotIn(module, modules)
+
+    def testConsoleImportsNoTkinter(self):
+        modules = StartupBenchmark.getImportedModules("console")
+        self.assertIn("interface.gameConsoleInterface", modules)
+        self.assertNotIn("tkinter", modules)
+        self.assertNotIn("interface.gameGraphicalInterface", modules)
+
+if __name__ == "__main__":
+    StartupBenchmark.main()
@@ -5,19 +5,50 @@ ComputerController class - the support of the computer moves
 from validation.planeValidator import PlaneValidator
 from model.plane import Plane
 from utilities.queue import Queue
+from utilities.unknownCells import UnknownCells
+from utilities.densityTargeter import DensityTargeter
+from utilities.layoutCandidates import LayoutCandidates
 from utilities.gameConstants import GameConstants
+from utilities.layoutSampler import LayoutSampler
+from utilities.placementTable import PlacementTable
+from utilities.planesIndex import PlanesIndex
+from utilities.compactRandom import CompactRandom
+import copy
 import random
 import unittest
 
 class ComputerController:
-    def __init__(self, computerRepository):
+    def __init__(self, computerRepository, randomGenerator = None, planesNumber = GameConstants.planesNumber,
+                 targetingMode = "hunt"):
         '''
         This function is the initialiser of the ComputerController object
         :param computerRepository: the storage support of the computer moves - ComputerRepository
+        :param randomGenerator: the source of randomness of the computer - random.Random (a fresh CompactRandom if None)
+        :param planesNumber: the number of planes the computer places - integer
+        :param targetingMode: how the computer picks its hits - "hunt" (random cells, then the neighbors of the hits),
+                              "density" (the cell covered by the most possible plane placements) or "exact" (the
+                              likeliest cabin among the two-plane layouts which agree with every shot)
         '''
+        if targetingMode not in ["hunt", "density", "exact"]:
+            raise ValueError("Invalid targeting mode")
+        if targetingMode == "exact" and planesNumber != 2:
+            raise ValueError("The exact targeting needs two planes")
         self.__computerRepository = computerRepository
-        self.__planesList = []
-        self.__queue = Queue()
+        self.__rowsNumber = computerRepository.getRowsNumber()
+        self.__columnsNumber = computerRepository.getColumnsNumber()
+        self.__placementTable = PlacementTable.forBoard(self.__rowsNumber, self.__columnsNumber)
+        self.__random = randomGenerator if randomGenerator is not None else CompactRandom()
+        self.__planesNumber = planesNumber
+        self.__targetingMode = targetingMode
+        self.__layoutSampler = LayoutSampler(planesNumber, self.__placementTable)
+        self.__planesIndex = PlanesIndex()
+        self.__unknownCells = UnknownCells(self.__rowsNumber, self.__columnsNumber)
+        self.__queue = Queue(self.__isCellKnown)
+        self.__targeter = None
+        if targetingMode == "density":
+            self.__targeter = DensityTargeter(self.__placementTable)
+        elif targetingMode == "exact":
+            self.__targeter = LayoutCandidates(self.__placementTable)
 
     def initializeNewGame(self):
         '''
@@ -25,9 +56,46 @@ class ComputerController:
         :return: nothing
         '''
         self.__computerRepository.initializeNewGame()
-        self.__planesList.clear()
+        self.__planesIndex.clear()
         self.__queue.clear()
-        
+        self.__unknownCells.reset()
+        if self.__targeter is not None:
+            self.__targeter.reset()
+
+    def copy(self):
+        '''
+        This function returns an independent copy of the controller, which makes the same choices as the original
+        (the placement table and the layout sampler are shared)
+        :return: computerController - ComputerController
+        '''
+        controllerCopy = copy.copy(self)
+        controllerCopy.__computerRepository = self.__computerRepository.copy()
+        controllerCopy.__random = copy.copy(self.__random)
+        controllerCopy.__planesIndex = self.__planesIndex.copy()
+        controllerCopy.__unknownCells = self.__unknownCells.copy()
+        controllerCopy.__queue = self.__queue.copy(controllerCopy.__isCellKnown)
+        if self.__targeter is not None:
+            controllerCopy.__targeter = self.__targeter.copy()
+        return controllerCopy
+
+    def getRowsNumber(self):
+        return self.__rowsNumber
+
+    def getColumnsNumber(self):
+        return self.__columnsNumber
+
+    def getPlanesNumber(self):
+        return self.__planesNumber
+
+    def getTargetingMode(self):
+        return self.__targetingMode
+
+    def getRandomGenerator(self):
+        return self.__random
+
+    def getPlanesList(self):
+        return self.__planesIndex.getPlanesList()
+
     def getShotsGrid(self):
         return self.__computerRepository.getShotsGrid()
 
@@ -41,38 +109,30 @@ class ComputerController:
         :param cabinOrientation: the way the cabin points to (up/down/left/right)
         :return: nothing
         '''
-        plane = Plane(cabinLocation, cabinOrientation)
-        if PlaneValidator.checkPlane(plane) is False:
+        plane = Plane(cabinLocation, cabinOrientation, self.__placementTable)
+        if PlaneValidator.checkPlane(plane, self.__rowsNumber, self.__columnsNumber) is False:
             raise ValueError("Invalid plane data entered")
         if PlaneValidator.checkPlaneCells(plane) is False:
             raise ValueError("Plane cannot be placed in the grid (some parts are out of the grid)")
         self.__computerRepository.addPlane(plane)
-        self.__planesList.append(plane)
+        self.__planesIndex.addPlane(plane)
         
     def placePlanesRandomly(self):
         '''
-        This function generates planes randomly in order to be placed on the grid
+        This function places the planes on a random legal layout (drawn without any retry)
         :return: nothing
         '''
-        numberOfPlacesPlanes = 0
-        columns = "ABCDEFGH"
-        rows = "12345689"
-        directions = ["up", "down", "left", "right"]
-        while numberOfPlacesPlanes < 2:
-            cabinLocation = random.choice(columns) + random.choice(rows)
-            cabinOrientation = random.choice(directions)
-            try:
-                self.placePlane(cabinLocation, cabinOrientation)
-                numberOfPlacesPlanes += 1
-            except:
-                pass
+        for placementId in self.__layoutSampler.sample(self.__random):
+            cabin = self.__placementTable.getCabin(placementId)
+            self.placePlane(GameConstants.coordinatesToCellString(cabin[0], cabin[1]),
+                            self.__placementTable.getOrientation(placementId))
 
     def getRemainingPlanesNumber(self):
         '''
         This function returns the number of remaining active planes
         :return: planesNumber - the number of the remaining planes - integer
         '''
-        return len(self.__planesList)
+        return self.__planesIndex.getRemainingPlanesNumber()
 
     def checkCell(self, cellCoordinates):
         '''
@@ -87,16 +147,8 @@ class ComputerController:
         value = self.__computerRepository.checkPlaneCell(row, column)
         answer = {-1: "miss", 1: "hit", 0: "cabin"}
         if value != -1:
-            if value == 1:
-                index = 0
-                while index in range(len(self.__planesList)):
-                    plane = self.__planesList[index]
-                    computerPlaneCoordinates = GameConstants.cellStringToCoordinates(plane.getCabinLocation())
-                    if cellCoordinates == computerPlaneCoordinates:
-                        value = 0
-                        del self.__planesList[index]
-                        break
-                    index += 1
+            if value == 1 and self.__planesIndex.registerHit(cellCoordinates) is True:
+                value = 0
             self.__computerRepository.hitCell(row, column)
         return answer[value]
     
@@ -108,6 +160,7 @@ class ComputerController:
         :return: nothing
         '''
         self.__computerRepository.markMissedShot(row, column)
+        self.__unknownCells.remove((row, column))
 
     def markSuccessfulShot(self, row, column):
         '''
@@ -117,27 +170,30 @@ class ComputerController:
         :return: nothing
         '''
         self.__computerRepository.markSuccessfulShot(row, column)
+        self.__unknownCells.remove((row, column))
+
+    def __isCellKnown(self, cell):
+        return self.__unknownCells.contains(cell) is False
 
     def __generateRandomUnknownCell(self):
         '''
-        This function randomly generated an unshot cell
+        This function randomly generates an unshot cell
         :return: tuple of the generated cell
         '''
-        while True:
-            row = random.randint(0, 7)
-            column = random.randint(0, 7)
-            if self.__computerRepository.isCellUnknown(row, column) == True:
-                return (row, column)
+        return self.__unknownCells.choice(self.__random)
 
     def getNextHit(self):
         '''
         This function returns the next hit of the computer
         :return: a tuple representing the cell to be hit
         '''
-        if self.__queue.size() == 0:
+        if self.__targeter is not None:
+            cell = self.__targeter.getNextHit(self.__random)
+            return cell if cell is not None else self.__generateRandomUnknownCell()
+        cell = self.__queue.pop()
+        if cell is None:
             return self.__generateRandomUnknownCell()
-        else:
-            return self.__queue.pop()
+        return cell
 
     def __isCellInside(self, row, column):
         '''
@@ -147,7 +203,7 @@ class ComputerController:
         :return: True if the cell is inside the grid
                  False otherwise
         '''
-        return row in range(8) and column in range(8)
+        return 0 <= row < self.__rowsNumber and 0 <= column < self.__columnsNumber
 
     def enqueueNeighbors(self, row, column):
         '''
@@ -161,6 +217,43 @@ class ComputerController:
             if self.__isCellInside(row + direction[0], column + direction[1]) == True and self.__computerRepository.isCellUnknown(row + direction[0], column + direction[1]) == True:
                 self.__queue.push((row + direction[0], column + direction[1]))
 
+    def registerHitResult(self, cellPosition, hitResult):
+        '''
+        This function updates the knowledge of the computer after one of its shots
+        :param cellPosition: the shot cell - (row, column) tuple
+        :param hitResult: the result of the shot - "hit", "cabin" or "miss"
+        :return: nothing
+        '''
+        row = cellPosition[0]
+        column = cellPosition[1]
+        if self.__targeter is not None:
+            self.__targeter.registerShot(cellPosition, hitResult)
+        if hitResult == "miss":
+            self.markMissedShot(row, column)
+        else:
+            self.markSuccessfulShot(row, column)
+            if hitResult == "hit":
+                self.enqueueNeighbors(row, column)
+            else:
+                self.clearQueue()
+
+    def getQueueItems(self):
+        '''
+        This function returns the cells waiting in the computer moves queue
+        :return: cells - list of (row, column) tuples, from the first to the last one
+        '''
+        return self.__queue.getItems()
+
+    def setQueueItems(self, cells):
+        '''
+        This function replaces the content of the computer moves queue
+        :param cells: the new queued cells - list of (row, column) tuples, from the first to the last one
+        :return: nothing
+        '''
+        self.__queue.clear()
+        for cell in cells:
+            self.__queue.push(cell)
+
     def clearQueue(self):
         '''
         This function clears the queue of the moves
@@ -190,4 +283,61 @@ class TestComputerController(unittest.TestCase):
         self.assertEqual(self.computerController.getShotsGrid(), matrix)
         self.computerController.markSuccessfulShot(2, 2)
         matrix[2][2] = 1
-        self.assertEqual(self.computerController.getShotsGrid(), matrix)
\ No newline at end of file
+        self.assertEqual(self.computerController.getShotsGrid(), matrix)
+
+    def testPlacePlanesRandomly(self):
+        from repository.repository import Repository
+        firstController = ComputerController(Repository(), random.Random(11))
+        secondController = ComputerController(Repository(), random.Random(11))
+        firstController.placePlanesRandomly()
+        secondController.placePlanesRandomly()
+        self.assertEqual(firstController.getRemainingPlanesNumber(), 2)
+        self.assertEqual(firstController.getPlanesGrid(), secondController.getPlanesGrid())
+        planeCellsNumber = sum(line.count(1) for line in firstController.getPlanesGrid())
+        self.assertEqual(planeCellsNumber, 20)
+
+    def testGetNextHitUnknownCells(self):
+        for row in range(8):
+            for column in range(8):
+                if (row, column) != (5, 6):
+                    self.computerController.markMissedShot(row, column)
+        self.assertEqual(self.computerController.getNextHit(), (5, 6))
+
+    def testEnqueueNeighbors(self):
+        self.computerController.markSuccessfulShot(3, 3)
+        self.computerController.markSuccessfulShot(3, 5)
+        self.computerController.enqueueNeighbors(3, 3)
+        self.computerController.enqueueNeighbors(3, 5)
+        self.computerController.markMissedShot(2, 3)
+        hits = [self.computerController.getNextHit() for i in range(6)]
+        self.assertEqual(hits, [(4, 3), (3, 2), (3, 4), (2, 5), (4, 5), (3, 6)])
+
+    def testDensityTargeting(self):
+        from repository.repository import Repository
+        self.assertRaises(ValueError, ComputerController, Repository(), None, 2, "psychic")
+        self.assertEqual(ComputerController(Repository(), None, 2, "density").getTargetingMode(), "density")
+        computerController = ComputerController(Repository(), random.Random(0), targetingMode = "density")
+        computerController.registerHitResult((3, 3), "miss")
+        nextHit = computerController.getNextHit()
+        self.assertNotEqual(nextHit, (3, 3))
+        self.assertFalse(computerController.getShotsGrid()[3][3] == -1)
+
+    def testExactTargeting(self):
+        from repository.repository import Repository
+        self.assertRaises(ValueError, ComputerController, Repository(), None, 3, "exact")
+        self.assertRaises(ValueError, ComputerController, Repository(40, 40), None, 2, "exact")
+        computerController = ComputerController(Repository(), random.Random(0), targetingMode = "exact")
+        computerController.registerHitResult((3, 3), "hit")
+        nextHit = computerController.getNextHit()
+        self.assertLessEqual(abs(nextHit[0] - 3) + abs(nextHit[1] - 3), 3)
+        computerController.initializeNewGame()
+        self.assertEqual(computerController.copy().getNextHit(), computerController.getNextHit())
+
+    def testLargeBoard(self):
+        from repository.repository import Repository
+        computerController = ComputerController(Repository(300, 40), random.Random(2), 6)
+        computerController.placePlanesRandomly()
+        self.assertEqual(computerController.getRemainingPlanesNumber(), 6)
+        self.assertEqual(sum(line.count(1) for line in computerController.getPlanesGrid()), 60)
+        computerController.registerHitResult((299, 39), "hit")
+        self.assertIn(computerController.getNextHit(), [(298, 39), (299, 38)])
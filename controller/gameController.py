@@ -3,17 +3,25 @@ GameController class - the "brain" of the game
 '''
 
 from utilities.gameConstants import GameConstants
+from utilities.gameSnapshot import GameSnapshot
+from utilities.placementTable import PlacementTable
+import copy
 import unittest
 
 class GameController:
-    def __init__(self, playerController, computerController):
+    def __init__(self, playerController, computerController, moveLog = None):
         '''
         This function is the initialiser of the game controller
         :param playerController: the support of the player moves - PlayerController
         :param computerController: the support of the computer moves - ComputerController
+        :param moveLog: the history every placement and shot is appended to - MoveLog (None if nothing is recorded)
         '''
         self.__playerController = playerController
         self.__computerController = computerController
+        self.__moveLog = moveLog
+        self.__lastComputerHitCell = None
+        self.__playerShots = []
+        self.__computerShots = []
 
     def initializeNewGame(self):
         '''
@@ -22,7 +30,51 @@ class GameController:
         '''
         self.__playerController.initializeNewGame()
         self.__computerController.initializeNewGame()
+        self.__lastComputerHitCell = None
+        self.__playerShots.clear()
+        self.__computerShots.clear()
         self.__computerController.placePlanesRandomly()
+        if self.__moveLog is not None:
+            self.__moveLog.clear()
+            for plane in self.__computerController.getPlanesList():
+                self.__moveLog.appendPlacement("computer", plane.getPlacementId())
+
+    def getMoveLog(self):
+        return self.__moveLog
+
+    def copy(self):
+        '''
+        This function returns an independent copy of the game, which records no move log
+        :return: gameController - GameController
+        '''
+        gameCopy = copy.copy(self)
+        gameCopy.__playerController = self.__playerController.copy()
+        gameCopy.__computerController = self.__computerController.copy()
+        gameCopy.__moveLog = None
+        gameCopy.__playerShots = self.__playerShots[:]
+        gameCopy.__computerShots = self.__computerShots[:]
+        return gameCopy
+
+    def getRowsNumber(self):
+        '''
+        This function returns the number of rows of the grids
+        :return: rowsNumber - integer
+        '''
+        return self.__playerController.getRowsNumber()
+
+    def getColumnsNumber(self):
+        '''
+        This function returns the number of columns of the grids
+        :return: columnsNumber - integer
+        '''
+        return self.__playerController.getColumnsNumber()
+
+    def getPlanesNumber(self):
+        '''
+        This function returns the number of planes every side places
+        :return: planesNumber - integer
+        '''
+        return self.__computerController.getPlanesNumber()
 
     def getPlayerShotsGrid(self):
         '''
@@ -53,6 +105,8 @@ class GameController:
         :return: nothing
         '''
         self.__playerController.placePlane(cabinLocation, cabinOrientation)
+        if self.__moveLog is not None:
+            self.__moveLog.appendPlacement("player", self.__playerController.getPlanesList()[-1].getPlacementId())
 
     def getGameWinner(self):
         '''
@@ -81,36 +135,137 @@ class GameController:
         row = cellPosition[0]
         column = cellPosition[1]
         hitResult = self.__computerController.checkCell(cellPosition)
+        self.__playerShots.append(cellPosition)
+        if self.__moveLog is not None:
+            self.__moveLog.appendShot("player", cellPosition, hitResult)
         if hitResult == "miss":
             self.__playerController.markMissedShot(row, column)
         else:
             self.__playerController.markSuccessfulShot(row, column)
         return hitResult
     
-    def makeComputerHit(self):
+    def getLastComputerHitCell(self):
+        '''
+        This function returns the cell of the last computer hit, whatever its result was
+        :return: a tuple representing the cell
+                 None if the computer hasn't hit yet
+        '''
+        return self.__lastComputerHitCell
+
+    def makeComputerHit(self, cellPosition = None):
         '''
         This function hits a cell provided by a computer
+        :param cellPosition: the cell the computer has to hit - (row, column) tuple
+                             (None lets the computer choose it)
         :return: "hit" if the computer hit a regular cell
                  "cabin" if the computer hit a cabin (destroyed a plane)
                  "miss" if the computer missed
         '''
-        cellPosition = self.__computerController.getNextHit()
-        row = cellPosition[0]
-        column = cellPosition[1]
+        if cellPosition is None:
+            cellPosition = self.__computerController.getNextHit()
+        self.__lastComputerHitCell = cellPosition
+        self.__computerShots.append(cellPosition)
         hitResult = self.__playerController.checkCell(cellPosition)
-        if hitResult == "miss":
-            self.__computerController.markMissedShot(row, column)
-        else:
-            self.__computerController.markSuccessfulShot(row, column)
-            if hitResult == "hit":
-                self.__computerController.enqueueNeighbors(row, column)
-            else:
-                self.__computerController.clearQueue()
+        self.__computerController.registerHitResult(cellPosition, hitResult)
+        if self.__moveLog is not None:
+            self.__moveLog.appendShot("computer", cellPosition, hitResult)
         if hitResult == "miss":
             return hitResult, None
         else:
             return hitResult, cellPosition
 
+    def save(self):
+        '''
+        This function saves the game in the compact binary format of GameSnapshot (the planes as placement ids, the
+        shots as cell indexes, the computer moves queue and the state of its random generator)
+        :return: data - bytes
+        '''
+        columnsNumber = self.getColumnsNumber()
+        toIndex = lambda cell: cell[0] * columnsNumber + cell[1]
+        state = {"rowsNumber": self.getRowsNumber(), "columnsNumber": columnsNumber,
+                 "planesNumber": self.getPlanesNumber(),
+                 "targetingMode": self.__computerController.getTargetingMode(),
+                 "playerPlacements": [plane.getPlacementId() for plane in self.__playerController.getPlanesList()],
+                 "computerPlacements": [plane.getPlacementId() for plane in self.__computerController.getPlanesList()],
+                 "playerShots": [toIndex(cell) for cell in self.__playerShots],
+                 "computerShots": [toIndex(cell) for cell in self.__computerShots],
+                 "queue": [toIndex(cell) for cell in self.__computerController.getQueueItems()],
+                 "randomState": self.__computerController.getRandomGenerator().getstate()}
+        return GameSnapshot.encode(state)
+
+    def __checkSnapshot(self, state):
+        '''
+        This function checks that a decoded snapshot can be restored into this game, before anything is changed
+        :param state: the decoded snapshot - dictionary (see GameSnapshot.encode)
+        :return: nothing (a ValueError is raised if the snapshot does not fit the game)
+        '''
+        rowsNumber = self.getRowsNumber()
+        columnsNumber = self.getColumnsNumber()
+        if (state["rowsNumber"], state["columnsNumber"]) != (rowsNumber, columnsNumber):
+            raise ValueError("The saved game has another grid size")
+        if state["planesNumber"] != self.getPlanesNumber():
+            raise ValueError("The saved game has another number of planes")
+        if state["targetingMode"] != self.__computerController.getTargetingMode():
+            raise ValueError("The saved game has another targeting mode")
+        cellsNumber = rowsNumber * columnsNumber
+        for key in ["playerShots", "computerShots", "queue"]:
+            if any(index >= cellsNumber for index in state[key]):
+                raise ValueError("The saved game has cells outside the grid")
+        table = PlacementTable.forBoard(rowsNumber, columnsNumber)
+        for side in ["player", "computer"]:
+            placementIds = state[side + "Placements"]
+            if len(placementIds) > self.getPlanesNumber():
+                raise ValueError("The saved game has too many planes")
+            usedMask = 0
+            for placementId in placementIds:
+                if not 0 <= placementId < table.getPlacementsNumber():
+                    raise ValueError("The saved game has an invalid plane")
+                if table.getMask(placementId) & usedMask != 0:
+                    raise ValueError("The saved game has overlapping planes")
+                usedMask |= table.getMask(placementId)
+        randomGenerator = self.__computerController.getRandomGenerator()
+        if isinstance(state["randomState"], int) != isinstance(randomGenerator.getstate(), int):
+            raise ValueError("The saved game has the state of another kind of random generator")
+        try:
+            copy.copy(randomGenerator).setstate(state["randomState"])
+        except (OverflowError, TypeError, ValueError):
+            raise ValueError("The saved game has an invalid random generator state")
+
+    def restore(self, data):
+        '''
+        This function restores a game saved by save (the planes are placed again and the shots are replayed in order,
+        so a move log is restarted with the player shots before the computer shots)
+        :param data: the saved game - bytes
+        :return: nothing (a ValueError is raised, the game being left unchanged, if the data is not a snapshot which
+                 fits the game)
+        '''
+        state = GameSnapshot.decode(data)
+        self.__checkSnapshot(state)
+        columnsNumber = self.getColumnsNumber()
+        table = PlacementTable.forBoard(self.getRowsNumber(), columnsNumber)
+        toCell = lambda index: (index // columnsNumber, index % columnsNumber)
+        self.__playerController.initializeNewGame()
+        self.__computerController.initializeNewGame()
+        self.__lastComputerHitCell = None
+        self.__playerShots.clear()
+        self.__computerShots.clear()
+        if self.__moveLog is not None:
+            self.__moveLog.clear()
+        for controller, side in [(self.__playerController, "player"), (self.__computerController, "computer")]:
+            for placementId in state[side + "Placements"]:
+                cabin = table.getCabin(placementId)
+                controller.placePlane(GameConstants.coordinatesToCellString(cabin[0], cabin[1]),
+                                      table.getOrientation(placementId))
+                if self.__moveLog is not None:
+                    self.__moveLog.appendPlacement(side, placementId)
+        for index in state["playerShots"]:
+            cell = toCell(index)
+            self.makePlayerHit(GameConstants.coordinatesToCellString(cell[0], cell[1]))
+        for index in state["computerShots"]:
+            self.makeComputerHit(toCell(index))
+        self.__computerController.setQueueItems([toCell(index) for index in state["queue"]])
+        self.__computerController.getRandomGenerator().setstate(state["randomState"])
+
 class TestGameController(unittest.TestCase):
     def setUp(self):
         from repository.repository import Repository
@@ -141,4 +296,73 @@ class TestGameController(unittest.TestCase):
                   [-1, 1, -1, 1, -1, -1, -1, -1],
                   [-1, 1, -1, -1, -1, -1, -1, -1],
                   [-1, -1, -1, -1, -1, -1, -1, -1]]
-        self.assertEqual(self.gameController.getPlayerPlanesGrid(), matrix)
\ No newline at end of file
+        self.assertEqual(self.gameController.getPlayerPlanesGrid(), matrix)
+
+    def testSaveRestore(self):
+        from repository.repository import Repository
+        from controller.playerController import PlayerController
+        from controller.computerController import ComputerController
+        from utilities.compactRandom import CompactRandom
+        createGame = lambda seed: GameController(PlayerController(Repository()),
+                                                 ComputerController(Repository(), CompactRandom(seed)))
+        game = createGame(5)
+        game.initializeNewGame()
+        game.placePlayerPlane("C1", "up")
+        game.placePlayerPlane("F8", "down")
+        for cellString in ["A1", "B2", "C3", "D4", "E5"]:
+            game.makePlayerHit(cellString)
+            game.makeComputerHit()
+        data = game.save()
+        self.assertLess(len(data), 100)
+        restoredGame = createGame(6)
+        restoredGame.restore(data)
+        self.assertEqual(restoredGame.save(), data)
+        self.assertEqual(restoredGame.getPlayerPlanesGrid(), game.getPlayerPlanesGrid())
+        self.assertEqual(restoredGame.getPlayerShotsGrid(), game.getPlayerShotsGrid())
+        self.assertEqual(restoredGame.getComputerPlanesGrid(), game.getComputerPlanesGrid())
+        while game.getGameWinner() == "none":
+            self.assertEqual(restoredGame.makeComputerHit(), game.makeComputerHit())
+        self.assertEqual(restoredGame.getGameWinner(), "computer")
+
+    def testRestoreInvalidData(self):
+        from repository.repository import Repository
+        from controller.playerController import PlayerController
+        from controller.computerController import ComputerController
+        self.gameController.initializeNewGame()
+        data = self.gameController.save()
+        otherGame = GameController(PlayerController(Repository(10, 10)), ComputerController(Repository(10, 10)))
+        self.assertRaises(ValueError, otherGame.restore, data)
+        self.assertRaises(ValueError, self.gameController.restore, data[:-1])
+
+    def testRestoreAnotherRandomGenerator(self):
+        from repository.repository import Repository
+        from controller.playerController import PlayerController
+        from controller.computerController import ComputerController
+        from utilities.compactRandom import CompactRandom
+        import random
+        games = [GameController(PlayerController(Repository()), ComputerController(Repository(), CompactRandom(1))),
+                 GameController(PlayerController(Repository()), ComputerController(Repository(), random.Random(1)))]
+        for game in games:
+            game.initializeNewGame()
+            game.placePlayerPlane("C1", "up")
+            game.placePlayerPlane("F8", "down")
+            game.makePlayerHit("A1")
+            game.makeComputerHit()
+        for game, otherGame in [games, games[::-1]]:
+            data = game.save()
+            otherData = otherGame.save()
+            self.assertRaises(ValueError, otherGame.restore, data)
+            self.assertEqual(otherGame.save(), otherData)
+
+    def testCopy(self):
+        self.gameController.initializeNewGame()
+        self.gameController.placePlayerPlane("C1", "up")
+        self.gameController.placePlayerPlane("F8", "down")
+        for i in range(10):
+            self.gameController.makeComputerHit()
+        gameCopy = self.gameController.copy()
+        shotsGrid = self.gameController.getPlayerShotsGrid().toList()
+        self.assertEqual(gameCopy.getPlayerShotsGrid(), shotsGrid)
+        moves = [gameCopy.makeComputerHit() for i in range(10)]
+        self.assertEqual(self.gameController.getPlayerShotsGrid(), shotsGrid)
+        self.assertEqual([self.gameController.makeComputerHit() for i in range(10)], moves)
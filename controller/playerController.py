@@ -4,7 +4,9 @@ PlayerController class - the support of the player moves
 
 from validation.planeValidator import PlaneValidator
 from model.plane import Plane
-from utilities.gameConstants import GameConstants
+from utilities.placementTable import PlacementTable
+from utilities.planesIndex import PlanesIndex
+import copy
 import unittest
 
 class PlayerController:
@@ -14,7 +16,8 @@ class PlayerController:
         :param playerRepository: the storage support of the player moves - PlayerRepository
         '''
         self.__playerRepository = playerRepository
-        self.__planesList = []
+        self.__placementTable = PlacementTable.forBoard(playerRepository.getRowsNumber(), playerRepository.getColumnsNumber())
+        self.__planesIndex = PlanesIndex()
 
     def initializeNewGame(self):
         '''
@@ -22,7 +25,26 @@ class PlayerController:
         :return: nothing
         '''
         self.__playerRepository.initializeNewGame()
-        self.__planesList.clear()
+        self.__planesIndex.clear()
+
+    def copy(self):
+        '''
+        This function returns an independent copy of the controller
+        :return: playerController - PlayerController
+        '''
+        controllerCopy = copy.copy(self)
+        controllerCopy.__playerRepository = self.__playerRepository.copy()
+        controllerCopy.__planesIndex = self.__planesIndex.copy()
+        return controllerCopy
+
+    def getRowsNumber(self):
+        return self.__playerRepository.getRowsNumber()
+
+    def getColumnsNumber(self):
+        return self.__playerRepository.getColumnsNumber()
+
+    def getPlanesList(self):
+        return self.__planesIndex.getPlanesList()
 
     def getShotsGrid(self):
         return self.__playerRepository.getShotsGrid()
@@ -37,20 +59,20 @@ class PlayerController:
         :param cabinOrientation: the way the cabin points to (up/down/left/right)
         :return: nothing
         '''
-        plane = Plane(cabinLocation, cabinOrientation)
-        if PlaneValidator.checkPlane(plane) is False:
+        plane = Plane(cabinLocation, cabinOrientation, self.__placementTable)
+        if PlaneValidator.checkPlane(plane, self.getRowsNumber(), self.getColumnsNumber()) is False:
             raise ValueError("Invalid plane data entered")
         if PlaneValidator.checkPlaneCells(plane) is False:
             raise ValueError("Plane cannot be placed in the grid (some parts are out of the grid)")
         self.__playerRepository.addPlane(plane)
-        self.__planesList.append(plane)
+        self.__planesIndex.addPlane(plane)
 
     def getRemainingPlanesNumber(self):
         '''
         This function returns the number of remaining active planes
         :return: planesNumber - the number of the remaining planes - integer
         '''
-        return len(self.__planesList)
+        return self.__planesIndex.getRemainingPlanesNumber()
 
     def markMissedShot(self, row, column):
         '''
@@ -83,16 +105,8 @@ class PlayerController:
         value = self.__playerRepository.checkPlaneCell(row, column)
         answer = {-1: "miss", 1: "hit", 0: "cabin"}
         if value != -1:
-            if value == 1:
-                index = 0
-                while index in range(len(self.__planesList)):
-                    plane = self.__planesList[index]
-                    playerPlaneCoordinates = GameConstants.cellStringToCoordinates(plane.getCabinLocation())
-                    if cellCoordinates == playerPlaneCoordinates:
-                        value = 0
-                        del self.__planesList[index]
-                        break
-                    index += 1
+            if value == 1 and self.__planesIndex.registerHit(cellCoordinates) is True:
+                value = 0
             self.__playerRepository.hitCell(row, column)
         return answer[value]
 
@@ -118,4 +132,15 @@ class TestPlayerController(unittest.TestCase):
         self.assertEqual(self.playerController.getShotsGrid(), matrix)
         self.playerController.markSuccessfulShot(2, 2)
         matrix[2][2] = 1
-        self.assertEqual(self.playerController.getShotsGrid(), matrix)
\ No newline at end of file
+        self.assertEqual(self.playerController.getShotsGrid(), matrix)
+
+    def testCheckCell(self):
+        self.playerController.placePlane("A5", "left")
+        self.playerController.placePlane("F8", "down")
+        self.assertEqual(self.playerController.getRemainingPlanesNumber(), 2)
+        self.assertEqual(self.playerController.checkCell((0, 7)), "miss")
+        self.assertEqual(self.playerController.checkCell((3, 1)), "hit")
+        self.assertEqual(self.playerController.checkCell((4, 0)), "cabin")
+        self.assertEqual(self.playerController.getRemainingPlanesNumber(), 1)
+        self.assertEqual(self.playerController.checkCell((7, 5)), "cabin")
+        self.assertEqual(self.playerController.getRemainingPlanesNumber(), 0)
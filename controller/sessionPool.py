@@ -0,0 +1,83 @@
+'''
+SessionPool class - keeps finished games (their controllers and repositories) for the next ones, which reset them in
+place with initializeNewGame instead of building new ones
+'''
+
+import unittest
+
+class SessionPool:
+    def __init__(self, createSession, initialSessionsNumber = 0, maximumIdleSessionsNumber = None):
+        '''
+        The initialiser of the SessionPool object
+        :param createSession: function which builds a new session (e.g. a GameController with its controllers)
+        :param initialSessionsNumber: the number of sessions built right away - integer
+        :param maximumIdleSessionsNumber: the number of released sessions above which they are dropped (None if
+                                          every released session is kept)
+        '''
+        self.__createSession = createSession
+        self.__maximumIdleSessionsNumber = maximumIdleSessionsNumber
+        self.__idleSessions = []
+        self.__createdSessionsNumber = 0
+        for i in range(initialSessionsNumber):
+            self.__idleSessions.append(self.__create())
+
+    def __create(self):
+        self.__createdSessionsNumber += 1
+        return self.__createSession()
+
+    def acquire(self):
+        '''
+        This function hands out an idle session, or builds one if there is none (the caller starts its game with
+        initializeNewGame, which resets it in place)
+        :return: session
+        '''
+        if len(self.__idleSessions) > 0:
+            return self.__idleSessions.pop()
+        return self.__create()
+
+    def release(self, session):
+        '''
+        This function gives back a session which is not used anymore
+        :param session: a session returned by acquire
+        :return: nothing
+        '''
+        if self.__maximumIdleSessionsNumber is None or len(self.__idleSessions) < self.__maximumIdleSessionsNumber:
+            self.__idleSessions.append(session)
+
+    def getIdleSessionsNumber(self):
+        return len(self.__idleSessions)
+
+    def getCreatedSessionsNumber(self):
+        return self.__createdSessionsNumber
+
+class TestSessionPool(unittest.TestCase):
+    def testAcquireRelease(self):
+        pool = SessionPool(list, 2, 2)
+        self.assertEqual((pool.getIdleSessionsNumber(), pool.getCreatedSessionsNumber()), (2, 2))
+        sessions = [pool.acquire() for i in range(3)]
+        self.assertEqual((pool.getIdleSessionsNumber(), pool.getCreatedSessionsNumber()), (0, 3))
+        for session in sessions:
+            pool.release(session)
+        self.assertEqual(pool.getIdleSessionsNumber(), 2)
+        self.assertIs(pool.acquire(), sessions[1])
+        self.assertEqual(pool.getCreatedSessionsNumber(), 3)
+
+    def testGamesAreResetInPlace(self):
+        from repository.repository import Repository
+        from controller.playerController import PlayerController
+        from controller.computerController import ComputerController
+        from controller.gameController import GameController
+        pool = SessionPool(lambda: GameController(PlayerController(Repository()), ComputerController(Repository())))
+        gameController = pool.acquire()
+        gameController.initializeNewGame()
+        gameController.placePlayerPlane("C1", "up")
+        gameController.makeComputerHit()
+        planesGrid = gameController.getPlayerPlanesGrid()
+        pool.release(gameController)
+        reusedGameController = pool.acquire()
+        reusedGameController.initializeNewGame()
+        self.assertIs(reusedGameController, gameController)
+        self.assertEqual(reusedGameController.getPlayerPlanesGrid(), [[-1] * 8 for i in range(8)])
+        self.assertEqual(reusedGameController.getPlayerShotsGrid(), [[-1] * 8 for i in range(8)])
+        self.assertIsNone(reusedGameController.getLastComputerHitCell())
+        self.assertEqual(planesGrid, [[-1] * 8 for i in range(8)])
@@ -0,0 +1,280 @@
+'''
+ConsoleBoardRenderer class - draws a board as a text table whose frame is computed once, and can redraw only the
+changed cells with ANSI cursor moves
+ConsoleBoardsScreen class - keeps boards at the top of an ANSI terminal, the lines below them scrolling on their own
+'''
+
+from utilities.gameConstants import GameConstants
+import contextlib
+import io
+import sys
+import unittest
+
+class ConsoleBoardRenderer:
+    clearScreen = "\x1b[2J\x1b[H"
+
+    def __init__(self, rowsNumber, columnsNumber, title, glyphs, firstLine = 1):
+        '''
+        The initialiser of the ConsoleBoardRenderer object
+        :param rowsNumber: the number of rows of the board - integer
+        :param columnsNumber: the number of columns of the board - integer
+        :param title: the text around the table - string
+        :param glyphs: the character of every cell value - dictionary from integer to string
+        :param firstLine: the screen line (1-based) of the title, used by the ANSI diffs - integer
+        '''
+        self.__rowsNumber = rowsNumber
+        self.__glyphs = glyphs
+        self.__firstLine = firstLine
+        self.__lastGrid = None
+        rowLabelWidth = len(str(rowsNumber))
+        columnLabels = [GameConstants.columnToString(column) for column in range(columnsNumber)]
+        glyphWidth = max(len(glyph) for glyph in glyphs.values())
+        columnWidths = [max(len(label), glyphWidth) for label in columnLabels]
+        separator = "+" + "-" * (rowLabelWidth + 2) + "+" + "".join("-" * (width + 2) + "+" for width in columnWidths)
+        header = "| " + " " * rowLabelWidth + " | " + "".join(label.ljust(width) + " | "
+                                                              for label, width in zip(columnLabels, columnWidths))
+        self.__rowTemplate = ("| {:<" + str(rowLabelWidth) + "} | " + "".join("{:<" + str(width) + "} | "
+                                                                            for width in columnWidths)).rstrip()
+        self.__header = [title, separator, header.rstrip(), separator]
+        self.__separator = separator
+        self.__title = title
+        self.__columnOffsets = []
+        offset = rowLabelWidth + 5
+        for width in columnWidths:
+            self.__columnOffsets.append(offset)
+            offset += width + 3
+
+    def getWidth(self):
+        '''
+        This function returns the number of screen columns of a full drawing
+        :return: width - integer
+        '''
+        return len(self.__separator)
+
+    def getLinesNumber(self):
+        '''
+        This function returns the number of screen lines of a full drawing
+        :return: linesNumber - integer
+        '''
+        return len(self.__header) + 2 * self.__rowsNumber + 1
+
+    def render(self, grid):
+        '''
+        This function draws the whole board
+        :param grid: the values of the cells - matrix (or GridView) of integers
+        :return: the drawing - string
+        '''
+        glyphs = self.__glyphs
+        lines = self.__header[:]
+        for rowIndex, row in enumerate(grid):
+            lines.append(self.__rowTemplate.format(rowIndex + 1, *[glyphs[value] for value in row]))
+            lines.append(self.__separator)
+        lines.append(self.__title)
+        self.__lastGrid = [list(row) for row in grid]
+        return "\n".join(lines)
+
+    def renderChanges(self, grid):
+        '''
+        This function draws, with ANSI cursor moves, only the cells which changed since the last drawing (the board
+        must still be on the screen at its first line, see ConsoleBoardsScreen)
+        :param grid: the values of the cells - matrix (or GridView) of integers
+        :return: the escape sequences - string (a full drawing if the board was never drawn)
+        '''
+        if self.__lastGrid is None:
+            return self.render(grid)
+        glyphs = self.__glyphs
+        changes = []
+        for rowIndex, row in enumerate(grid):
+            lastRow = self.__lastGrid[rowIndex]
+            for columnIndex, value in enumerate(row):
+                if lastRow[columnIndex] != value:
+                    lastRow[columnIndex] = value
+                    changes.append("\x1b[{};{}H{}".format(self.__firstLine + len(self.__header) + 2 * rowIndex,
+                                                         self.__columnOffsets[columnIndex] + 1, glyphs[value]))
+        return "".join(changes)
+
+    def forget(self):
+        '''
+        This function forgets the last drawing (the next renderChanges draws the whole board)
+        :return: nothing
+        '''
+        self.__lastGrid = None
+
+class ConsoleBoardsScreen:
+    enterAlternateScreen = "\x1b[?1049h"
+    leaveAlternateScreen = "\x1b[r\x1b[?1049l"
+    minimumPromptLinesNumber = 5
+
+    def __init__(self, renderers):
+        '''
+        The initialiser of the ConsoleBoardsScreen object. The boards are drawn one under the other at the top of the
+        alternate screen buffer and the lines below them are made a scrolling region, so the prompts and the messages
+        printed there (or echoed by the terminal) can never move the boards and the diffs always land on them.
+        :param renderers: the renderers of the boards, from the top one, whose first lines follow each other from the
+                          first screen line - list of ConsoleBoardRenderer
+        '''
+        self.__renderers = renderers
+        self.__boardsLinesNumber = sum(renderer.getLinesNumber() for renderer in renderers)
+        self.__boardsWidth = max(renderer.getWidth() for renderer in renderers)
+        self.__terminalSize = None
+
+    def isShown(self):
+        return self.__terminalSize is not None
+
+    def update(self, grids, terminalSize):
+        '''
+        This function returns what to write to show the current boards: the whole screen the first time or when the
+        terminal was resized, otherwise the changed cells only (the cursor going back to the prompts afterwards)
+        :param grids: the values of the cells of every board - list of matrices (or GridViews) of integers
+        :param terminalSize: the size of the terminal - (columns, lines) tuple (e.g. shutil.get_terminal_size())
+        :return: the escape sequences and the drawings - string
+                 None if the terminal cannot hold the boards and a few prompt lines (the screen is left, see leave)
+        '''
+        columnsNumber, linesNumber = terminalSize[0], terminalSize[1]
+        if columnsNumber < self.__boardsWidth or \
+                linesNumber < self.__boardsLinesNumber + ConsoleBoardsScreen.minimumPromptLinesNumber:
+            return None
+        if self.__terminalSize == (columnsNumber, linesNumber):
+            changes = "".join(renderer.renderChanges(grid) for renderer, grid in zip(self.__renderers, grids))
+            return "\x1b7" + changes + "\x1b8" if changes != "" else ""
+        drawing = ConsoleBoardsScreen.enterAlternateScreen if self.__terminalSize is None else ""
+        self.__terminalSize = (columnsNumber, linesNumber)
+        drawing += "\x1b[r" + ConsoleBoardRenderer.clearScreen
+        drawing += "\n".join(renderer.render(grid) for renderer, grid in zip(self.__renderers, grids))
+        return drawing + "\x1b[{};{}r\x1b[{};1H".format(self.__boardsLinesNumber + 1, linesNumber,
+                                                      self.__boardsLinesNumber + 1)
+
+    def leave(self):
+        '''
+        This function returns what to write to go back to the normal screen (nothing if the boards are not shown)
+        :return: the escape sequences - string
+        '''
+        if self.__terminalSize is None:
+            return ""
+        self.__terminalSize = None
+        return ConsoleBoardsScreen.leaveAlternateScreen
+
+class TestConsoleBoardRenderer(unittest.TestCase):
+    def setUp(self):
+        self.glyphs = {-1: "?", 0: "O", 1: "X"}
+
+    def testRenderMatchesTexttable(self):
+        renderer = ConsoleBoardRenderer(2, 3, "==Shots==", self.glyphs)
+        drawing = renderer.render([[-1, 0, 1], [1, -1, -1]])
+        self.assertEqual(drawing, "\n".join(["==Shots==",
+                                             "+---+---+---+---+",
+                                             "|   | A | B | C |",
+                                             "+---+---+---+---+",
+                                             "| 1 | ? | O | X |",
+                                             "+---+---+---+---+",
+                                             "| 2 | X | ? | ? |",
+                                             "+---+---+---+---+",
+                                             "==Shots=="]))
+        self.assertEqual(renderer.getLinesNumber(), len(drawing.split("\n")))
+
+    def testWideBoard(self):
+        renderer = ConsoleBoardRenderer(10, 28, "", self.glyphs)
+        lines = renderer.render([[-1] * 28 for row in range(10)]).split("\n")
+        self.assertTrue(lines[2].startswith("|    | A | B |"))
+        self.assertTrue(lines[2].endswith("| AA | AB |"))
+        self.assertTrue(lines[-3].startswith("| 10 | ? | ? |"))
+        self.assertEqual(len(set(len(line) for line in lines[1:-1])), 1)
+
+    def testRenderChanges(self):
+        renderer = ConsoleBoardRenderer(2, 3, "==Shots==", self.glyphs, 5)
+        grid = [[-1, -1, -1], [-1, -1, -1]]
+        self.assertIn("+---+", renderer.renderChanges(grid))
+        self.assertEqual(renderer.renderChanges(grid), "")
+        grid[1][2] = 1
+        self.assertEqual(renderer.renderChanges(grid), "\x1b[11;15HX")
+        self.assertEqual(renderer.renderChanges(grid), "")
+        renderer.forget()
+        self.assertIn("+---+", renderer.renderChanges(grid))
+
+class TestConsoleBoardsScreen(unittest.TestCase):
+    @staticmethod
+    def emulateTerminal(text, columnsNumber, linesNumber):
+        '''
+        This function plays text on a minimal ANSI terminal (cursor moves, clears, scrolling region, saved cursor;
+        a newline also returns the cursor to the first column, as on a terminal in cooked mode)
+        :param text: the written text - string
+        :param columnsNumber: the width of the terminal - integer
+        :param linesNumber: the height of the terminal - integer
+        :return: the lines of the screen - list of strings
+        '''
+        screen = [[" "] * columnsNumber for line in range(linesNumber)]
+        row, column, top, bottom, saved = 0, 0, 0, linesNumber - 1, (0, 0)
+        index = 0
+        while index < len(text):
+            character = text[index]
+            if character == "\x1b":
+                if text[index + 1] in "78":
+                    if text[index + 1] == "7":
+                        saved = (row, column)
+                    else:
+                        row, column = saved
+                    index += 2
+                    continue
+                end = index + 2
+                while not text[end].isalpha():
+                    end += 1
+                parameters, command = text[index + 2:end], text[end]
+                numbers = [int(number) for number in parameters.lstrip("?").split(";") if number != ""]
+                if command == "H":
+                    row, column = (numbers[0] - 1, numbers[1] - 1) if len(numbers) == 2 else (0, 0)
+                elif command == "J":
+                    firstLine = 0 if numbers == [2] else row + 1
+                    if numbers != [2]:
+                        screen[row][column:] = [" "] * (columnsNumber - column)
+                    for line in range(firstLine, linesNumber):
+                        screen[line] = [" "] * columnsNumber
+                elif command == "r":
+                    top, bottom = (numbers[0] - 1, numbers[1] - 1) if len(numbers) == 2 else (0, linesNumber - 1)
+                    row, column = 0, 0
+                index = end + 1
+                continue
+            if character == "\n" or column == columnsNumber:
+                if row == bottom:
+                    del screen[top]
+                    screen.insert(bottom, [" "] * columnsNumber)
+                elif row < linesNumber - 1:
+                    row += 1
+                column = 0
+            if character != "\n":
+                screen[row][column] = character
+                column += 1
+            index += 1
+        return ["".join(line).rstrip() for line in screen]
+
+    def setUp(self):
+        self.glyphs = {-1: "?", 0: "O", 1: "X"}
+        self.renderers = [ConsoleBoardRenderer(2, 3, "==Planes==", self.glyphs),
+                          ConsoleBoardRenderer(2, 3, "==Shots==", self.glyphs, 10)]
+        self.screen = ConsoleBoardsScreen(self.renderers)
+        self.grids = [[[-1, -1, -1], [-1, 1, -1]], [[-1, -1, -1], [-1, -1, -1]]]
+
+    def testPrintedTextDoesNotMoveTheBoards(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            sys.stdout.write(self.screen.update(self.grids, (40, 24)))
+            for line in range(30):
+                print("Computer missed! {}".format(line))
+            self.grids[1][0][2] = 0
+            self.grids[0][1][1] = 0
+            sys.stdout.write(self.screen.update(self.grids, (40, 24)))
+            print("Player has hit a cell!")
+        screen = TestConsoleBoardsScreen.emulateTerminal(output.getvalue(), 40, 24)
+        expected = ConsoleBoardRenderer(2, 3, "==Planes==", self.glyphs).render(self.grids[0]).split("\n") + \
+            ConsoleBoardRenderer(2, 3, "==Shots==", self.glyphs).render(self.grids[1]).split("\n")
+        self.assertEqual(screen[:18], expected)
+        self.assertEqual(screen[-3:], ["Computer missed! 29", "Player has hit a cell!", ""])
+        self.assertLessEqual(len(self.screen.update(self.grids, (40, 24))), 4)
+
+    def testResizeAndSmallTerminal(self):
+        self.assertEqual(self.screen.leave(), "")
+        self.assertTrue(self.screen.update(self.grids, (40, 24)).startswith(ConsoleBoardsScreen.enterAlternateScreen))
+        self.assertIn("==Shots==", self.screen.update(self.grids, (40, 30)))
+        self.assertIsNone(self.screen.update(self.grids, (40, 20)))
+        self.assertIsNone(self.screen.update(self.grids, (10, 30)))
+        self.assertEqual(self.screen.leave(), ConsoleBoardsScreen.leaveAlternateScreen)
+        self.assertFalse(self.screen.isShown())
@@ -3,60 +3,64 @@ GameConsoleInterface class - console-based user interface
 '''
 
 from validation.inputValidator import InputValidator
-from texttable import *
+from interface.consoleBoardRenderer import ConsoleBoardRenderer, ConsoleBoardsScreen
 from utilities.gameConstants import GameConstants
+import shutil
+import sys
 
 class GameConsoleInterface:
-    def __init__(self, gameController):
+    def __init__(self, gameController, ansi = False):
         '''
         This function initialises the GameConsoleInterface object
         :param gameController: the game controller (brain of the game) - GameController
+        :param ansi: if True, the boards are kept at the top of the screen (the prompts scrolling below them) and only
+                     their changed cells are redrawn
         '''
         self.__gameController = gameController
-        self.__columnList = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']
+        self.__ansi = ansi
+        rowsNumber = gameController.getRowsNumber()
+        columnsNumber = gameController.getColumnsNumber()
+        self.__planesRenderer = ConsoleBoardRenderer(rowsNumber, columnsNumber, "==============Your planes==============",
+                                                     {-1: 'O', 0: 'X', 1: '#'})
+        self.__shotsRenderer = ConsoleBoardRenderer(rowsNumber, columnsNumber, "==============Your shots==============",
+                                                    {-1: '?', 0: 'O', 1: 'X'}, 1 + self.__planesRenderer.getLinesNumber())
+        self.__boardsScreen = ConsoleBoardsScreen([self.__planesRenderer, self.__shotsRenderer])
         self.__hitResults = {"hit": "{} has hit a cell!", "cabin": "{} has destroyed a plane!", "miss": "{} missed!"}
 
     def __UIexitGame(self):
         print("Thank you for playing Planes!")
 
     def __UIprintShotsGrid(self, grid):
-        textTable = Texttable()
-        textTable.add_row([' '] + self.__columnList)
-        for i in range(8):
-            row = [str(i + 1)]
-            for j in range(8):
-                entry = '?'
-                if grid[i][j] == 0:
-                    entry = 'O'
-                elif grid[i][j] == 1:
-                    entry = 'X'
-                row += [entry]
-            textTable.add_row(row)
-        print("==============Your shots==============")
-        print(textTable.draw())
-        print("==============Your shots==============")
+        print(self.__shotsRenderer.render(grid))
 
     def __UIprintPlanesGrid(self, grid):
-        textTable = Texttable()
-        textTable.add_row([' '] + self.__columnList)
-        for i in range(8):
-            row = [str(i + 1)]
-            for j in range(8):
-                entry = 'O'
-                if grid[i][j] == 1:
-                    entry = '#'
-                if grid[i][j] == 0:
-                    entry = 'X'
-                row += [entry]
-            textTable.add_row(row)
-        print("==============Your planes==============")
-        print(textTable.draw())
-        print("==============Your planes==============")
+        print(self.__planesRenderer.render(grid))
+
+    def __UIupdateBoards(self, playerPlanesGrid, playerShotsGrid):
+        '''
+        This function redraws, with ANSI escape sequences, the changed cells of the boards kept at the top of the screen
+        (the whole screen is drawn the first time in a game or after a resize; the boards are printed as usual if the
+        terminal is too small to keep them)
+        :return: nothing
+        '''
+        drawing = self.__boardsScreen.update([playerPlanesGrid, playerShotsGrid], shutil.get_terminal_size())
+        if drawing is None:
+            self.__UIleaveBoardsScreen()
+            self.__UIprintPlanesGrid(playerPlanesGrid)
+            self.__UIprintShotsGrid(playerShotsGrid)
+            return
+        sys.stdout.write(drawing)
+        sys.stdout.flush()
+
+    def __UIleaveBoardsScreen(self):
+        sys.stdout.write(self.__boardsScreen.leave())
+        sys.stdout.flush()
 
     def __UIplacePlayerPlanes(self):
-        print("You must place 2 planes first.")
+        planesNumber = self.__gameController.getPlanesNumber()
+        print("You must place {} planes first.".format(planesNumber))
         numberOfPlacedPlanes = 0
-        while numberOfPlacedPlanes < 2:
+        while numberOfPlacedPlanes < planesNumber:
             cabinCellString = input("Please provide the cell of the cabin (e.g. A3, C7, H5 etc.): ")
             cabinOrientationString = input("Please provide where the cabin should point to (up/down/left/right): ").lower()
             try:
@@ -68,6 +72,9 @@ class GameConsoleInterface:
     def __UIprintPlayerInformation(self):
         playerPlanesGrid = self.__gameController.getPlayerPlanesGrid()
         playerShotsGrid = self.__gameController.getPlayerShotsGrid()
+        if self.__ansi is True:
+            self.__UIupdateBoards(playerPlanesGrid, playerShotsGrid)
+            return
         self.__UIprintPlanesGrid(playerPlanesGrid)
         self.__UIprintShotsGrid(playerShotsGrid)
 
@@ -75,7 +82,8 @@ class GameConsoleInterface:
         receivedCorrectCell = False
         while receivedCorrectCell == False:
             cellString = input("Please provide the cell you would like to hit (e.g. A3, C7, H5 etc.): ")
-            if InputValidator.checkIfCellIsCorrect(cellString) == False:
+            if InputValidator.checkIfCellIsCorrect(cellString, self.__gameController.getRowsNumber(),
+                                                   self.__gameController.getColumnsNumber()) == False:
                 print("Please provide a valid cell.")
             else:
                 receivedCorrectCell = True
@@ -112,10 +120,13 @@ class GameConsoleInterface:
         self.__gameController.initializeNewGame()
         self.__UIplacePlayerPlanes()
         winner = self.__gameController.getGameWinner()
-        while winner == "none":
-            self.__UIhittingPhasePlayerChoice()
-            self.__UIhittingPhaseComputerChoice()
-            winner = self.__gameController.getGameWinner()
+        try:
+            while winner == "none":
+                self.__UIhittingPhasePlayerChoice()
+                self.__UIhittingPhaseComputerChoice()
+                winner = self.__gameController.getGameWinner()
+        finally:
+            self.__UIleaveBoardsScreen()
         if winner == "player":
             print("You have won! Congratulations!")
         else:
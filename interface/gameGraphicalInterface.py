@@ -6,23 +6,104 @@ from tkinter import *
 from tkinter import messagebox
 from utilities.matrixGenerator import MatrixGenerator
 from copy import deepcopy
-from validation.inputValidator import InputValidator
 from controller.gameController import GameController
 from utilities.gameConstants import GameConstants
+from utilities.drawnPlaneTracker import DrawnPlaneTracker
+from utilities.placementTable import PlacementTable
+
+class ButtonBoardRenderer:
+    def __init__(self, parent, rowsNumber, columnsNumber, onCellClick):
+        '''
+        The initialiser of the ButtonBoardRenderer object - a board made of one Button widget per cell
+        :param parent: the widget which holds the board - Frame
+        :param rowsNumber: the number of rows of the board - integer
+        :param columnsNumber: the number of columns of the board - integer
+        :param onCellClick: the function called with the row and the column of a clicked cell
+        '''
+        self.__buttonMatrix = MatrixGenerator.generateMatrix(rowsNumber, columnsNumber)
+        for i in range(rowsNumber):
+            for j in range(columnsNumber):
+                button = Button(parent, command = lambda pair = (i, j): onCellClick(pair[0], pair[1]), width = 2,
+                                background = "gray")
+                self.__buttonMatrix[i][j] = button
+                self.__buttonMatrix[i][j].grid(row = i, column = j)
+
+    def paintCell(self, row, column, colour):
+        self.__buttonMatrix[row][column].configure(background = colour)
+
+class CanvasBoardRenderer:
+    cellSize = 24
+
+    def __init__(self, parent, rowsNumber, columnsNumber, onCellClick):
+        '''
+        The initialiser of the CanvasBoardRenderer object - a board drawn on a single Canvas, where only the cells which
+        are not gray own a rectangle item (tagged with the cell), so the startup cost does not depend on the board area
+        :param parent: the widget which holds the board - Frame
+        :param rowsNumber: the number of rows of the board - integer
+        :param columnsNumber: the number of columns of the board - integer
+        :param onCellClick: the function called with the row and the column of a clicked cell
+        '''
+        self.__rowsNumber = rowsNumber
+        self.__columnsNumber = columnsNumber
+        self.__onCellClick = onCellClick
+        self.__paintedCells = set()
+        width = columnsNumber * CanvasBoardRenderer.cellSize
+        height = rowsNumber * CanvasBoardRenderer.cellSize
+        self.__canvas = Canvas(parent, width = width, height = height, background = "gray", highlightthickness = 0)
+        for row in range(1, rowsNumber):
+            self.__canvas.create_line(0, row * CanvasBoardRenderer.cellSize, width, row * CanvasBoardRenderer.cellSize,
+                                      fill = "black", tags = "gridLine")
+        for column in range(1, columnsNumber):
+            self.__canvas.create_line(column * CanvasBoardRenderer.cellSize, 0, column * CanvasBoardRenderer.cellSize,
+                                      height, fill = "black", tags = "gridLine")
+        self.__canvas.bind("<Button-1>", self.__onClick)
+        self.__canvas.grid(row = 0, column = 0)
+
+    def __onClick(self, event):
+        row = event.y // CanvasBoardRenderer.cellSize
+        column = event.x // CanvasBoardRenderer.cellSize
+        if 0 <= row < self.__rowsNumber and 0 <= column < self.__columnsNumber:
+            self.__onCellClick(row, column)
+
+    def paintCell(self, row, column, colour):
+        tag = "cell{}_{}".format(row, column)
+        if colour == "gray":
+            self.__canvas.delete(tag)
+            self.__paintedCells.discard((row, column))
+        elif (row, column) in self.__paintedCells:
+            self.__canvas.itemconfigure(tag, fill = colour)
+        else:
+            self.__canvas.create_rectangle(column * CanvasBoardRenderer.cellSize, row * CanvasBoardRenderer.cellSize,
+                                           (column + 1) * CanvasBoardRenderer.cellSize,
+                                           (row + 1) * CanvasBoardRenderer.cellSize,
+                                           fill = colour, outline = "black", tags = tag)
+            self.__paintedCells.add((row, column))
 
 class GameGraphicalInterface:
-    def __init__(self, gameController):
+    renderers = {"buttons": ButtonBoardRenderer, "canvas": CanvasBoardRenderer}
+
+    def __init__(self, gameController, renderer = "buttons"):
+        '''
+        The initialiser of the GameGraphicalInterface object
+        :param gameController: the game controller (brain of the game) - GameController
+        :param renderer: how the boards are drawn - "buttons" (one Button per cell) or "canvas" (one Canvas per board)
+        '''
+        if renderer not in GameGraphicalInterface.renderers:
+            raise ValueError("Invalid renderer")
         self.__gameController = gameController
-        self.__columnList = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']
+        self.__rendererClass = GameGraphicalInterface.renderers[renderer]
+        self.__rowsNumber = gameController.getRowsNumber()
+        self.__columnsNumber = gameController.getColumnsNumber()
         self.__hitResults = {"hit": "{} has hit a cell!", "cabin": "{} has destroyed a plane!", "miss": "{} missed!"}
         self.__root = Tk()
         self.__planesGridFrame = Frame(self.__root)
         self.__shotsGridFrame = Frame(self.__root)
         self.__externalFrame = Frame(self.__root)
-        self.__planesGrid = MatrixGenerator.generateMatrix(8, 8, -1)
-        self.__shotsGrid = MatrixGenerator.generateMatrix(8, 8, -1)
-        self.__planesGridButtonMatrix = MatrixGenerator.generateMatrix(8, 8)
-        self.__shotsGridButtonMatrix = MatrixGenerator.generateMatrix(8, 8)
+        self.__boards = {}
+        self.__dirtyCells = {"planes": set(), "shots": set()}
+        self.__paintedColours = {"planes": {}, "shots": {}}
+        self.__drawnPlane = DrawnPlaneTracker(PlacementTable.forBoard(self.__rowsNumber, self.__columnsNumber))
+        self.__isDrawnPlaneShown = None
         self.__drawnPlanesCounter = 0
         self.__isHittingPhase = False
 
@@ -31,27 +112,68 @@ class GameGraphicalInterface:
         self.__externalFrame.pack()
         self.__shotsGridFrame.pack()
 
+    def __planesCellColour(self, row, column, playerPlanesGrid):
+        '''
+        This function derives the colour of a cell of the planes board from the state of the game
+        :return: "red" for a hit plane cell, "green" for a placed plane cell, "yellow" for a drawn cell, else "gray"
+        '''
+        value = playerPlanesGrid[row][column]
+        if value == 0:
+            return "red"
+        if value == 1:
+            return "green"
+        if self.__drawnPlane.contains((row, column)) is True:
+            return "yellow"
+        return "gray"
+
+    def __shotsCellColour(self, row, column, playerShotsGrid):
+        '''
+        This function derives the colour of a cell of the shots board from the state of the game
+        :return: "green" for a successful shot, "red" for a miss, else "gray"
+        '''
+        return {-1: "gray", 0: "red", 1: "green"}[playerShotsGrid[row][column]]
+
+    def __markDirty(self, board, row, column):
+        self.__dirtyCells[board].add((row, column))
+
+    def __flushDirtyCells(self):
+        '''
+        This function repaints, in one pass, the cells which changed since the last pass (a cell is configured only if
+        its colour is really different from the painted one)
+        :return: nothing
+        '''
+        grids = {"planes": self.__gameController.getPlayerPlanesGrid(), "shots": self.__gameController.getPlayerShotsGrid()}
+        colourFunctions = {"planes": self.__planesCellColour, "shots": self.__shotsCellColour}
+        for board, dirtyCells in self.__dirtyCells.items():
+            paintedColours = self.__paintedColours[board]
+            for cell in dirtyCells:
+                colour = colourFunctions[board](cell[0], cell[1], grids[board])
+                if paintedColours.get(cell, "gray") != colour:
+                    self.__boards[board].paintCell(cell[0], cell[1], colour)
+                    if colour == "gray":
+                        del paintedColours[cell]
+                    else:
+                        paintedColours[cell] = colour
+            dirtyCells.clear()
+
     def __onPlanesGridButtonClick(self, row, column):
         if self.__isHittingPhase == True:
             messagebox.showinfo("Error", "It is hitting phase, you can't touch your planes anymore.")
-        elif self.__planesGrid[row][column] == 1:
+        elif self.__gameController.getPlayerPlanesGrid().getCell(row, column) == 1:
             messagebox.showinfo("Error", "You clicked an already set plane's tile!")
         else:
-            if self.__planesGrid[row][column] == -1:
-                self.__planesGrid[row][column] = 2
-                self.__planesGridButtonMatrix[row][column].configure(background = "yellow")
-            else:
-                self.__planesGrid[row][column] = -1
-                self.__planesGridButtonMatrix[row][column].configure(background = "gray")
+            self.__drawnPlane.toggle(row, column)
+            self.__markDirty("planes", row, column)
+            self.__flushDirtyCells()
+            self.__GUIshowDrawnPlaneState()
 
     def __GUIplayerHit(self, row, column):
         hitResult = self.__gameController.makePlayerHit(GameConstants.coordinatesToCellString(row, column))
         self.__listBox.delete(0, self.__listBox.size() - 1)
+        self.__markDirty("shots", row, column)
         if hitResult == "miss":
-            self.__shotsGridButtonMatrix[row][column].configure(background = "red")
             self.__listBox.insert(0, "You have missed!")
         else:
-            self.__shotsGridButtonMatrix[row][column].configure(background = "green")
             if hitResult == "hit":
                 self.__listBox.insert(0, "You have hit a cell at " + GameConstants.coordinatesToCellString(row, column))
             else:
@@ -65,7 +187,7 @@ class GameGraphicalInterface:
         if hitResult == "miss":
             self.__listBox.insert(1, "The computer has missed!")
         else:
-            self.__planesGridButtonMatrix[row][column].configure(background = "red")
+            self.__markDirty("planes", row, column)
             if hitResult == "hit":
                 self.__listBox.insert(1, "The computer has hit a cell at " + GameConstants.coordinatesToCellString(row, column))
             else:
@@ -77,6 +199,7 @@ class GameGraphicalInterface:
         else:
             self.__GUIplayerHit(row, column)
             self.__GUIcomputerHit()
+            self.__flushDirtyCells()
             winner = self.__gameController.getGameWinner()
             if winner != "none":
                 if winner == "player":
@@ -86,30 +209,40 @@ class GameGraphicalInterface:
                 self.__initializeGUI()
 
     def __GUIcreatePlanesGrid(self):
-        for i in range(8):
-            for j in range(8):
-                button = Button(self.__planesGridFrame,
-                                command = lambda pair = (i, j): self.__onPlanesGridButtonClick(pair[0], pair[1]), width = 2,
-                                background = "gray")
-                self.__planesGridButtonMatrix[i][j] = button
-                self.__planesGridButtonMatrix[i][j].grid(row = i, column = j)
+        self.__boards["planes"] = self.__rendererClass(self.__planesGridFrame, self.__rowsNumber, self.__columnsNumber,
+                                                       self.__onPlanesGridButtonClick)
+
+    def __GUIshowDrawnPlaneState(self):
+        '''
+        This function shows on the 'draw plane' button whether the drawn cells form a plane (the button is configured
+        only when that changes)
+        :return: nothing
+        '''
+        isPlane = self.__drawnPlane.isPlane()
+        if isPlane != self.__isDrawnPlaneShown:
+            if isPlane is True:
+                self.__drawPlaneButton.configure(text = "Draw plane", state = NORMAL)
+            else:
+                self.__drawPlaneButton.configure(text = "Draw plane (not a plane yet)", state = DISABLED)
+            self.__isDrawnPlaneShown = isPlane
 
     def __GUIvalidatePlane(self):
-        for i in range(8):
-            for j in range(8):
-                if self.__planesGrid[i][j] == 2:
-                    self.__planesGrid[i][j] = 1
-                    self.__planesGridButtonMatrix[i][j].configure(background = "green")
+        for row, column in self.__drawnPlane.getCells():
+            self.__markDirty("planes", row, column)
+        self.__drawnPlane.clear()
 
     def __drawPlane(self):
-        validationAnswer, cabinLocation, cabinOrientation = InputValidator.checkIfDrawnPlaneIsCorrect(self.__planesGrid)
-        if validationAnswer == False:
+        drawnPlane = self.__drawnPlane.getPlane()
+        if drawnPlane is None:
             messagebox.showinfo("Error", "You haven't drawn a valid plane. Please try again!")
         else:
+            cabinLocation, cabinOrientation = drawnPlane
             self.__GUIvalidatePlane()
             self.__drawnPlanesCounter += 1
             self.__gameController.placePlayerPlane(cabinLocation, cabinOrientation)
-            if self.__drawnPlanesCounter == 2:
+            self.__flushDirtyCells()
+            self.__GUIshowDrawnPlaneState()
+            if self.__drawnPlanesCounter == self.__gameController.getPlanesNumber():
                 self.__isHittingPhase = True
                 self.__listBox.delete(0, self.__listBox.size() - 1)
                 self.__listBox.insert(0, "It is hitting phase now, hit a cell!")
@@ -121,13 +254,8 @@ class GameGraphicalInterface:
         self.__drawPlaneButton.grid(row = 1, column = 0)
 
     def __GUIcreateShotsGrid(self):
-        for i in range(8):
-            for j in range(8):
-                button = Button(self.__shotsGridFrame,
-                                command = lambda pair = (i, j): self.__onShotsGridButtonClick(pair[0], pair[1]), width = 2,
-                                background = "gray")
-                self.__shotsGridButtonMatrix[i][j] = button
-                self.__shotsGridButtonMatrix[i][j].grid(row = i, column = j)
+        self.__boards["shots"] = self.__rendererClass(self.__shotsGridFrame, self.__rowsNumber, self.__columnsNumber,
+                                                      self.__onShotsGridButtonClick)
 
     def __drawGUI(self):
         self.__root.title("Planes")
@@ -144,16 +272,15 @@ class GameGraphicalInterface:
         self.__initializeListbox()
 
     def __initializeGraphicalMatrices(self):
-        for i in range(8):
-            for j in range(8):
-                self.__shotsGridButtonMatrix[i][j].configure(bg = "gray")
-                self.__planesGridButtonMatrix[i][j].configure(bg = "gray")
-                self.__planesGrid[i][j] = -1
-                self.__shotsGrid[i][j] = -1
+        for board, paintedColours in self.__paintedColours.items():
+            self.__dirtyCells[board].update(paintedColours)
+        self.__drawnPlane.clear()
+        self.__flushDirtyCells()
+        self.__GUIshowDrawnPlaneState()
 
     def __initializeListbox(self):
         self.__listBox.delete(0, self.__listBox.size() - 1)
-        self.__listBox.insert(0, "Please draw two planes to begin the game.")
+        self.__listBox.insert(0, "Please draw {} planes to begin the game.".format(self.__gameController.getPlanesNumber()))
         self.__listBox.insert(1, "Please press the 'draw plane' button after you drew one plane.")
 
     def UIrunApplication(self):
@@ -0,0 +1,376 @@
+'''
+GameServer class - asyncio network front end serving many games from one thread, over TCP or a Unix socket.
+Every session drives its own GameController, taken from a SessionPool and given back when the session ends.
+The protocol is one ASCII line per request and per response:
+    NEW                                   -> OK <session> <rows> <columns> <planes>
+    PLACE <session> <cell> <orientation>  -> OK <placed planes>
+    SHOT <session> <cell>                 -> OK <player result> <computer cell> <computer result> <winner>
+    QUIT <session>                        -> OK
+Any request may be answered with ERROR <message> instead. A session belongs to the connection which created it: the
+other connections cannot use it, and it ends when its connection is closed.
+'''
+
+from controller.sessionPool import SessionPool
+from validation.inputValidator import InputValidator
+from utilities.gameConstants import GameConstants
+from collections import OrderedDict
+import argparse
+import asyncio
+import itertools
+import time
+import unittest
+
+class GameSession:
+    def __init__(self, gameController):
+        '''
+        The initialiser of the GameSession object (a new game is started)
+        :param gameController: the game of the session - GameController
+        '''
+        self.__gameController = gameController
+        self.__placedPlanesNumber = 0
+        gameController.initializeNewGame()
+
+    def getGameController(self):
+        return self.__gameController
+
+    def placePlane(self, cellString, orientation):
+        '''
+        This function places a plane of the player
+        :param cellString: the cell of the cabin - string
+        :param orientation: the way the cabin points to (up/down/left/right)
+        :return: the response - string
+        '''
+        if self.__placedPlanesNumber == self.__gameController.getPlanesNumber():
+            return "ERROR All the planes are placed"
+        self.__gameController.placePlayerPlane(cellString, orientation.lower())
+        self.__placedPlanesNumber += 1
+        return "OK {}".format(self.__placedPlanesNumber)
+
+    def shoot(self, cellString):
+        '''
+        This function plays a round: the shot of the player, then the shot of the computer
+        :param cellString: the cell the player hits - string
+        :return: the response - string
+        '''
+        if self.__placedPlanesNumber < self.__gameController.getPlanesNumber():
+            return "ERROR Place your planes first"
+        if self.__gameController.getGameWinner() != "none":
+            return "ERROR The game is over"
+        if InputValidator.checkIfCellIsCorrect(cellString, self.__gameController.getRowsNumber(),
+                                               self.__gameController.getColumnsNumber()) is False:
+            return "ERROR Invalid cell"
+        playerResult = self.__gameController.makePlayerHit(cellString)
+        computerResult = self.__gameController.makeComputerHit()[0]
+        computerCell = self.__gameController.getLastComputerHitCell()
+        computerCellString = GameConstants.coordinatesToCellString(computerCell[0], computerCell[1])
+        return "OK {} {} {} {}".format(playerResult, computerCellString, computerResult,
+                                       self.__gameController.getGameWinner())
+
+class GameServer:
+    maximumLineLength = 256
+
+    def __init__(self, createGameController, idleTimeout = 300.0, maximumSessions = 50000, clock = time.monotonic):
+        '''
+        The initialiser of the GameServer object
+        :param createGameController: function which builds a GameController (finished games are reused by new sessions)
+        :param idleTimeout: the number of seconds after which a session without requests is evicted - float
+        :param maximumSessions: the number of sessions above which NEW is refused - integer
+        :param clock: function which returns the current time in seconds
+        '''
+        self.__sessionPool = SessionPool(createGameController)
+        self.__idleTimeout = idleTimeout
+        self.__maximumSessions = maximumSessions
+        self.__clock = clock
+        self.__sessions = OrderedDict()
+        self.__connectionSessionIds = {}
+        self.__sessionIds = itertools.count(1)
+        self.__server = None
+        self.__evictionTask = None
+
+    def getSessionsNumber(self):
+        return len(self.__sessions)
+
+    def __getSession(self, sessionIdString, connection):
+        '''
+        This function returns a session of a connection and marks it as the most recently used one
+        :param sessionIdString: the id of the session - string
+        :param connection: the connection which sends the request
+        :return: sessionId - integer, session - GameSession
+                 None, None if the connection has no such session
+        '''
+        sessionId = InputValidator.getIntegerFromString(sessionIdString)
+        if sessionId not in self.__sessions or self.__sessions[sessionId][2] is not connection:
+            return None, None
+        session = self.__sessions[sessionId][0]
+        self.__sessions[sessionId] = (session, self.__clock(), connection)
+        self.__sessions.move_to_end(sessionId)
+        return sessionId, session
+
+    def __removeSession(self, sessionId):
+        '''
+        This function ends a session, giving its game back to the pool
+        :param sessionId: the id of the session - integer
+        :return: nothing
+        '''
+        session, lastRequestTime, connection = self.__sessions.pop(sessionId)
+        connectionSessionIds = self.__connectionSessionIds[connection]
+        connectionSessionIds.discard(sessionId)
+        if len(connectionSessionIds) == 0:
+            del self.__connectionSessionIds[connection]
+        self.__sessionPool.release(session.getGameController())
+
+    def handleRequest(self, line, connection = None):
+        '''
+        This function answers a request
+        :param line: the request, without the line ending - string
+        :param connection: the connection which sends the request (any object compared by identity, the sessions
+                           being only usable by the connection which created them)
+        :return: the response, without the line ending - string
+        '''
+        words = line.split()
+        if len(words) == 0:
+            return "ERROR Empty request"
+        command = words[0].upper()
+        if command == "NEW" and len(words) == 1:
+            if len(self.__sessions) >= self.__maximumSessions:
+                return "ERROR Server full"
+            sessionId = next(self.__sessionIds)
+            session = GameSession(self.__sessionPool.acquire())
+            self.__sessions[sessionId] = (session, self.__clock(), connection)
+            self.__connectionSessionIds.setdefault(connection, set()).add(sessionId)
+            gameController = session.getGameController()
+            return "OK {} {} {} {}".format(sessionId, gameController.getRowsNumber(), gameController.getColumnsNumber(),
+                                           gameController.getPlanesNumber())
+        requestLengths = {"PLACE": 4, "SHOT": 3, "QUIT": 2}
+        if requestLengths.get(command) != len(words):
+            return "ERROR Invalid request"
+        sessionId, session = self.__getSession(words[1], connection)
+        if session is None:
+            return "ERROR Unknown session"
+        if command == "QUIT":
+            self.__removeSession(sessionId)
+            return "OK"
+        try:
+            if command == "PLACE":
+                return session.placePlane(words[2].upper(), words[3])
+            return session.shoot(words[2].upper())
+        except ValueError as error:
+            return "ERROR " + str(error)
+
+    def closeConnection(self, connection):
+        '''
+        This function ends every session of a connection
+        :param connection: the closed connection
+        :return: the number of ended sessions - integer
+        '''
+        sessionIds = list(self.__connectionSessionIds.get(connection, ()))
+        for sessionId in sessionIds:
+            self.__removeSession(sessionId)
+        return len(sessionIds)
+
+    def evictIdleSessions(self):
+        '''
+        This function removes the sessions which have not received a request for idleTimeout seconds (the sessions
+        are kept from the least to the most recently used one, so only the evicted ones are visited)
+        :return: the number of evicted sessions - integer
+        '''
+        oldestKeptTime = self.__clock() - self.__idleTimeout
+        evictedSessionsNumber = 0
+        while len(self.__sessions) > 0:
+            sessionId, (session, lastRequestTime, connection) = next(iter(self.__sessions.items()))
+            if lastRequestTime > oldestKeptTime:
+                break
+            self.__removeSession(sessionId)
+            evictedSessionsNumber += 1
+        return evictedSessionsNumber
+
+    async def __evictIdleSessionsPeriodically(self):
+        while True:
+            await asyncio.sleep(self.__idleTimeout / 4)
+            self.evictIdleSessions()
+
+    async def __handleClient(self, reader, writer):
+        '''
+        This function answers the requests of a connection one at a time. No request is read while the unsent
+        responses are above the high-water mark of the transport (drain), so a client which does not read its
+        responses stops being served instead of filling the memory of the server. The sessions of the connection end
+        with it.
+        :return: nothing
+        '''
+        connection = object()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    writer.write(b"ERROR Request too long\n")
+                    break
+                if len(line) == 0:
+                    break
+                response = self.handleRequest(line.decode("ascii", "replace"), connection)
+                writer.write(response.encode("ascii") + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.closeConnection(connection)
+            writer.close()
+
+    async def start(self, host = "127.0.0.1", port = 0, unixPath = None):
+        '''
+        This function starts listening (on a Unix socket if unixPath is given, on TCP otherwise)
+        :param host: the TCP host - string
+        :param port: the TCP port (0 for a free one) - integer
+        :param unixPath: the path of the Unix socket - string
+        :return: the address the server listens on
+        '''
+        if unixPath is not None:
+            self.__server = await asyncio.start_unix_server(self.__handleClient, unixPath,
+                                                            limit = GameServer.maximumLineLength)
+        else:
+            self.__server = await asyncio.start_server(self.__handleClient, host, port,
+                                                       limit = GameServer.maximumLineLength)
+        self.__evictionTask = asyncio.ensure_future(self.__evictIdleSessionsPeriodically())
+        return self.__server.sockets[0].getsockname()
+
+    async def stop(self):
+        '''
+        This function stops listening and ends every session
+        :return: nothing
+        '''
+        self.__evictionTask.cancel()
+        self.__server.close()
+        await self.__server.wait_closed()
+        while len(self.__sessions) > 0:
+            self.__removeSession(next(iter(self.__sessions)))
+
+    async def serveForever(self, host = "127.0.0.1", port = 0, unixPath = None):
+        address = await self.start(host, port, unixPath)
+        print("Planes server listening on {}".format(address))
+        try:
+            await self.__server.serve_forever()
+        finally:
+            await self.stop()
+
+    @staticmethod
+    def main(arguments, createGameController):
+        '''
+        This function runs a server configured from the command line
+        :param arguments: the command line arguments - list of strings
+        :param createGameController: function which returns the GameController of a new session
+        :return: nothing
+        '''
+        parser = argparse.ArgumentParser(description = "Planes game server")
+        parser.add_argument("--host", default = "127.0.0.1")
+        parser.add_argument("--port", type = int, default = 4380)
+        parser.add_argument("--unix", default = None)
+        parser.add_argument("--idle-timeout", type = float, default = 300.0)
+        parser.add_argument("--max-sessions", type = int, default = 50000)
+        options = parser.parse_args(arguments)
+        server = GameServer(createGameController, options.idle_timeout, options.max_sessions)
+        try:
+            asyncio.run(server.serveForever(options.host, options.port, options.unix))
+        except KeyboardInterrupt:
+            pass
+
+class TestGameServer(unittest.TestCase):
+    @staticmethod
+    def createGameController():
+        from repository.repository import Repository
+        from controller.playerController import PlayerController
+        from controller.computerController import ComputerController
+        from controller.gameController import GameController
+        from utilities.compactRandom import CompactRandom
+        return GameController(PlayerController(Repository()), ComputerController(Repository(), CompactRandom(1)))
+
+    def setUp(self):
+        self.time = 0.0
+        self.server = GameServer(TestGameServer.createGameController, 10.0, 3, lambda: self.time)
+
+    def testGame(self):
+        self.assertEqual(self.server.handleRequest("NEW"), "OK 1 8 8 2")
+        self.assertEqual(self.server.handleRequest("SHOT 1 A1"), "ERROR Place your planes first")
+        self.assertEqual(self.server.handleRequest("PLACE 1 C1 up"), "OK 1")
+        self.assertTrue(self.server.handleRequest("PLACE 1 C1 up").startswith("ERROR Plane cannot be placed"))
+        self.assertEqual(self.server.handleRequest("place 1 f8 DOWN"), "OK 2")
+        self.assertEqual(self.server.handleRequest("SHOT 1 Z9"), "ERROR Invalid cell")
+        winner = "none"
+        cells = [GameConstants.coordinatesToCellString(row, column) for row in range(8) for column in range(8)]
+        while winner == "none":
+            words = self.server.handleRequest("SHOT 1 " + cells.pop()).split()
+            self.assertEqual(words[0], "OK")
+            self.assertIn(words[1], ["miss", "hit", "cabin"])
+            winner = words[4]
+        self.assertEqual(self.server.handleRequest("SHOT 1 A1"), "ERROR The game is over")
+        self.assertEqual(self.server.handleRequest("QUIT 1"), "OK")
+        self.assertEqual(self.server.handleRequest("QUIT 1"), "ERROR Unknown session")
+
+    def testInvalidRequests(self):
+        for line in ["", "HELLO", "SHOT 1", "PLACE x A1 up", "NEW 5"]:
+            self.assertTrue(self.server.handleRequest(line).startswith("ERROR"))
+
+    def testLimits(self):
+        for i in range(3):
+            self.server.handleRequest("NEW")
+        self.assertEqual(self.server.handleRequest("NEW"), "ERROR Server full")
+        self.time = 6.0
+        self.server.handleRequest("PLACE 2 C1 up")
+        self.time = 12.0
+        self.assertEqual(self.server.evictIdleSessions(), 2)
+        self.assertEqual(self.server.getSessionsNumber(), 1)
+        self.assertEqual(self.server.handleRequest("PLACE 1 C1 up"), "ERROR Unknown session")
+        self.assertEqual(self.server.handleRequest("PLACE 2 F8 down"), "OK 2")
+
+    def testSessionsBelongToTheirConnection(self):
+        firstConnection, secondConnection = object(), object()
+        self.assertEqual(self.server.handleRequest("NEW", firstConnection), "OK 1 8 8 2")
+        self.assertEqual(self.server.handleRequest("NEW", secondConnection), "OK 2 8 8 2")
+        for line in ["PLACE 1 C1 up", "SHOT 1 A1", "QUIT 1"]:
+            self.assertEqual(self.server.handleRequest(line, secondConnection), "ERROR Unknown session")
+            self.assertEqual(self.server.handleRequest(line), "ERROR Unknown session")
+        self.assertEqual(self.server.handleRequest("PLACE 1 C1 up", firstConnection), "OK 1")
+        self.server.handleRequest("NEW", firstConnection)
+        self.assertEqual(self.server.closeConnection(firstConnection), 2)
+        self.assertEqual(self.server.getSessionsNumber(), 1)
+        self.assertEqual(self.server.closeConnection(firstConnection), 0)
+        self.assertEqual(self.server.handleRequest("PLACE 2 C1 up", secondConnection), "OK 1")
+
+class TestGameServerConnections(unittest.IsolatedAsyncioTestCase):
+    async def testConnection(self):
+        server = GameServer(TestGameServer.createGameController)
+        host, port = (await server.start())[:2]
+        try:
+            reader, writer = await asyncio.open_connection(host, port)
+            writer.write(b"NEW\nPLACE 1 C1 up\nQUIT 1\n")
+            self.assertEqual([await reader.readline() for i in range(3)], [b"OK 1 8 8 2\n", b"OK 1\n", b"OK\n"])
+            writer.write(b"X" * (GameServer.maximumLineLength + 1) + b"\n")
+            self.assertEqual(await reader.readline(), b"ERROR Request too long\n")
+            self.assertEqual(await reader.read(), b"")
+            writer.close()
+        finally:
+            await server.stop()
+
+    async def testClosedConnectionsEndTheirSessions(self):
+        server = GameServer(TestGameServer.createGameController)
+        host, port = (await server.start())[:2]
+        try:
+            connections = [await asyncio.open_connection(host, port) for i in range(2)]
+            for reader, writer in connections:
+                writer.write(b"NEW\nNEW\n")
+                await reader.readline()
+                await reader.readline()
+            self.assertEqual(server.getSessionsNumber(), 4)
+            reader, writer = connections[1]
+            writer.write(b"QUIT 1\n")
+            self.assertEqual(await reader.readline(), b"ERROR Unknown session\n")
+            writer.close()
+            await writer.wait_closed()
+            for i in range(100):
+                if server.getSessionsNumber() == 2:
+                    break
+                await asyncio.sleep(0.01)
+            self.assertEqual(server.getSessionsNumber(), 2)
+        finally:
+            await server.stop()
+        self.assertEqual(server.getSessionsNumber(), 0)
+        connections[0][1].close()
@@ -1,23 +1,69 @@
-from interface.gameConsoleInterface import GameConsoleInterface
-from interface.gameGraphicalInterface import GameGraphicalInterface
-from controller import *
-from repository.repository import Repository
+'''
+The entry point of Planes: python main.py [console|gui|headless|server] [options]
+Only the chosen front end is imported (the headless mode imports no interface at all).
+'''
 
-# repositories
-playerRepository = Repository()
-computerRepository = Repository()
+import sys
 
-# controllers
-playerController = PlayerController(playerRepository)
-computerController = ComputerController(computerRepository)
-gameController = GameController(playerController, computerController)
+def createGameController():
+    from repository.repository import Repository
+    from controller.playerController import PlayerController
+    from controller.computerController import ComputerController
+    from controller.gameController import GameController
 
-userChoice = input("console or gui?: ")
+    # repositories
+    playerRepository = Repository()
+    computerRepository = Repository()
 
-# interfaces
-userInterface = GameConsoleInterface(gameController)
-if userChoice == "gui":
-    userInterface = GameGraphicalInterface(gameController)
+    # controllers
+    playerController = PlayerController(playerRepository)
+    computerController = ComputerController(computerRepository)
+    return GameController(playerController, computerController)
 
-# source code
-userInterface.UIrunApplication()
\ No newline at end of file
+def loadInterface(userChoice):
+    '''
+    This function imports the class of the chosen interface
+    :param userChoice: "console" or "gui"
+    :return: the interface class
+    '''
+    if userChoice == "gui":
+        from interface.gameGraphicalInterface import GameGraphicalInterface
+        return GameGraphicalInterface
+    from interface.gameConsoleInterface import GameConsoleInterface
+    return GameConsoleInterface
+
+def main(arguments = None):
+    '''
+    This function starts the chosen mode (the user is asked for it if it is not given)
+    :param arguments: the command line arguments - list of strings (sys.argv if None)
+    :return: nothing
+    '''
+    arguments = sys.argv[1:] if arguments is None else arguments
+    userChoice = arguments[0] if len(arguments) > 0 else input("console or gui?: ")
+    options = arguments[1:]
+
+    # headless computer versus computer games
+    if userChoice == "headless":
+        from simulation.selfPlay import SelfPlay
+        SelfPlay.main(options)
+        return
+
+    # network games
+    if userChoice == "server":
+        from interface.gameServer import GameServer
+        GameServer.main(options, createGameController)
+        return
+
+    # interfaces
+    gameController = createGameController()
+    if userChoice == "gui":
+        renderer = "canvas" if "--canvas" in options else "buttons"
+        userInterface = loadInterface(userChoice)(gameController, renderer)
+    else:
+        userInterface = loadInterface(userChoice)(gameController, "--ansi" in options)
+
+    # source code
+    userInterface.UIrunApplication()
+
+if __name__ == "__main__":
+    main()
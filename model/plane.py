@@ -3,17 +3,21 @@ Plane class - abstractization of a plane
 '''
 
 from utilities.gameConstants import GameConstants
+from utilities.placementTable import placementTable
 import unittest
 
 class Plane:
-    def __init__(self, cabinLocation, cabinOrientation):
+    def __init__(self, cabinLocation, cabinOrientation, table = placementTable):
         '''
         The initialiser of the Plane object
         :param cabinLocation: the location of the plane
         :param cabinOrientation: the orientation of the plane
+        :param table: the placements of the grid the plane belongs to - PlacementTable
         '''
         self.__cabinLocation = cabinLocation
         self.__cabinOrientation = cabinOrientation
+        self.__table = table
+        self.__placementId = table.getPlacementId(cabinLocation, cabinOrientation)
 
     def getCabinLocation(self):
         '''
@@ -29,11 +33,21 @@ class Plane:
         '''
         return self.__cabinOrientation
 
+    def getPlacementId(self):
+        '''
+        placementId getter
+        :return: placementId - the id of the plane in the placement table
+                 None if the plane does not fit in the grid
+        '''
+        return self.__placementId
+
     def getPlaneCellsList(self):
         '''
-        This function generates a list of cells which represent the cells of the plane
+        This function returns the cells of the plane (looked up in the placement table when the plane fits in the grid)
         :return: cells - the list described above
         '''
+        if self.__placementId is not None:
+            return self.__table.getCells(self.__placementId)
         directions = GameConstants.directions[self.__cabinOrientation][:]
         sign = GameConstants.directionSign[self.__cabinOrientation]
         cells = []
@@ -44,6 +58,16 @@ class Plane:
             cells.append((newRow, newColumn))
         return cells
 
+    def getPlaneMask(self):
+        '''
+        This function returns the bitmask of the cells of the plane (bit row * columnsNumber + column)
+        :return: mask - integer
+                 None if the plane does not fit in the grid
+        '''
+        if self.__placementId is None:
+            return None
+        return self.__table.getMask(self.__placementId)
+
 class TestPlane(unittest.TestCase):
     def testGetCabinLocation(self):
         plane = Plane("A5", "left")
@@ -63,4 +87,16 @@ class TestPlane(unittest.TestCase):
         realCellsList = [(4, 0), (3, 1), (4, 1), (5, 1), (4, 2), (2, 3), (3, 3), (4, 3), (5, 3), (6, 3)]
         for cell in realCellsList:
             if cell not in cellsList:
-                assert False
\ No newline at end of file
+                assert False
+
+    def testGetPlacementId(self):
+        self.assertIsNotNone(Plane("A5", "left").getPlacementId())
+        self.assertIsNone(Plane("A5", "right").getPlacementId())
+        self.assertIsNone(Plane("9A", "eee").getPlacementId())
+
+    def testLargeBoardPlane(self):
+        from utilities.placementTable import PlacementTable
+        plane = Plane("AA30", "up", PlacementTable.forBoard(40, 40))
+        self.assertEqual(plane.getPlaneCellsList()[0], (29, 26))
+        self.assertEqual(bin(plane.getPlaneMask()).count("1"), 10)
+        self.assertIsNone(Plane("AA30", "up").getPlacementId())
\ No newline at end of file
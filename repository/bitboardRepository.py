@@ -0,0 +1,287 @@
+'''
+BitboardRepository class - the storage support of a player's moves, kept as integer masks (64-bit on the 8x8 grid)
+'''
+
+from validation.repositoryValidator import RepositoryValidator
+from utilities.gameConstants import GameConstants
+from utilities.gridView import GridView
+import copy
+import unittest
+
+class BitboardRepository:
+    def __init__(self, rowsNumber = GameConstants.rowsNumber, columnsNumber = GameConstants.columnsNumber):
+        self.__rowsNumber = rowsNumber
+        self.__columnsNumber = columnsNumber
+        self.__planesMask = 0
+        self.__cabinsMask = 0
+        self.__hitPlanesMask = 0
+        self.__shotsMask = 0
+        self.__successfulShotsMask = 0
+
+    def cellBit(self, row, column):
+        '''
+        This function returns the mask bit which represents a cell
+        :param row: the row of the cell
+        :param column: the column of the cell
+        :return: the bit of the cell - integer
+        '''
+        return 1 << (row * self.__columnsNumber + column)
+
+    def initializeNewGame(self):
+        '''
+        This function resets the masks
+        :return: nothing
+        '''
+        self.__planesMask = 0
+        self.__cabinsMask = 0
+        self.__hitPlanesMask = 0
+        self.__shotsMask = 0
+        self.__successfulShotsMask = 0
+
+    def copy(self):
+        '''
+        This function returns an independent copy of the repository (the masks are integers, so nothing else is copied)
+        :return: repository - BitboardRepository
+        '''
+        return copy.copy(self)
+
+    def getRowsNumber(self):
+        '''
+        rowsNumber getter
+        :return: rowsNumber - the number of rows of the grids
+        '''
+        return self.__rowsNumber
+
+    def getColumnsNumber(self):
+        '''
+        columnsNumber getter
+        :return: columnsNumber - the number of columns of the grids
+        '''
+        return self.__columnsNumber
+
+    def getPlanesMask(self):
+        '''
+        This function returns the mask of all the plane cells
+        :return: planesMask - integer
+        '''
+        return self.__planesMask
+
+    def getCabinsMask(self):
+        '''
+        This function returns the mask of the cabins of the planes
+        :return: cabinsMask - integer
+        '''
+        return self.__cabinsMask
+
+    def getHitPlanesMask(self):
+        '''
+        This function returns the mask of the plane cells which have been hit
+        :return: hitPlanesMask - integer
+        '''
+        return self.__hitPlanesMask
+
+    def getShotsMask(self):
+        '''
+        This function returns the mask of the shots taken
+        :return: shotsMask - integer
+        '''
+        return self.__shotsMask
+
+    def getSuccessfulShotsMask(self):
+        '''
+        This function returns the mask of the successful shots
+        :return: successfulShotsMask - integer
+        '''
+        return self.__successfulShotsMask
+
+    def areAllPlaneCellsHit(self):
+        '''
+        This function tells if every plane cell has been hit (this is not the end of the game, which only needs the
+        cabins, see areAllCabinsHit)
+        :return: True if there are no untouched plane cells left
+                 False otherwise
+        '''
+        return self.__planesMask & ~self.__hitPlanesMask == 0
+
+    def areAllCabinsHit(self):
+        '''
+        This function tells if every plane has been destroyed (a plane is destroyed when its cabin is hit)
+        :return: True if there are no untouched cabins left
+                 False otherwise
+        '''
+        return self.__cabinsMask & ~self.__hitPlanesMask == 0
+
+    def getRemainingPlanesNumber(self):
+        '''
+        This function returns the number of planes whose cabin has not been hit
+        :return: planesNumber - integer
+        '''
+        return bin(self.__cabinsMask & ~self.__hitPlanesMask).count("1")
+
+    def getPlanesGrid(self):
+        '''
+        This function returns the matrix of the planes
+        :return: planesGrid - a read-only view of the matrix of planes - GridView
+        '''
+        return GridView([[self.checkPlaneCell(row, column) for column in range(self.__columnsNumber)]
+                         for row in range(self.__rowsNumber)])
+
+    def getShotsGrid(self):
+        '''
+        This function returns the matrix of shots
+        :return: shotsGrid - a read-only view of the matrix of shots - GridView
+        '''
+        grid = []
+        for row in range(self.__rowsNumber):
+            line = []
+            for column in range(self.__columnsNumber):
+                bit = self.cellBit(row, column)
+                if self.__shotsMask & bit == 0:
+                    line.append(-1)
+                elif self.__successfulShotsMask & bit == 0:
+                    line.append(0)
+                else:
+                    line.append(1)
+            grid.append(line)
+        return GridView(grid)
+
+    def addPlane(self, plane):
+        '''
+        This function should add a plane into the storage
+        :param plane: a given plane - Plane
+        :return: nothing
+        '''
+        planeMask = plane.getPlaneMask()
+        if planeMask is None:
+            raise ValueError("Plane cannot be placed in the grid (some parts are out of the grid)")
+        if RepositoryValidator.checkIfMaskOverlaps(planeMask, self.__planesMask) is True:
+            raise ValueError("Plane cannot be placed in the grid (overlaps with an existing plane)")
+        self.__planesMask |= planeMask
+        cabin = GameConstants.cellStringToCoordinates(plane.getCabinLocation())
+        self.__cabinsMask |= self.cellBit(cabin[0], cabin[1])
+
+    def hitCell(self, row, column):
+        '''
+        This function treats a hit to the cell
+        :param row: the row of the cell
+        :param column: the column of the cell
+        :return: nothing
+        '''
+        self.__hitPlanesMask |= self.__planesMask & self.cellBit(row, column)
+
+    def markSuccessfulShot(self, row, column):
+        '''
+        This function marks a successful shot to the shots grid
+        :param row: the row of the cell
+        :param column: the column of the cell
+        :return: nothing
+        '''
+        bit = self.cellBit(row, column)
+        self.__shotsMask |= bit
+        self.__successfulShotsMask |= bit
+
+    def markMissedShot(self, row, column):
+        '''
+        This function marks a miss to the shots grid
+        :param row: the row of the cell
+        :param column: the column of the cell
+        :return: nothing
+        '''
+        bit = self.cellBit(row, column)
+        self.__shotsMask |= bit
+        self.__successfulShotsMask &= ~bit
+
+    def checkPlaneCell(self, row, column):
+        '''
+        This function returns the value in the plane grid of the given cell
+        :param row: row of the cell
+        :param column: column of the cell
+        :return: -1 if the cell is empty
+                 0 if the cell is a hit plane cell
+                 1 if the cell is an untouched plane cell
+        '''
+        bit = self.cellBit(row, column)
+        if self.__planesMask & bit == 0:
+            return -1
+        if self.__hitPlanesMask & bit == 0:
+            return 1
+        return 0
+
+    def isCellUnknown(self, row, column):
+        '''
+        This function tells if the specified cell has been shot
+        :param row: the row of the cell
+        :param column: the column of the cell
+        :return: True if it has not been shot
+                 False otherwise
+        '''
+        return self.__shotsMask & self.cellBit(row, column) == 0
+
+class TestBitboardRepository(unittest.TestCase):
+    def setUp(self):
+        from utilities.matrixGenerator import MatrixGenerator
+        self.repo = BitboardRepository()
+        self.matrix = MatrixGenerator.generateMatrix(8, 8, -1)
+
+    def testInitializeNewGame(self):
+        from model.plane import Plane
+        self.repo.addPlane(Plane("A5", "left"))
+        self.repo.markMissedShot(0, 0)
+        self.repo.initializeNewGame()
+        self.assertEqual(self.repo.getPlanesGrid(), self.matrix)
+        self.assertEqual(self.repo.getShotsGrid(), self.matrix)
+        self.assertEqual(self.repo.getPlanesMask(), 0)
+        self.assertEqual(self.repo.getCabinsMask(), 0)
+        self.assertEqual(self.repo.getShotsMask(), 0)
+
+    def testGetPlanesGridAddPlane(self):
+        from model.plane import Plane
+        self.repo.addPlane(Plane("A5", "left"))
+        matrix = [[-1, -1, -1, -1, -1, -1, -1, -1],
+                  [-1, -1, -1, -1, -1, -1, -1, -1],
+                  [-1, 1, -1, -1, -1, -1, -1, -1],
+                  [-1, 1, -1, 1, -1, -1, -1, -1],
+                  [1, 1, 1, 1, -1, -1, -1, -1],
+                  [-1, 1, -1, 1, -1, -1, -1, -1],
+                  [-1, 1, -1, -1, -1, -1, -1, -1],
+                  [-1, -1, -1, -1, -1, -1, -1, -1]]
+        self.assertEqual(self.repo.getPlanesGrid(), matrix)
+        self.assertEqual(bin(self.repo.getPlanesMask()).count("1"), 10)
+        self.repo.hitCell(3, 1)
+        self.repo.hitCell(0, 0)
+        matrix[3][1] = 0
+        self.assertEqual(self.repo.getPlanesGrid(), matrix)
+        self.assertEqual(self.repo.getHitPlanesMask(), self.repo.cellBit(3, 1))
+        self.assertEqual(self.repo.checkPlaneCell(3, 1), 0)
+        self.assertEqual(self.repo.checkPlaneCell(4, 2), 1)
+        self.assertEqual(self.repo.checkPlaneCell(0, 0), -1)
+        self.assertFalse(self.repo.areAllPlaneCellsHit())
+        self.assertRaises(ValueError, self.repo.addPlane, Plane("C3", "up"))
+
+    def testGetShotsGridMarkShots(self):
+        matrix = self.matrix
+        matrix[3][2] = 1
+        self.repo.markSuccessfulShot(3, 2)
+        self.assertEqual(self.repo.getShotsGrid(), matrix)
+        matrix[3][2] = 0
+        self.repo.markMissedShot(3, 2)
+        self.assertEqual(self.repo.getShotsGrid(), matrix)
+        self.assertEqual(self.repo.getShotsMask(), self.repo.cellBit(3, 2))
+        self.assertEqual(self.repo.getSuccessfulShotsMask(), 0)
+        self.assertTrue(self.repo.isCellUnknown(5, 3))
+        self.assertFalse(self.repo.isCellUnknown(3, 2))
+
+    def testWinCheckMatchesRemainingPlanes(self):
+        from controller.playerController import PlayerController
+        import random
+        controller = PlayerController(self.repo)
+        controller.placePlane("C1", "up")
+        controller.placePlane("F8", "down")
+        self.assertEqual(self.repo.getCabinsMask(), self.repo.cellBit(0, 2) | self.repo.cellBit(7, 5))
+        cells = [(row, column) for row in range(8) for column in range(8)]
+        random.Random(2).shuffle(cells)
+        for cell in cells:
+            controller.checkCell(cell)
+            self.assertEqual(self.repo.getRemainingPlanesNumber(), controller.getRemainingPlanesNumber())
+            self.assertEqual(self.repo.areAllCabinsHit(), controller.getRemainingPlanesNumber() == 0)
+        self.assertTrue(self.repo.areAllCabinsHit())
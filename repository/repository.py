@@ -3,35 +3,67 @@ Repository class - the storage support of a player's moves
 '''
 
 from utilities.matrixGenerator import MatrixGenerator
+from utilities.gameConstants import GameConstants
+from utilities.gridView import GridView
 from validation.repositoryValidator import RepositoryValidator
+import copy
 import unittest
 
 class Repository:
-    def __init__(self):
-        self.__planesGrid = MatrixGenerator.generateMatrix(8, 8, -1)
-        self.__shotsGrid = MatrixGenerator.generateMatrix(8, 8, -1)
+    def __init__(self, rowsNumber = GameConstants.rowsNumber, columnsNumber = GameConstants.columnsNumber):
+        self.__rowsNumber = rowsNumber
+        self.__columnsNumber = columnsNumber
+        self.__planesGrid = MatrixGenerator.generateMatrix(rowsNumber, columnsNumber, -1)
+        self.__shotsGrid = MatrixGenerator.generateMatrix(rowsNumber, columnsNumber, -1)
+        self.__blankRow = [-1] * columnsNumber
 
     def initializeNewGame(self):
         '''
-        This function resets the matrices
+        This function resets the matrices in place (every row is overwritten with a blank row, nothing is allocated)
         :return: nothing
         '''
-        self.__planesGrid = MatrixGenerator.generateMatrix(8, 8, -1)
-        self.__shotsGrid = MatrixGenerator.generateMatrix(8, 8, -1)
+        for row in self.__planesGrid:
+            row[:] = self.__blankRow
+        for row in self.__shotsGrid:
+            row[:] = self.__blankRow
+
+    def copy(self):
+        '''
+        This function returns an independent copy of the repository
+        :return: repository - Repository
+        '''
+        repositoryCopy = copy.copy(self)
+        repositoryCopy.__planesGrid = [row[:] for row in self.__planesGrid]
+        repositoryCopy.__shotsGrid = [row[:] for row in self.__shotsGrid]
+        return repositoryCopy
+
+    def getRowsNumber(self):
+        '''
+        rowsNumber getter
+        :return: rowsNumber - the number of rows of the grids
+        '''
+        return self.__rowsNumber
+
+    def getColumnsNumber(self):
+        '''
+        columnsNumber getter
+        :return: columnsNumber - the number of columns of the grids
+        '''
+        return self.__columnsNumber
 
     def getPlanesGrid(self):
         '''
         This function returns the matrix of the planes
-        :return: planesGrid - the matrix of planes
+        :return: planesGrid - a read-only view of the matrix of planes - GridView
         '''
-        return self.__planesGrid[:]
+        return GridView(self.__planesGrid)
 
     def getShotsGrid(self):
         '''
         This function returns the matrix of shots
-        :return: shotsGrid - the matrix of shots
+        :return: shotsGrid - a read-only view of the matrix of shots - GridView
         '''
-        return self.__shotsGrid[:]
+        return GridView(self.__shotsGrid)
 
     def addPlane(self, plane):
         '''
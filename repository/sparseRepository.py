@@ -0,0 +1,198 @@
+'''
+SparseRepository class - the storage support of a player's moves, keeping only the plane cells and the shot cells
+(the memory of a game depends on the planes and the shots, not on the area of the grid)
+'''
+
+from validation.repositoryValidator import RepositoryValidator
+from utilities.gameConstants import GameConstants
+from utilities.gridView import SparseGridView
+import copy
+import unittest
+
+class SparseRepository:
+    def __init__(self, rowsNumber = GameConstants.rowsNumber, columnsNumber = GameConstants.columnsNumber):
+        self.__rowsNumber = rowsNumber
+        self.__columnsNumber = columnsNumber
+        self.__planeCells = {}
+        self.__shotCells = {}
+
+    def initializeNewGame(self):
+        '''
+        This function forgets the planes and the shots (the dictionaries are emptied in place)
+        :return: nothing
+        '''
+        self.__planeCells.clear()
+        self.__shotCells.clear()
+
+    def copy(self):
+        '''
+        This function returns an independent copy of the repository
+        :return: repository - SparseRepository
+        '''
+        repositoryCopy = copy.copy(self)
+        repositoryCopy.__planeCells = dict(self.__planeCells)
+        repositoryCopy.__shotCells = dict(self.__shotCells)
+        return repositoryCopy
+
+    def getRowsNumber(self):
+        '''
+        rowsNumber getter
+        :return: rowsNumber - the number of rows of the grids
+        '''
+        return self.__rowsNumber
+
+    def getColumnsNumber(self):
+        '''
+        columnsNumber getter
+        :return: columnsNumber - the number of columns of the grids
+        '''
+        return self.__columnsNumber
+
+    def getPlaneCells(self):
+        '''
+        This function returns the stored plane cells
+        :return: a read-only view of (cell, value) pairs - value 1 for an untouched cell, 0 for a hit cell
+        '''
+        return self.__planeCells.items()
+
+    def getShotCells(self):
+        '''
+        This function returns the stored shot cells
+        :return: a read-only view of (cell, value) pairs - value 1 for a successful shot, 0 for a miss
+        '''
+        return self.__shotCells.items()
+
+    def getPlanesGrid(self):
+        '''
+        This function returns the matrix of the planes
+        :return: planesGrid - a read-only view of the matrix of planes (nothing is built) - SparseGridView
+        '''
+        return SparseGridView(self.__planeCells, self.__rowsNumber, self.__columnsNumber)
+
+    def getShotsGrid(self):
+        '''
+        This function returns the matrix of shots
+        :return: shotsGrid - a read-only view of the matrix of shots (nothing is built) - SparseGridView
+        '''
+        return SparseGridView(self.__shotCells, self.__rowsNumber, self.__columnsNumber)
+
+    def addPlane(self, plane):
+        '''
+        This function should add a plane into the storage
+        :param plane: a given plane - Plane
+        :return: nothing
+        '''
+        if plane.getPlacementId() is None:
+            raise ValueError("Plane cannot be placed in the grid (some parts are out of the grid)")
+        if RepositoryValidator.checkIfPlaneOverlapsCells(plane, self.__planeCells) is True:
+            raise ValueError("Plane cannot be placed in the grid (overlaps with an existing plane)")
+        for planeCell in plane.getPlaneCellsList():
+            self.__planeCells[planeCell] = 1
+
+    def hitCell(self, row, column):
+        '''
+        This function treats a hit to the cell
+        :param row: the row of the cell
+        :param column: the column of the cell
+        :return: nothing
+        '''
+        if (row, column) in self.__planeCells:
+            self.__planeCells[(row, column)] = 0
+
+    def markSuccessfulShot(self, row, column):
+        '''
+        This function marks a successful shot to the shots grid
+        :param row: the row of the cell
+        :param column: the column of the cell
+        :return: nothing
+        '''
+        self.__shotCells[(row, column)] = 1
+
+    def markMissedShot(self, row, column):
+        '''
+        This function marks a miss to the shots grid
+        :param row: the row of the cell
+        :param column: the column of the cell
+        :return: nothing
+        '''
+        self.__shotCells[(row, column)] = 0
+
+    def checkPlaneCell(self, row, column):
+        '''
+        This function returns the value in the plane grid of the given cell
+        :param row: row of the cell
+        :param column: column of the cell
+        :return: -1 if the cell is empty
+                 0 if the cell is a hit plane cell
+                 1 if the cell is an untouched plane cell
+        '''
+        return self.__planeCells.get((row, column), -1)
+
+    def isCellUnknown(self, row, column):
+        '''
+        This function tells if the specified cell has been shot
+        :param row: the row of the cell
+        :param column: the column of the cell
+        :return: True if it has not been shot
+                 False otherwise
+        '''
+        return (row, column) not in self.__shotCells
+
+class TestSparseRepository(unittest.TestCase):
+    def setUp(self):
+        from utilities.matrixGenerator import MatrixGenerator
+        self.repo = SparseRepository()
+        self.matrix = MatrixGenerator.generateMatrix(8, 8, -1)
+
+    def testInitializeNewGame(self):
+        from model.plane import Plane
+        self.repo.addPlane(Plane("A5", "left"))
+        self.repo.markMissedShot(0, 0)
+        self.repo.initializeNewGame()
+        self.assertEqual(self.repo.getPlanesGrid(), self.matrix)
+        self.assertEqual(self.repo.getShotsGrid(), self.matrix)
+
+    def testGetPlanesGridAddPlane(self):
+        from model.plane import Plane
+        self.repo.addPlane(Plane("A5", "left"))
+        matrix = [[-1, -1, -1, -1, -1, -1, -1, -1],
+                  [-1, -1, -1, -1, -1, -1, -1, -1],
+                  [-1, 1, -1, -1, -1, -1, -1, -1],
+                  [-1, 1, -1, 1, -1, -1, -1, -1],
+                  [1, 1, 1, 1, -1, -1, -1, -1],
+                  [-1, 1, -1, 1, -1, -1, -1, -1],
+                  [-1, 1, -1, -1, -1, -1, -1, -1],
+                  [-1, -1, -1, -1, -1, -1, -1, -1]]
+        self.assertEqual(self.repo.getPlanesGrid(), matrix)
+        self.repo.hitCell(3, 1)
+        self.repo.hitCell(0, 0)
+        matrix[3][1] = 0
+        self.assertEqual(self.repo.getPlanesGrid(), matrix)
+        self.assertEqual(self.repo.checkPlaneCell(3, 1), 0)
+        self.assertEqual(self.repo.checkPlaneCell(4, 2), 1)
+        self.assertEqual(self.repo.checkPlaneCell(0, 0), -1)
+        self.assertEqual(len(self.repo.getPlaneCells()), 10)
+        self.assertRaises(ValueError, self.repo.addPlane, Plane("C3", "up"))
+        self.assertRaises(ValueError, self.repo.addPlane, Plane("A5", "right"))
+
+    def testGetShotsGridMarkShots(self):
+        matrix = self.matrix
+        matrix[3][2] = 1
+        self.repo.markSuccessfulShot(3, 2)
+        self.assertEqual(self.repo.getShotsGrid(), matrix)
+        matrix[3][2] = 0
+        self.repo.markMissedShot(3, 2)
+        self.assertEqual(self.repo.getShotsGrid(), matrix)
+        self.assertEqual(list(self.repo.getShotCells()), [((3, 2), 0)])
+        self.assertTrue(self.repo.isCellUnknown(5, 3))
+        self.assertFalse(self.repo.isCellUnknown(3, 2))
+
+    def testLargeGrid(self):
+        from model.plane import Plane
+        from utilities.placementTable import PlacementTable
+        repo = SparseRepository(100000, 100000)
+        repo.addPlane(Plane("ZZ500", "down", PlacementTable.forBoard(100000, 100000)))
+        repo.markMissedShot(99999, 99999)
+        self.assertEqual(len(repo.getPlaneCells()) + len(repo.getShotCells()), 11)
+        self.assertEqual(repo.checkPlaneCell(499, 701), 1)
+        self.assertFalse(repo.isCellUnknown(99999, 99999))
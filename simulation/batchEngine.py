@@ -0,0 +1,333 @@
+'''
+BatchEngine class - plays thousands of hunt versus hunt games in lockstep, keeping every board as a uint64 bitboard
+in NumPy arrays (the bitboards hold the standard 8x8 grid). Both sides follow the hunt targeting of ComputerController
+step by step (the queue of the neighbors of the hits, the unknown cells and the draws of every game's own CompactRandom
+stream), so a game of the batch is the game SelfPlay.playGame plays from the same seed.
+'''
+
+from utilities.compactRandom import CompactRandom
+from utilities.gameConstants import GameConstants
+from utilities.layoutSampler import LayoutSampler
+from utilities.placementTable import placementTable
+import numpy
+import argparse
+import random
+import time
+import unittest
+
+class BatchEngine:
+    winnerNames = ["none", "player", "computer"]
+    hitResultNames = ["miss", "hit", "cabin"]
+    sideNames = ["player", "computer"]
+    cellsNumber = 64
+    __directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+    __bitLengths = numpy.array([number.bit_length() for number in range(65)], dtype = numpy.uint64)
+    __multiplier = numpy.uint64(0x2545F4914F6CDD1D)
+
+    def __init__(self, layouts, randomStates, table = placementTable):
+        '''
+        The initialiser of the BatchEngine object
+        :param layouts: the placement ids of the planes - (G, 2, K) integer array, side 0 being the player's planes
+                        and side 1 the computer's planes
+        :param randomStates: the CompactRandom states the two sides target with once the planes are placed - (G, 2)
+                             array of non-zero 64-bit integers, side 0 being the state of the computer which drives the
+                             player side
+        :param table: the placements of the grid - PlacementTable (a ValueError is raised unless the grid is 8x8, the
+                      only one the 64-bit bitboards describe)
+        '''
+        if (table.getRowsNumber(), table.getColumnsNumber()) != (8, 8):
+            raise ValueError("The batch engine only plays on the 8x8 grid")
+        layouts = numpy.asarray(layouts)
+        placementIds = range(table.getPlacementsNumber())
+        masks = numpy.array([table.getMask(placementId) for placementId in placementIds], dtype = numpy.uint64)
+        cabinBits = numpy.array([1 << (table.getCabin(placementId)[0] * 8 + table.getCabin(placementId)[1])
+                                 for placementId in placementIds], dtype = numpy.uint64)
+        self.__planesMasks = numpy.bitwise_or.reduce(masks[layouts], axis = 2)
+        self.__cabinsMasks = numpy.bitwise_or.reduce(cabinBits[layouts], axis = 2)
+        self.__planesNumber = layouts.shape[2]
+        self.__randomStates = numpy.array(randomStates, dtype = numpy.uint64).reshape(-1, 2)
+
+    @staticmethod
+    def generateGames(seeds, planesNumber = GameConstants.planesNumber):
+        '''
+        This function places the planes of games from their seeds, drawing everything the way SelfPlay.playGame does
+        :param seeds: the seeds of the games - iterable of integers
+        :param planesNumber: the number of planes of every side - integer
+        :return: layouts - (G, 2, K) array, randomStates - (G, 2) array (see the initialiser)
+        '''
+        layoutSampler = LayoutSampler(planesNumber)
+        layouts = []
+        randomStates = []
+        for seed in seeds:
+            seedGenerator = random.Random(seed)
+            playerRandom = CompactRandom(seedGenerator.getrandbits(64))
+            computerRandom = CompactRandom(seedGenerator.getrandbits(64))
+            computerLayout = layoutSampler.sample(computerRandom)
+            layouts.append([layoutSampler.sample(playerRandom), computerLayout])
+            randomStates.append([playerRandom.getstate(), computerRandom.getstate()])
+        return numpy.array(layouts, dtype = numpy.int32), numpy.array(randomStates, dtype = numpy.uint64)
+
+    @staticmethod
+    def __nextWords(states, games):
+        '''
+        This function advances the xorshift64* states of some games (the same steps as CompactRandom)
+        :param states: the states of one side - (G,) uint64 array, updated in place
+        :param games: the indexes of the games which draw - integer array without duplicates
+        :return: words - uint64 array with the next 64 random bits of every game
+        '''
+        state = states[games]
+        state ^= state >> numpy.uint64(12)
+        state ^= state << numpy.uint64(25)
+        state ^= state >> numpy.uint64(27)
+        states[games] = state
+        return state * BatchEngine.__multiplier
+
+    @staticmethod
+    def __randomBelow(states, games, bounds):
+        '''
+        This function draws a random integer below a bound for some games, like randrange does on a CompactRandom (the
+        draws which are not below the bound are rejected and drawn again)
+        :param states: the states of one side - (G,) uint64 array, updated in place
+        :param games: the indexes of the games which draw - integer array without duplicates
+        :param bounds: the bound of every game - integer array between 1 and 64
+        :return: numbers - int64 array
+        '''
+        bounds = numpy.asarray(bounds, dtype = numpy.uint64)
+        shifts = numpy.uint64(64) - BatchEngine.__bitLengths[bounds]
+        numbers = numpy.zeros(len(games), dtype = numpy.uint64)
+        pending = numpy.arange(len(games))
+        while pending.size > 0:
+            words = BatchEngine.__nextWords(states, games[pending]) >> shifts[pending]
+            accepted = words < bounds[pending]
+            numbers[pending[accepted]] = words[accepted]
+            pending = pending[~accepted]
+        return numbers.astype(numpy.int64)
+
+    def __chooseUnknownCells(self, shooter, games):
+        '''
+        This function draws a random unknown cell for some games, like UnknownCells.choice: a row and a column until
+        the cell is unknown while less than half of the grid is known, an item of the unknown cells list afterwards
+        :return: cells - int64 array
+        '''
+        states = self.__states[shooter]
+        cells = numpy.zeros(len(games), dtype = numpy.int64)
+        isListed = self.__knownNumbers[shooter, games] * 2 >= BatchEngine.cellsNumber
+        listed = numpy.flatnonzero(isListed)
+        indexes = BatchEngine.__randomBelow(states, games[listed], self.__unknownSizes[shooter, games[listed]])
+        cells[listed] = self.__unknownItems[shooter, games[listed], indexes]
+        pending = numpy.flatnonzero(~isListed)
+        while pending.size > 0:
+            rows = BatchEngine.__randomBelow(states, games[pending], numpy.full(pending.size, 8))
+            columns = BatchEngine.__randomBelow(states, games[pending], numpy.full(pending.size, 8))
+            candidates = rows * 8 + columns
+            isKnown = ((self.__knownMasks[shooter, games[pending]] >> candidates.astype(numpy.uint64)) & numpy.uint64(1)) != 0
+            cells[pending[~isKnown]] = candidates[~isKnown]
+            pending = pending[isKnown]
+        return cells
+
+    def __popQueues(self, shooter, games):
+        '''
+        This function pops the first queued cell which is still unknown for some games, like Queue.pop
+        :return: cells - int64 array (-1 for the games whose queue has no unknown cell)
+        '''
+        cells = numpy.full(len(games), -1, dtype = numpy.int64)
+        pending = numpy.arange(len(games))
+        while True:
+            pending = pending[self.__queueHeads[shooter, games[pending]] < self.__queueTails[shooter, games[pending]]]
+            if pending.size == 0:
+                return cells
+            pendingGames = games[pending]
+            candidates = self.__queueCells[shooter, pendingGames, self.__queueHeads[shooter, pendingGames]].astype(numpy.int64)
+            bits = numpy.uint64(1) << candidates.astype(numpy.uint64)
+            self.__queueHeads[shooter, pendingGames] += 1
+            self.__queuedMasks[shooter, pendingGames] &= ~bits
+            isKnown = (self.__knownMasks[shooter, pendingGames] & bits) != 0
+            cells[pending[~isKnown]] = candidates[~isKnown]
+            pending = pending[isKnown]
+
+    def __markKnown(self, shooter, games, cells):
+        '''
+        This function marks the shot cells as known, like UnknownCells.remove: the cells are only counted while less
+        than half of the grid is known, then the unknown cells are listed in row-major order and every later cell is
+        replaced by the last one of the list
+        :return: nothing
+        '''
+        isListed = self.__knownNumbers[shooter, games] * 2 >= BatchEngine.cellsNumber
+        listedGames = games[isListed]
+        positions = self.__unknownPositions[shooter, listedGames, cells[isListed]]
+        self.__unknownSizes[shooter, listedGames] -= 1
+        lastItems = self.__unknownItems[shooter, listedGames, self.__unknownSizes[shooter, listedGames]]
+        self.__unknownItems[shooter, listedGames, positions] = lastItems
+        self.__unknownPositions[shooter, listedGames, lastItems] = positions
+        self.__knownMasks[shooter, games] |= numpy.uint64(1) << cells.astype(numpy.uint64)
+        self.__knownNumbers[shooter, games] += 1
+        newlyListed = games[~isListed & (self.__knownNumbers[shooter, games] * 2 >= BatchEngine.cellsNumber)]
+        if newlyListed.size == 0:
+            return
+        cellBits = numpy.uint64(1) << numpy.arange(BatchEngine.cellsNumber, dtype = numpy.uint64)
+        isUnknown = (self.__knownMasks[shooter, newlyListed][:, None] & cellBits) == 0
+        items = numpy.argsort(~isUnknown, axis = 1, kind = "stable")
+        self.__unknownItems[shooter, newlyListed] = items
+        self.__unknownPositions[shooter, newlyListed[:, None], items] = numpy.arange(BatchEngine.cellsNumber)
+        self.__unknownSizes[shooter, newlyListed] = isUnknown.sum(axis = 1)
+
+    def __enqueueNeighbors(self, shooter, games, cells):
+        '''
+        This function pushes the unknown neighbors of the hit cells which are not queued yet, like enqueueNeighbors
+        (up, down, left, then right)
+        :return: nothing
+        '''
+        for rowStep, columnStep in BatchEngine.__directions:
+            rows = cells // 8 + rowStep
+            columns = cells % 8 + columnStep
+            isInside = (rows >= 0) & (rows < 8) & (columns >= 0) & (columns < 8)
+            neighbors = numpy.where(isInside, rows * 8 + columns, 0)
+            bits = numpy.uint64(1) << neighbors.astype(numpy.uint64)
+            isPushed = isInside & (((self.__knownMasks[shooter, games] | self.__queuedMasks[shooter, games]) & bits) == 0)
+            pushedGames = games[isPushed]
+            self.__queueCells[shooter, pushedGames, self.__queueTails[shooter, pushedGames]] = neighbors[isPushed]
+            self.__queueTails[shooter, pushedGames] += 1
+            self.__queuedMasks[shooter, pushedGames] |= bits[isPushed]
+
+    def __shoot(self, shooter, games, shotIndex):
+        '''
+        This function plays one hunt shot of a side in some games: the shooter picks its cell, the other side answers
+        like checkCell and the shooter registers the result like registerHitResult
+        :return: nothing
+        '''
+        side = 1 - shooter
+        cells = self.__popQueues(shooter, games)
+        isDrawn = cells == -1
+        cells[isDrawn] = self.__chooseUnknownCells(shooter, games[isDrawn])
+        shotBits = numpy.uint64(1) << cells.astype(numpy.uint64)
+        isPlane = (self.__planesMasks[games, side] & shotBits) != 0
+        wasHit = (self.__hitMasks[games, side] & shotBits) != 0
+        isCabin = (self.__cabinsMasks[games, side] & shotBits) != 0
+        hitResults = numpy.where(isPlane, numpy.where(wasHit | isCabin, 2, 1), 0)
+        self.__hitMasks[games, side] |= numpy.where(isPlane, shotBits, numpy.uint64(0))
+        self.__remainingPlanes[games, side] -= (isPlane & ~wasHit & isCabin).astype(numpy.int16)
+        self.__cells[games, shooter, shotIndex] = cells
+        self.__results[games, shooter, shotIndex] = hitResults
+        self.__markKnown(shooter, games, cells)
+        self.__enqueueNeighbors(shooter, games[hitResults == 1], cells[hitResults == 1])
+        cabinGames = games[hitResults == 2]
+        self.__queueHeads[shooter, cabinGames] = 0
+        self.__queueTails[shooter, cabinGames] = 0
+        self.__queuedMasks[shooter, cabinGames] = 0
+
+    def run(self):
+        '''
+        This function plays all the games: in every round each active game gets a player shot then a computer shot,
+        and the winner is checked after the round, like in SelfPlay
+        :return: winners - (G,) array of indexes in winnerNames
+                 shotsNumbers - (G,) array with the number of shots of every game
+                 cells - (G, 2, 64) array with the shot cells (row * 8 + column, -1 for shots which were not fired)
+                 results - (G, 2, 64) array of indexes in hitResultNames (-1 for shots which were not fired)
+        '''
+        gamesNumber = self.__planesMasks.shape[0]
+        self.__states = self.__randomStates.T.copy()
+        self.__hitMasks = numpy.zeros((gamesNumber, 2), dtype = numpy.uint64)
+        self.__remainingPlanes = numpy.full((gamesNumber, 2), self.__planesNumber, dtype = numpy.int16)
+        self.__knownMasks = numpy.zeros((2, gamesNumber), dtype = numpy.uint64)
+        self.__knownNumbers = numpy.zeros((2, gamesNumber), dtype = numpy.int16)
+        self.__unknownItems = numpy.zeros((2, gamesNumber, BatchEngine.cellsNumber), dtype = numpy.int64)
+        self.__unknownPositions = numpy.zeros((2, gamesNumber, BatchEngine.cellsNumber), dtype = numpy.int64)
+        self.__unknownSizes = numpy.zeros((2, gamesNumber), dtype = numpy.int64)
+        self.__queueCells = numpy.zeros((2, gamesNumber, BatchEngine.cellsNumber), dtype = numpy.int8)
+        self.__queueHeads = numpy.zeros((2, gamesNumber), dtype = numpy.int64)
+        self.__queueTails = numpy.zeros((2, gamesNumber), dtype = numpy.int64)
+        self.__queuedMasks = numpy.zeros((2, gamesNumber), dtype = numpy.uint64)
+        self.__cells = numpy.full((gamesNumber, 2, BatchEngine.cellsNumber), -1, dtype = numpy.int8)
+        self.__results = numpy.full((gamesNumber, 2, BatchEngine.cellsNumber), -1, dtype = numpy.int8)
+        winners = numpy.zeros(gamesNumber, dtype = numpy.int8)
+        shotsNumbers = numpy.zeros(gamesNumber, dtype = numpy.int32)
+        games = numpy.arange(gamesNumber)
+        for shotIndex in range(BatchEngine.cellsNumber):
+            self.__shoot(0, games, shotIndex)
+            self.__shoot(1, games, shotIndex)
+            shotsNumbers[games] += 2
+            playerWins = self.__remainingPlanes[games, 1] == 0
+            computerWins = ~playerWins & (self.__remainingPlanes[games, 0] == 0)
+            winners[games[playerWins]] = 1
+            winners[games[computerWins]] = 2
+            games = games[~(playerWins | computerWins)]
+            if games.size == 0:
+                break
+        return winners, shotsNumbers, self.__cells, self.__results
+
+    @staticmethod
+    def getMoves(cells, results):
+        '''
+        This function lists the moves of one game in the format of SelfPlay
+        :param cells: the shot cells of the game - (2, 64) array (see run)
+        :param results: the hit results of the game - (2, 64) array (see run)
+        :return: moves - list of [shooter, cell string, hit result] lists, in the order they were played
+        '''
+        moves = []
+        for shotIndex in range(BatchEngine.cellsNumber):
+            for shooter in range(2):
+                cell = int(cells[shooter, shotIndex])
+                if cell != -1:
+                    moves.append([BatchEngine.sideNames[shooter], GameConstants.coordinatesToCellString(cell // 8, cell % 8),
+                                  BatchEngine.hitResultNames[results[shooter, shotIndex]]])
+        return moves
+
+    @staticmethod
+    def main(arguments = None):
+        '''
+        This function measures the batch throughput against SelfPlay from the command line
+        :param arguments: the command line arguments - list of strings (sys.argv if None)
+        :return: nothing
+        '''
+        from simulation.selfPlay import SelfPlay
+        parser = argparse.ArgumentParser(description = "Lockstep batch hunt versus hunt Planes games")
+        parser.add_argument("--games", type = int, default = 10000)
+        parser.add_argument("--scalar-games", type = int, default = 1000)
+        parser.add_argument("--seed", type = int, default = 0)
+        options = parser.parse_args(arguments)
+        startTime = time.perf_counter()
+        layouts, randomStates = BatchEngine.generateGames(range(options.seed, options.seed + options.games))
+        winners, shotsNumbers, cells, results = BatchEngine(layouts, randomStates).run()
+        batchTime = time.perf_counter() - startTime
+        scalarGamesNumber = max(min(options.scalar_games, options.games), 1)
+        startTime = time.perf_counter()
+        for seed in range(options.seed, options.seed + scalarGamesNumber):
+            SelfPlay.playGame(seed)
+        scalarTime = (time.perf_counter() - startTime) / scalarGamesNumber
+        print("batch: {:.0f} games/s, scalar: {:.0f} games/s, player won {:.1%}, {:.1f} shots per game".format(
+            options.games / batchTime, 1 / scalarTime, (winners == 1).mean(), shotsNumbers.mean()))
+
+class TestBatchEngine(unittest.TestCase):
+    def testMatchesSelfPlay(self):
+        from simulation.selfPlay import SelfPlay
+        seeds = range(300)
+        winners, shotsNumbers, cells, results = BatchEngine(*BatchEngine.generateGames(seeds)).run()
+        for gameIndex, seed in enumerate(seeds):
+            result = SelfPlay.playGame(seed)
+            self.assertEqual(BatchEngine.winnerNames[winners[gameIndex]], result["winner"])
+            self.assertEqual(shotsNumbers[gameIndex], result["shots"])
+            self.assertEqual(BatchEngine.getMoves(cells[gameIndex], results[gameIndex]), result["moves"])
+
+    def testLongGamesListTheUnknownCells(self):
+        winners, shotsNumbers, cells, results = BatchEngine(*BatchEngine.generateGames(range(300))).run()
+        self.assertGreater(shotsNumbers.max(), BatchEngine.cellsNumber)
+        for gameIndex in range(300):
+            for shooter in range(2):
+                shotCells = [cell for cell in cells[gameIndex, shooter] if cell != -1]
+                self.assertEqual(len(shotCells), len(set(shotCells)))
+
+    def testGenerateGamesIsSeeded(self):
+        firstLayouts, firstRandomStates = BatchEngine.generateGames([4, 5])
+        secondLayouts, secondRandomStates = BatchEngine.generateGames([4, 5])
+        self.assertTrue((firstLayouts == secondLayouts).all())
+        self.assertTrue((firstRandomStates == secondRandomStates).all())
+        self.assertFalse((firstRandomStates[0] == firstRandomStates[1]).any())
+
+    def testOnlyTheStandardGrid(self):
+        from utilities.placementTable import PlacementTable
+        layouts, randomStates = BatchEngine.generateGames([1])
+        for rowsNumber, columnsNumber in [(9, 7), (4, 16), (10, 10)]:
+            self.assertRaises(ValueError, BatchEngine, layouts, randomStates, PlacementTable.forBoard(rowsNumber, columnsNumber))
+
+if __name__ == "__main__":
+    BatchEngine.main()
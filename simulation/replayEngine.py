@@ -0,0 +1,157 @@
+'''
+ReplayEngine class - rebuilds the game of a move log at any move, starting from the nearest checkpoint (a copy of the
+game kept every checkpointInterval moves) instead of the first move
+'''
+
+from repository.repository import Repository
+from controller.playerController import PlayerController
+from controller.computerController import ComputerController
+from controller.gameController import GameController
+from utilities.compactRandom import CompactRandom
+from utilities.gameConstants import GameConstants
+from utilities.moveLog import MoveLog
+from utilities.placementTable import PlacementTable
+import random
+import unittest
+
+class ReplayEngine:
+    def __init__(self, moveLog, checkpointInterval = 32, targetingMode = "hunt", repositoryClass = Repository):
+        '''
+        The initialiser of the ReplayEngine object (the checkpoints are made while the log is replayed for the first
+        time, so the log may keep growing)
+        :param moveLog: the replayed history - MoveLog
+        :param checkpointInterval: the number of moves between two checkpoints - positive integer
+        :param targetingMode: the targeting mode of the rebuilt computer - "hunt", "density" or "exact"
+        :param repositoryClass: the storage of the rebuilt grids - Repository, BitboardRepository or SparseRepository
+        '''
+        if checkpointInterval < 1:
+            raise ValueError("Invalid checkpoint interval")
+        self.__moveLog = moveLog
+        self.__checkpointInterval = checkpointInterval
+        self.__targetingMode = targetingMode
+        self.__repositoryClass = repositoryClass
+        self.__checkpoints = []
+        self.__frontier = None
+        self.__frontierMovesNumber = 0
+
+    def getMovesNumber(self):
+        return self.__moveLog.getMovesNumber()
+
+    def getCheckpointsNumber(self):
+        return len(self.__checkpoints)
+
+    def __createGame(self):
+        '''
+        This function creates the game of the log before its first shot (every plane is placed)
+        :return: gameController - GameController
+        '''
+        rowsNumber = self.__moveLog.getRowsNumber()
+        columnsNumber = self.__moveLog.getColumnsNumber()
+        table = PlacementTable.forBoard(rowsNumber, columnsNumber)
+        playerController = PlayerController(self.__repositoryClass(rowsNumber, columnsNumber))
+        computerController = ComputerController(self.__repositoryClass(rowsNumber, columnsNumber), CompactRandom(0),
+                                                self.__moveLog.getPlanesNumber(), self.__targetingMode)
+        for controller, side in [(playerController, "player"), (computerController, "computer")]:
+            for placementId in self.__moveLog.getPlacements(side):
+                cabin = table.getCabin(placementId)
+                controller.placePlane(GameConstants.coordinatesToCellString(cabin[0], cabin[1]),
+                                      table.getOrientation(placementId))
+        return GameController(playerController, computerController)
+
+    def __applyMove(self, gameController, moveIndex):
+        '''
+        This function replays a move of the log
+        :param gameController: the game before the move - GameController
+        :param moveIndex: the index of the move - integer
+        :return: nothing (a ValueError is raised if the game gives another result than the logged one)
+        '''
+        shooter, cell, hitResult = self.__moveLog.getMove(moveIndex)
+        if shooter == "player":
+            replayedResult = gameController.makePlayerHit(GameConstants.coordinatesToCellString(cell[0], cell[1]))
+        else:
+            replayedResult = gameController.makeComputerHit(cell)[0]
+        if replayedResult != hitResult:
+            raise ValueError("Move {} is logged as {} but the game gives {}".format(moveIndex, hitResult, replayedResult))
+
+    def __advanceFrontier(self, moveIndex):
+        '''
+        This function replays the log up to a move for the first time, keeping a checkpoint every checkpointInterval
+        moves
+        :param moveIndex: the number of moves to be replayed - integer
+        :return: nothing
+        '''
+        if self.__frontier is None:
+            self.__frontier = self.__createGame()
+        while True:
+            if self.__frontierMovesNumber == len(self.__checkpoints) * self.__checkpointInterval:
+                self.__checkpoints.append(self.__frontier.copy())
+            if self.__frontierMovesNumber == moveIndex:
+                return
+            self.__applyMove(self.__frontier, self.__frontierMovesNumber)
+            self.__frontierMovesNumber += 1
+
+    def seek(self, moveIndex):
+        '''
+        This function rebuilds the game after a number of moves
+        :param moveIndex: the number of replayed moves (0 for the game before the first shot) - integer
+        :return: gameController - a new GameController, which can be played on
+        '''
+        if not 0 <= moveIndex <= self.__moveLog.getMovesNumber():
+            raise ValueError("Invalid move index")
+        if moveIndex >= self.__frontierMovesNumber:
+            self.__advanceFrontier(moveIndex)
+            return self.__frontier.copy()
+        checkpointIndex = moveIndex // self.__checkpointInterval
+        gameController = self.__checkpoints[checkpointIndex].copy()
+        for index in range(checkpointIndex * self.__checkpointInterval, moveIndex):
+            self.__applyMove(gameController, index)
+        return gameController
+
+class TestReplayEngine(unittest.TestCase):
+    def setUp(self):
+        randomGenerator = random.Random(4)
+        self.moveLog = MoveLog(8, 8, 2)
+        gameController = GameController(PlayerController(Repository()),
+                                        ComputerController(Repository(), CompactRandom(4)), self.moveLog)
+        gameController.initializeNewGame()
+        gameController.placePlayerPlane("C1", "up")
+        gameController.placePlayerPlane("F8", "down")
+        cells = [(row, column) for row in range(8) for column in range(8)]
+        randomGenerator.shuffle(cells)
+        self.grids = [(gameController.getPlayerShotsGrid().toList(), gameController.getPlayerPlanesGrid().toList())]
+        for cell in cells:
+            gameController.makePlayerHit(GameConstants.coordinatesToCellString(cell[0], cell[1]))
+            self.grids.append((gameController.getPlayerShotsGrid().toList(),
+                               gameController.getPlayerPlanesGrid().toList()))
+            gameController.makeComputerHit()
+            self.grids.append((gameController.getPlayerShotsGrid().toList(),
+                               gameController.getPlayerPlanesGrid().toList()))
+            if gameController.getGameWinner() != "none":
+                break
+
+    def testSeek(self):
+        engine = ReplayEngine(MoveLog.fromBytes(self.moveLog.toBytes()), 8)
+        movesNumber = engine.getMovesNumber()
+        self.assertEqual(movesNumber, len(self.grids) - 1)
+        for moveIndex in [movesNumber, 0, 1, 7, 8, 9, movesNumber - 1, movesNumber // 2]:
+            gameController = engine.seek(moveIndex)
+            self.assertEqual(gameController.getPlayerShotsGrid(), self.grids[moveIndex][0])
+            self.assertEqual(gameController.getPlayerPlanesGrid(), self.grids[moveIndex][1])
+        self.assertEqual(engine.getCheckpointsNumber(), movesNumber // 8 + 1)
+        self.assertNotEqual(engine.seek(movesNumber).getGameWinner(), "none")
+        self.assertRaises(ValueError, engine.seek, movesNumber + 1)
+
+    def testSeekedGamesAreIndependent(self):
+        engine = ReplayEngine(self.moveLog, 4)
+        gameController = engine.seek(5)
+        gameController.makeComputerHit()
+        self.assertEqual(engine.seek(5).getPlayerShotsGrid(), self.grids[5][0])
+
+    def testTamperedLog(self):
+        tamperedLog = MoveLog(8, 8, 2)
+        for side in MoveLog.shooters:
+            for placementId in self.moveLog.getPlacements(side):
+                tamperedLog.appendPlacement(side, placementId)
+        shooter, cell, hitResult = self.moveLog.getMove(0)
+        tamperedLog.appendShot(shooter, cell, "cabin" if hitResult != "cabin" else "miss")
+        self.assertRaises(ValueError, ReplayEngine(tamperedLog).seek, 1)
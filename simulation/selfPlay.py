@@ -0,0 +1,194 @@
+'''
+SelfPlay class - plays headless computer versus computer games, spread across a process pool
+'''
+
+from repository.repository import Repository
+from controller.playerController import PlayerController
+from controller.computerController import ComputerController
+from controller.gameController import GameController
+from controller.sessionPool import SessionPool
+from utilities.compactRandom import CompactRandom
+from utilities.gameConstants import GameConstants
+from utilities.layoutSampler import LayoutSampler
+from utilities.placementTable import placementTable
+from functools import partial
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import unittest
+
+class SelfPlay:
+    __sessionPools = {}
+
+    @staticmethod
+    def __createSession(playerTargeting, computerTargeting):
+        '''
+        This function builds the objects of a game: the game itself, the computer which drives the player side and
+        the random generators of both sides (CompactRandom, like the default generator of the computer)
+        :return: gameController, playerBrain, playerRandom, computerRandom
+        '''
+        playerRandom = CompactRandom()
+        computerRandom = CompactRandom()
+        playerController = PlayerController(Repository())
+        computerController = ComputerController(Repository(), computerRandom, targetingMode = computerTargeting)
+        gameController = GameController(playerController, computerController)
+        playerBrain = ComputerController(Repository(), playerRandom, targetingMode = playerTargeting)
+        return gameController, playerBrain, playerRandom, computerRandom
+
+    @staticmethod
+    def playGame(seed, playerTargeting = "hunt", computerTargeting = "hunt"):
+        '''
+        This function plays a complete game in which the player side is driven by a computer as well (the objects of
+        the game come from a pool, so consecutive games reset them in place)
+        :param seed: the seed of the game - every random choice (placement and targeting) derives from it
+        :param playerTargeting: the targeting mode of the player side - "hunt", "density" or "exact"
+        :param computerTargeting: the targeting mode of the computer side - "hunt", "density" or "exact"
+        :return: result - dictionary with the seed, the winner, the shots number and the moves list
+                          (every move is a [shooter, cell string, hit result] list)
+        '''
+        key = (playerTargeting, computerTargeting)
+        if key not in SelfPlay.__sessionPools:
+            SelfPlay.__sessionPools[key] = SessionPool(partial(SelfPlay.__createSession, playerTargeting,
+                                                               computerTargeting))
+        session = SelfPlay.__sessionPools[key].acquire()
+        try:
+            return SelfPlay.__playSession(session, seed)
+        finally:
+            SelfPlay.__sessionPools[key].release(session)
+
+    @staticmethod
+    def __playSession(session, seed):
+        gameController, playerBrain, playerRandom, computerRandom = session
+        seedGenerator = random.Random(seed)
+        playerRandom.seed(seedGenerator.getrandbits(64))
+        computerRandom.seed(seedGenerator.getrandbits(64))
+        gameController.initializeNewGame()
+        playerBrain.initializeNewGame()
+        for placementId in LayoutSampler().sample(playerRandom):
+            cabin = placementTable.getCabin(placementId)
+            gameController.placePlayerPlane(GameConstants.coordinatesToCellString(cabin[0], cabin[1]),
+                                            placementTable.getOrientation(placementId))
+        moves = []
+        winner = "none"
+        while winner == "none":
+            cellPosition = playerBrain.getNextHit()
+            cellString = GameConstants.coordinatesToCellString(cellPosition[0], cellPosition[1])
+            hitResult = gameController.makePlayerHit(cellString)
+            playerBrain.registerHitResult(cellPosition, hitResult)
+            moves.append(["player", cellString, hitResult])
+            hitResult = gameController.makeComputerHit()[0]
+            cellPosition = gameController.getLastComputerHitCell()
+            moves.append(["computer", GameConstants.coordinatesToCellString(cellPosition[0], cellPosition[1]), hitResult])
+            winner = gameController.getGameWinner()
+        return {"seed": seed, "winner": winner, "shots": len(moves), "moves": moves}
+
+    @staticmethod
+    def playGames(seeds, playerTargeting = "hunt", computerTargeting = "hunt"):
+        '''
+        This function plays a batch of games (the unit of work of a pool process)
+        :param seeds: the seeds of the games - iterable of integers
+        :param playerTargeting: the targeting mode of the player side - "hunt", "density" or "exact"
+        :param computerTargeting: the targeting mode of the computer side - "hunt", "density" or "exact"
+        :return: results - list of game results
+        '''
+        return [SelfPlay.playGame(seed, playerTargeting, computerTargeting) for seed in seeds]
+
+    @staticmethod
+    def run(gamesNumber, firstSeed = 0, processesNumber = None, chunkSize = 256, playerTargeting = "hunt",
+            computerTargeting = "hunt"):
+        '''
+        This function plays games on a process pool and streams their results as soon as their batch is done
+        :param gamesNumber: the number of games - integer
+        :param firstSeed: the seed of the first game, the following games use the next seeds - integer
+        :param processesNumber: the number of processes (all the cores if None, no pool at all if 1)
+        :param chunkSize: the number of games sent to a process at once - integer
+        :param playerTargeting: the targeting mode of the player side - "hunt", "density" or "exact"
+        :param computerTargeting: the targeting mode of the computer side - "hunt", "density" or "exact"
+        :return: generator of game results (in batch completion order)
+        '''
+        chunks = (range(start, min(start + chunkSize, firstSeed + gamesNumber))
+                  for start in range(firstSeed, firstSeed + gamesNumber, chunkSize))
+        playGames = partial(SelfPlay.playGames, playerTargeting = playerTargeting, computerTargeting = computerTargeting)
+        if processesNumber == 1:
+            for chunk in chunks:
+                yield from playGames(chunk)
+            return
+        from multiprocessing import Pool
+        with Pool(processesNumber) as pool:
+            for results in pool.imap_unordered(playGames, chunks):
+                yield from results
+
+    @staticmethod
+    def formatReport(gamesNumber, playerWins, totalShots, elapsedTime, processesNumber):
+        '''
+        This function builds the throughput report of a run
+        :param gamesNumber: the number of played games - integer
+        :param playerWins: the number of games won by the player side - integer
+        :param totalShots: the number of shots of all the games - integer
+        :param elapsedTime: the duration of the run in seconds - float
+        :param processesNumber: the number of processes used - integer
+        :return: report - string
+        '''
+        gamesPerSecond = gamesNumber / elapsedTime if elapsedTime > 0 else 0.0
+        return ("{} games in {:.2f}s: {:.0f} games/s, {:.0f} games/s per core ({} processes), "
+                "player won {:.1%}, {:.1f} shots per game").format(
+            gamesNumber, elapsedTime, gamesPerSecond, gamesPerSecond / processesNumber, processesNumber,
+            playerWins / max(gamesNumber, 1), totalShots / max(gamesNumber, 1))
+
+    @staticmethod
+    def main(arguments = None):
+        '''
+        This function runs the simulation from the command line, writing one JSON line per game
+        :param arguments: the command line arguments - list of strings (sys.argv if None)
+        :return: nothing
+        '''
+        parser = argparse.ArgumentParser(description = "Headless computer versus computer Planes games")
+        parser.add_argument("--games", type = int, default = 1000)
+        parser.add_argument("--seed", type = int, default = 0)
+        parser.add_argument("--processes", type = int, default = os.cpu_count())
+        parser.add_argument("--chunk-size", type = int, default = 256)
+        parser.add_argument("--player-targeting", choices = ["hunt", "density", "exact"], default = "hunt")
+        parser.add_argument("--computer-targeting", choices = ["hunt", "density", "exact"], default = "hunt")
+        parser.add_argument("--output", help = "file which receives the JSON lines (nothing is written if missing)")
+        options = parser.parse_args(arguments)
+        output = open(options.output, "w") if options.output is not None else None
+        playerWins = totalShots = 0
+        startTime = time.perf_counter()
+        try:
+            for result in SelfPlay.run(options.games, options.seed, options.processes, options.chunk_size,
+                                       options.player_targeting, options.computer_targeting):
+                playerWins += result["winner"] == "player"
+                totalShots += result["shots"]
+                if output is not None:
+                    output.write(json.dumps(result) + "\n")
+        finally:
+            if output is not None:
+                output.close()
+        elapsedTime = time.perf_counter() - startTime
+        print(SelfPlay.formatReport(options.games, playerWins, totalShots, elapsedTime, options.processes), file = sys.stderr)
+
+class TestSelfPlay(unittest.TestCase):
+    def testPlayGame(self):
+        result = SelfPlay.playGame(42)
+        self.assertEqual(result, SelfPlay.playGame(42))
+        self.assertIn(result["winner"], ["player", "computer"])
+        self.assertEqual(result["shots"], len(result["moves"]))
+        self.assertEqual([move[0] for move in result["moves"][:2]], ["player", "computer"])
+        cabins = sum(1 for move in result["moves"] if move[0] == result["winner"] and move[2] == "cabin")
+        self.assertEqual(cabins, 2)
+
+    def testRun(self):
+        results = list(SelfPlay.run(10, 5, 2, 3))
+        self.assertEqual(sorted(result["seed"] for result in results), list(range(5, 15)))
+        self.assertEqual(results[0], SelfPlay.playGame(results[0]["seed"]))
+
+    def testDensityTargeting(self):
+        result = SelfPlay.playGame(3, "density", "hunt")
+        self.assertIn(result["winner"], ["player", "computer"])
+        self.assertEqual(len(set(move[1] for move in result["moves"] if move[0] == "player")), result["shots"] // 2)
+
+if __name__ == "__main__":
+    SelfPlay.main()
@@ -0,0 +1,107 @@
+'''
+CompactRandom class - a random.Random whose whole state is one 64-bit integer (xorshift64*), so it can be saved in
+8 bytes instead of the 2.5 kilobytes of the Mersenne Twister state
+'''
+
+import os
+import random
+import unittest
+
+class CompactRandom(random.Random):
+    __wordMask = (1 << 64) - 1
+
+    def __init__(self, seed = None):
+        '''
+        The initialiser of the CompactRandom object
+        :param seed: the seed - integer, string or bytes (a random one if None)
+        '''
+        self.__state = 1
+        super().__init__(seed)
+
+    def seed(self, a = None, version = 2):
+        '''
+        This function initialises the state from a seed (the seed is spread with splitmix64)
+        :param a: the seed - integer, string or bytes (a random one if None)
+        :param version: ignored, kept for compatibility with random.Random
+        :return: nothing
+        '''
+        if a is None:
+            a = int.from_bytes(os.urandom(8), "little")
+        elif isinstance(a, int) is False:
+            a = random.Random(a).getrandbits(64)
+        state = (a + 0x9E3779B97F4A7C15) & CompactRandom.__wordMask
+        state = ((state ^ (state >> 30)) * 0xBF58476D1CE4E5B9) & CompactRandom.__wordMask
+        state = ((state ^ (state >> 27)) * 0x94D049BB133111EB) & CompactRandom.__wordMask
+        state ^= state >> 31
+        self.__state = state if state != 0 else 1
+        self.gauss_next = None
+
+    def __nextWord(self):
+        '''
+        This function advances the state and returns the next 64 random bits
+        :return: word - integer
+        '''
+        state = self.__state
+        state ^= state >> 12
+        state ^= (state << 25) & CompactRandom.__wordMask
+        state ^= state >> 27
+        self.__state = state
+        return (state * 0x2545F4914F6CDD1D) & CompactRandom.__wordMask
+
+    def getrandbits(self, k):
+        '''
+        This function returns an integer with k random bits
+        :param k: the number of bits - integer
+        :return: integer
+        '''
+        if k < 0:
+            raise ValueError("number of bits must be non-negative")
+        result = 0
+        bitsNumber = 0
+        while bitsNumber < k:
+            result = (result << 64) | self.__nextWord()
+            bitsNumber += 64
+        return result >> (bitsNumber - k)
+
+    def random(self):
+        return self.getrandbits(53) * (1.0 / (1 << 53))
+
+    def getstate(self):
+        '''
+        This function returns the state of the generator (the cached gauss value is not part of it)
+        :return: state - integer
+        '''
+        return self.__state
+
+    def setstate(self, state):
+        '''
+        This function restores a state returned by getstate
+        :param state: the state - non-zero 64-bit integer
+        :return: nothing
+        '''
+        if not 0 < state <= CompactRandom.__wordMask:
+            raise ValueError("Invalid state")
+        self.__state = state
+        self.gauss_next = None
+
+class TestCompactRandom(unittest.TestCase):
+    def testSeedAndState(self):
+        first = CompactRandom(7)
+        second = CompactRandom(7)
+        self.assertEqual([first.randrange(64) for i in range(20)], [second.randrange(64) for i in range(20)])
+        state = first.getstate()
+        values = [first.random() for i in range(5)]
+        first.setstate(state)
+        self.assertEqual([first.random() for i in range(5)], values)
+        self.assertNotEqual(CompactRandom(8).getrandbits(64), CompactRandom(7).getrandbits(64))
+        self.assertRaises(ValueError, first.setstate, 0)
+
+    def testDistribution(self):
+        generator = CompactRandom("planes")
+        counts = [0] * 8
+        for i in range(8000):
+            counts[generator.randrange(8)] += 1
+        self.assertTrue(all(850 < count < 1150 for count in counts))
+        self.assertTrue(all(0 <= generator.random() < 1 for i in range(1000)))
+        self.assertEqual(generator.getrandbits(0), 0)
+        self.assertLess(generator.getrandbits(100), 1 << 100)
@@ -0,0 +1,184 @@
+'''
+DensityTargeter class - picks the cell covered by the most plane placements which are still possible
+'''
+
+from utilities.placementTable import placementTable
+import copy
+import random
+import unittest
+
+class DensityTargeter:
+    hitWeight = 50
+
+    def __init__(self, table = placementTable):
+        '''
+        The initialiser of the DensityTargeter object
+        :param table: the placements of the grid - PlacementTable
+        '''
+        self.__table = table
+        self.__columnsNumber = table.getColumnsNumber()
+        self.__cellsNumber = table.getRowsNumber() * table.getColumnsNumber()
+        self.__alive = []
+        self.__coveredHits = []
+        self.__density = []
+        self.__known = []
+        self.__openHits = set()
+        self.__initialDensity = [0] * self.__cellsNumber
+        for placementId in range(table.getPlacementsNumber()):
+            for cellIndex in table.getCellIndexes(placementId):
+                self.__initialDensity[cellIndex] += 1
+        self.reset()
+
+    def reset(self):
+        '''
+        This function forgets every shot (all the placements are possible again)
+        :return: nothing
+        '''
+        placementsNumber = self.__table.getPlacementsNumber()
+        self.__alive = [True] * placementsNumber
+        self.__coveredHits = [0] * placementsNumber
+        self.__density = self.__initialDensity[:]
+        self.__known = [False] * self.__cellsNumber
+        self.__openHits.clear()
+
+    def copy(self):
+        '''
+        This function returns an independent copy of the targeter (the placement table is shared)
+        :return: densityTargeter - DensityTargeter
+        '''
+        targeterCopy = copy.copy(self)
+        targeterCopy.__alive = self.__alive[:]
+        targeterCopy.__coveredHits = self.__coveredHits[:]
+        targeterCopy.__density = self.__density[:]
+        targeterCopy.__known = self.__known[:]
+        targeterCopy.__openHits = set(self.__openHits)
+        return targeterCopy
+
+    def __weight(self, placementId):
+        '''
+        This function returns how much a possible placement counts in the density of its cells
+        :param placementId: the id of the placement
+        :return: weight - integer (placements which explain hits count more)
+        '''
+        return 1 + DensityTargeter.hitWeight * self.__coveredHits[placementId]
+
+    def __addToDensity(self, placementId, amount):
+        '''
+        This function adds an amount to the density of every cell of a placement
+        :param placementId: the id of the placement
+        :param amount: the added amount - integer
+        :return: nothing
+        '''
+        density = self.__density
+        for cellIndex in self.__table.getCellIndexes(placementId):
+            density[cellIndex] += amount
+
+    def __discardPlacement(self, placementId):
+        '''
+        This function marks a placement as impossible
+        :param placementId: the id of the placement
+        :return: nothing
+        '''
+        if self.__alive[placementId] is True:
+            self.__alive[placementId] = False
+            self.__addToDensity(placementId, -self.__weight(placementId))
+
+    def __changeCoveredHits(self, cell, amount):
+        '''
+        This function updates the number of open hits covered by the possible placements over a cell (only the body
+        placements, the ones with their cabin on a hit cell being impossible since the hit)
+        :param cell: the hit cell - (row, column) tuple
+        :param amount: +1 when the hit is opened, -1 when it is explained by a destroyed plane
+        :return: nothing
+        '''
+        for placementId in self.__table.getPlacementsWithBody(cell[0], cell[1]):
+            if self.__alive[placementId] is True:
+                self.__addToDensity(placementId, DensityTargeter.hitWeight * amount)
+            self.__coveredHits[placementId] += amount
+
+    def registerShot(self, cell, hitResult):
+        '''
+        This function updates the possible placements after a shot
+        :param cell: the shot cell - (row, column) tuple
+        :param hitResult: the result of the shot - "hit", "cabin" or "miss"
+        :return: nothing
+        '''
+        row = cell[0]
+        column = cell[1]
+        self.__known[row * self.__columnsNumber + column] = True
+        if hitResult == "miss":
+            for placementId in self.__table.getPlacementsCoveringCell(row, column):
+                self.__discardPlacement(placementId)
+        elif hitResult == "hit":
+            for placementId in self.__table.getPlacementsWithCabin(row, column):
+                self.__discardPlacement(placementId)
+            self.__openHits.add(cell)
+            self.__changeCoveredHits(cell, 1)
+        else:
+            destroyedPlacements = [placementId for placementId in self.__table.getPlacementsWithCabin(row, column)
+                                   if self.__alive[placementId] is True]
+            for placementId in destroyedPlacements:
+                for planeCell in self.__table.getCells(placementId):
+                    if planeCell in self.__openHits:
+                        self.__openHits.discard(planeCell)
+                        self.__changeCoveredHits(planeCell, -1)
+            for placementId in self.__table.getPlacementsCoveringCell(row, column):
+                self.__discardPlacement(placementId)
+            if len(destroyedPlacements) == 1:
+                for planeCell in self.__table.getCells(destroyedPlacements[0]):
+                    for placementId in self.__table.getPlacementsCoveringCell(planeCell[0], planeCell[1]):
+                        self.__discardPlacement(placementId)
+
+    def getDensity(self, row, column):
+        '''
+        This function returns the density of a cell
+        :param row: the row of the cell
+        :param column: the column of the cell
+        :return: density - the weighted number of possible placements over the cell
+        '''
+        return self.__density[row * self.__columnsNumber + column]
+
+    def getNextHit(self, randomGenerator = random):
+        '''
+        This function returns the unshot cell with the highest density (ties are broken randomly)
+        :param randomGenerator: the source of randomness - random.Random (or the random module)
+        :return: a tuple representing the cell to be hit
+                 None if every cell has been shot
+        '''
+        bestDensity = -1
+        bestCells = []
+        for cellIndex in range(self.__cellsNumber):
+            if self.__known[cellIndex] is False:
+                density = self.__density[cellIndex]
+                if density > bestDensity:
+                    bestDensity = density
+                    bestCells = [cellIndex]
+                elif density == bestDensity:
+                    bestCells.append(cellIndex)
+        if len(bestCells) == 0:
+            return None
+        cellIndex = bestCells[randomGenerator.randrange(len(bestCells))]
+        return (cellIndex // self.__columnsNumber, cellIndex % self.__columnsNumber)
+
+class TestDensityTargeter(unittest.TestCase):
+    def setUp(self):
+        self.targeter = DensityTargeter()
+
+    def testInitialDensity(self):
+        self.assertEqual(sum(self.targeter.getDensity(row, column) for row in range(8) for column in range(8)),
+                         10 * placementTable.getPlacementsNumber())
+        self.assertEqual(self.targeter.getDensity(0, 0), 0)
+        self.assertEqual(self.targeter.getDensity(0, 1), 2)
+        self.assertEqual(self.targeter.getDensity(3, 3), 36)
+
+    def testMissAndHit(self):
+        self.targeter.registerShot((3, 3), "miss")
+        self.assertEqual(self.targeter.getDensity(3, 3), 0)
+        self.targeter.registerShot((5, 5), "hit")
+        nextHit = self.targeter.getNextHit(random.Random(0))
+        self.assertLessEqual(abs(nextHit[0] - 5) + abs(nextHit[1] - 5), 3)
+
+    def testCabinKill(self):
+        self.targeter.registerShot((0, 2), "cabin")
+        self.assertEqual(self.targeter.getDensity(0, 2), 0)
+        self.assertEqual(self.targeter.getDensity(1, 2), 0)
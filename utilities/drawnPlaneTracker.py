@@ -0,0 +1,170 @@
+'''
+DrawnPlaneTracker class - the cells a player is drawing, with their mask, count and bounding box kept up to date on
+every toggle, so whether they form a plane is always known
+'''
+
+from utilities.gameConstants import GameConstants
+from utilities.placementTable import placementTable
+import unittest
+
+class DrawnPlaneTracker:
+    def __init__(self, table = placementTable):
+        '''
+        The initialiser of the DrawnPlaneTracker object
+        :param table: the placements of the grid - PlacementTable
+        '''
+        self.__table = table
+        self.__columnsNumber = table.getColumnsNumber()
+        self.__planeCellsNumber = len(GameConstants.directions["up"])
+        self.__cells = set()
+        self.__mask = 0
+        self.__rowCounts = {}
+        self.__columnCounts = {}
+        self.__boundingBox = None
+        self.__placementId = None
+
+    def clear(self):
+        '''
+        This function forgets every drawn cell
+        :return: nothing
+        '''
+        self.__cells.clear()
+        self.__mask = 0
+        self.__rowCounts.clear()
+        self.__columnCounts.clear()
+        self.__boundingBox = None
+        self.__placementId = None
+
+    @staticmethod
+    def __changeCount(counts, key, amount):
+        counts[key] = counts.get(key, 0) + amount
+        if counts[key] == 0:
+            del counts[key]
+
+    def __updateBoundingBox(self, row, column, isAdded):
+        '''
+        This function updates the bounding box after a toggle (a side is searched again only when its last cell goes)
+        :return: nothing
+        '''
+        if len(self.__cells) == 0:
+            self.__boundingBox = None
+        elif isAdded is True:
+            if self.__boundingBox is None:
+                self.__boundingBox = (row, column, row, column)
+            else:
+                minimumRow, minimumColumn, maximumRow, maximumColumn = self.__boundingBox
+                self.__boundingBox = (min(minimumRow, row), min(minimumColumn, column),
+                                      max(maximumRow, row), max(maximumColumn, column))
+        else:
+            minimumRow, minimumColumn, maximumRow, maximumColumn = self.__boundingBox
+            if row not in self.__rowCounts and row in (minimumRow, maximumRow):
+                minimumRow = min(self.__rowCounts)
+                maximumRow = max(self.__rowCounts)
+            if column not in self.__columnCounts and column in (minimumColumn, maximumColumn):
+                minimumColumn = min(self.__columnCounts)
+                maximumColumn = max(self.__columnCounts)
+            self.__boundingBox = (minimumRow, minimumColumn, maximumRow, maximumColumn)
+
+    def toggle(self, row, column):
+        '''
+        This function draws a cell, or erases it if it is already drawn
+        :param row: the row of the cell
+        :param column: the column of the cell
+        :return: True if the cell is drawn now
+                 False if it has been erased
+        '''
+        cell = (row, column)
+        isAdded = cell not in self.__cells
+        amount = 1 if isAdded is True else -1
+        if isAdded is True:
+            self.__cells.add(cell)
+        else:
+            self.__cells.discard(cell)
+        self.__mask ^= 1 << (row * self.__columnsNumber + column)
+        DrawnPlaneTracker.__changeCount(self.__rowCounts, row, amount)
+        DrawnPlaneTracker.__changeCount(self.__columnCounts, column, amount)
+        self.__updateBoundingBox(row, column, isAdded)
+        self.__placementId = None
+        if len(self.__cells) == self.__planeCellsNumber:
+            minimumRow, minimumColumn, maximumRow, maximumColumn = self.__boundingBox
+            if sorted([maximumRow - minimumRow + 1, maximumColumn - minimumColumn + 1]) == [4, 5]:
+                self.__placementId = self.__table.getPlacementIdFromMask(self.__mask)
+        return isAdded
+
+    def contains(self, cell):
+        return cell in self.__cells
+
+    def getCells(self):
+        '''
+        This function returns the drawn cells
+        :return: a read-only copy of the drawn cells - frozenset of (row, column) tuples
+        '''
+        return frozenset(self.__cells)
+
+    def getMask(self):
+        return self.__mask
+
+    def getCount(self):
+        return len(self.__cells)
+
+    def getBoundingBox(self):
+        '''
+        This function returns the smallest rectangle holding the drawn cells
+        :return: minimumRow, minimumColumn, maximumRow, maximumColumn - tuple of integers
+                 None if no cell is drawn
+        '''
+        return self.__boundingBox
+
+    def isPlane(self):
+        '''
+        This function tells if the drawn cells are exactly the cells of a plane which fits in the grid
+        :return: True or False accordingly
+        '''
+        return self.__placementId is not None
+
+    def getPlane(self):
+        '''
+        This function returns the plane formed by the drawn cells
+        :return: cabinLocation, cabinOrientation - strings
+                 None if the drawn cells do not form a plane
+        '''
+        if self.__placementId is None:
+            return None
+        cabin = self.__table.getCabin(self.__placementId)
+        return GameConstants.coordinatesToCellString(cabin[0], cabin[1]), self.__table.getOrientation(self.__placementId)
+
+class TestDrawnPlaneTracker(unittest.TestCase):
+    def testDrawPlane(self):
+        tracker = DrawnPlaneTracker()
+        cells = placementTable.getCells(placementTable.getPlacementId("F8", "down"))
+        for cell in cells:
+            self.assertFalse(tracker.isPlane())
+            self.assertTrue(tracker.toggle(cell[0], cell[1]))
+        self.assertTrue(tracker.isPlane())
+        self.assertEqual(tracker.getPlane(), ("F8", "down"))
+        self.assertEqual(tracker.getMask(), placementTable.getMask(placementTable.getPlacementId("F8", "down")))
+        self.assertEqual(tracker.getBoundingBox(), (4, 3, 7, 7))
+        self.assertFalse(tracker.toggle(7, 5))
+        self.assertIsNone(tracker.getPlane())
+        self.assertEqual(tracker.getBoundingBox(), (4, 3, 6, 7))
+        tracker.toggle(0, 0)
+        self.assertEqual(tracker.getBoundingBox(), (0, 0, 6, 7))
+        self.assertEqual(tracker.getCount(), 10)
+        self.assertFalse(tracker.isPlane())
+        tracker.toggle(0, 0)
+        tracker.toggle(7, 5)
+        self.assertEqual(tracker.getPlane(), ("F8", "down"))
+        tracker.clear()
+        self.assertEqual((tracker.getCount(), tracker.getMask(), tracker.getBoundingBox()), (0, 0, None))
+
+    def testBoundingBoxShrinks(self):
+        tracker = DrawnPlaneTracker()
+        for cell in [(1, 1), (3, 4), (1, 4), (2, 2)]:
+            tracker.toggle(cell[0], cell[1])
+        self.assertEqual(tracker.getBoundingBox(), (1, 1, 3, 4))
+        tracker.toggle(1, 1)
+        self.assertEqual(tracker.getBoundingBox(), (1, 2, 3, 4))
+        tracker.toggle(3, 4)
+        self.assertEqual(tracker.getBoundingBox(), (1, 2, 2, 4))
+        self.assertTrue(tracker.contains((1, 4)))
+        self.assertEqual(tracker.getCells(), frozenset([(1, 4), (2, 2)]))
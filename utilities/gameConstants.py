@@ -7,13 +7,13 @@ import unittest
 class GameConstants:
     upDownCabinDirections = [(0, 0), (1, -2), (1, -1), (1, 0), (1, 1), (1, 2), (2, 0), (3, -1), (3, 0), (3, 1)]
     leftRightCabinDirections = [(0, 0), (-2, 1), (-1, 1), (0, 1), (1, 1), (2, 1), (0, 2), (-1, 3), (0, 3), (1, 3)]
-    realColumn = {'A': 0, 'B': 1, 'C': 2, 'D': 3, 'E': 4, 'F': 5, 'G': 6, 'H': 7}
-    realRow = {'1': 0, '2': 1, '3': 2, '4': 3, '5': 4, '6': 5, '7': 6, '8': 7}
-    realStringColumn = {0: 'A', 1: 'B', 2: 'C', 3: 'D', 4: 'E', 5: 'F', 6: 'G', 7: 'H'}
-    realStringRow = {0: '1', 1: '2', 2: '3', 3: '4', 4: '5', 5: '6', 6: '7', 7: '8'}
+    columnLetters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
     directions = {'up': upDownCabinDirections, 'down': upDownCabinDirections,
                          'left': leftRightCabinDirections, 'right': leftRightCabinDirections}
     directionSign = {'up': 1, 'down': -1, 'left': 1, 'right': -1}
+    rowsNumber = 8
+    columnsNumber = 8
+    planesNumber = 2
     upPlane = [[0, 0, 1, 0, 0],
                [1, 1, 1, 1, 1],
                [0, 0, 1, 0, 0],
@@ -33,13 +33,35 @@ class GameConstants:
                   [1, 0, 1, 0],
                   [0, 0, 1, 0]]
     
+    @staticmethod
+    def columnToString(column):
+        '''
+        This function converts a column into its letters (A, B, ..., Z, AA, AB, ...)
+        :param column: the given column - integer
+        :return: columnString - string
+        '''
+        if column < 26:
+            return GameConstants.columnLetters[column]
+        columnString = ""
+        column += 1
+        while column > 0:
+            column, remainder = divmod(column - 1, 26)
+            columnString = GameConstants.columnLetters[remainder] + columnString
+        return columnString
+
     @staticmethod
     def cellStringToCoordinates(cellString):
         '''
-        This function converts a valid cell given by a string into real coordinates
+        This function converts a valid cell given by a string (column letters followed by the row number) into real coordinates
         :return: cellCoordinates - the coordinates of the cell
+        :raises ValueError: if the string has no row number
         '''
-        return (GameConstants.realRow[cellString[1]], GameConstants.realColumn[cellString[0]])
+        split = 0
+        column = 0
+        while split < len(cellString) and cellString[split] in GameConstants.columnLetters:
+            column = column * 26 + ord(cellString[split]) - 64
+            split += 1
+        return (int(cellString[split:]) - 1, column - 1)
 
     @staticmethod
     def coordinatesToCellString(row, column):
@@ -49,7 +71,7 @@ class GameConstants:
         :param column: the given column
         :return: cellString - the string which represents the cell
         '''
-        return GameConstants.realStringColumn[column] + GameConstants.realStringRow[row]
+        return GameConstants.columnToString(column) + str(row + 1)
 
 class TestGameConstants(unittest.TestCase):
     def testCellStringToCoordinates(self):
@@ -62,4 +84,14 @@ class TestGameConstants(unittest.TestCase):
         self.assertEqual(GameConstants.coordinatesToCellString(2, 0), "A3")
         self.assertEqual(GameConstants.coordinatesToCellString(2, 3), "D3")
         self.assertEqual(GameConstants.coordinatesToCellString(6, 2), "C7")
-        self.assertEqual(GameConstants.coordinatesToCellString(0, 7), "H1")
\ No newline at end of file
+        self.assertEqual(GameConstants.coordinatesToCellString(0, 7), "H1")
+        self.assertEqual(GameConstants.coordinatesToCellString(11, 25), "Z12")
+        self.assertEqual(GameConstants.coordinatesToCellString(999, 26), "AA1000")
+        self.assertEqual(GameConstants.coordinatesToCellString(0, 701), "ZZ1")
+        self.assertEqual(GameConstants.coordinatesToCellString(0, 702), "AAA1")
+
+    def testLargeBoardRoundTrip(self):
+        for column in [0, 25, 26, 51, 52, 701, 702, 4000]:
+            cellString = GameConstants.coordinatesToCellString(1234, column)
+            self.assertEqual(GameConstants.cellStringToCoordinates(cellString), (1234, column))
+        self.assertRaises(ValueError, GameConstants.cellStringToCoordinates, "AB")
\ No newline at end of file
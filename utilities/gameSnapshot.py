@@ -0,0 +1,205 @@
+'''
+GameSnapshot class - the compact binary format of a saved game: a versioned header followed by variable-length
+integers (placement ids, cell indexes row * columnsNumber + column, and the state of the computer's random generator)
+'''
+
+from utilities.compactRandom import CompactRandom
+import random
+import struct
+import unittest
+
+class GameSnapshot:
+    magic = b"PLN"
+    version = 1
+    targetingModes = ["hunt", "density", "exact"]
+    __compactRandomState = 0
+    __mersenneTwisterState = 1
+
+    @staticmethod
+    def writeVarint(output, value):
+        '''
+        This function appends a non-negative integer, 7 bits per byte, the high bit telling that more bytes follow
+        :param output: the encoded bytes - bytearray
+        :param value: the integer - non-negative integer
+        :return: nothing
+        '''
+        while value >= 0x80:
+            output.append((value & 0x7F) | 0x80)
+            value >>= 7
+        output.append(value)
+
+    @staticmethod
+    def readVarint(data, position):
+        '''
+        This function reads an integer written by writeVarint
+        :param data: the encoded bytes - bytes
+        :param position: the position of the first byte of the integer - integer
+        :return: value, the position after the integer - integers
+        '''
+        value = 0
+        shift = 0
+        while True:
+            if position >= len(data):
+                raise ValueError("Truncated snapshot")
+            byte = data[position]
+            position += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value, position
+            shift += 7
+
+    @staticmethod
+    def __writeList(output, values):
+        GameSnapshot.writeVarint(output, len(values))
+        for value in values:
+            GameSnapshot.writeVarint(output, value)
+
+    @staticmethod
+    def __readList(data, position):
+        length, position = GameSnapshot.readVarint(data, position)
+        values = []
+        for i in range(length):
+            value, position = GameSnapshot.readVarint(data, position)
+            values.append(value)
+        return values, position
+
+    @staticmethod
+    def encode(state):
+        '''
+        This function encodes the state of a game
+        :param state: dictionary with the keys
+                      rowsNumber, columnsNumber, planesNumber - integers
+                      targetingMode - string (see targetingModes)
+                      playerPlacements, computerPlacements - lists of placement ids, in placing order
+                      playerShots, computerShots - lists of cell indexes, in shooting order
+                      queue - list of cell indexes (the computer's moves queue, from the first to the last one)
+                      randomState - the getstate() of the computer's random generator (CompactRandom or random.Random)
+        :return: data - bytes
+        '''
+        output = bytearray(GameSnapshot.magic)
+        output.append(GameSnapshot.version)
+        for key in ["rowsNumber", "columnsNumber", "planesNumber"]:
+            GameSnapshot.writeVarint(output, state[key])
+        output.append(GameSnapshot.targetingModes.index(state["targetingMode"]))
+        for key in ["playerPlacements", "computerPlacements", "playerShots", "computerShots", "queue"]:
+            GameSnapshot.__writeList(output, state[key])
+        randomState = state["randomState"]
+        if isinstance(randomState, int):
+            output.append(GameSnapshot.__compactRandomState)
+            GameSnapshot.writeVarint(output, randomState)
+        else:
+            version, internalState, gaussNext = randomState
+            output.append(GameSnapshot.__mersenneTwisterState)
+            output += struct.pack("<B625I", version, *internalState)
+            if gaussNext is None:
+                output.append(0)
+            else:
+                output.append(1)
+                output += struct.pack("<d", gaussNext)
+        return bytes(output)
+
+    @staticmethod
+    def __unpack(format, data, position):
+        '''
+        This function reads fixed-size values after checking that the data holds them
+        :param format: the struct format of the values - string
+        :param data: the encoded bytes - bytes
+        :param position: the position of the first byte of the values - integer
+        :return: values - tuple, the position after the values - integer
+        '''
+        size = struct.calcsize(format)
+        if len(data) - position < size:
+            raise ValueError("Truncated snapshot")
+        return struct.unpack_from(format, data, position), position + size
+
+    @staticmethod
+    def decode(data):
+        '''
+        This function decodes the state of a game
+        :param data: the bytes returned by encode
+        :return: state - dictionary (see encode)
+                 a ValueError is raised if the data is not a valid snapshot
+        '''
+        try:
+            return GameSnapshot.__decode(bytes(data))
+        except (IndexError, OverflowError, TypeError, struct.error) as error:
+            raise ValueError("Corrupt snapshot: {}".format(error))
+
+    @staticmethod
+    def __decode(data):
+        if data[:len(GameSnapshot.magic)] != GameSnapshot.magic:
+            raise ValueError("Not a game snapshot")
+        position = len(GameSnapshot.magic)
+        if len(data) <= position or data[position] != GameSnapshot.version:
+            raise ValueError("Unsupported snapshot version")
+        position += 1
+        state = {}
+        for key in ["rowsNumber", "columnsNumber", "planesNumber"]:
+            state[key], position = GameSnapshot.readVarint(data, position)
+        if position >= len(data) or data[position] >= len(GameSnapshot.targetingModes):
+            raise ValueError("Invalid targeting mode")
+        state["targetingMode"] = GameSnapshot.targetingModes[data[position]]
+        position += 1
+        for key in ["playerPlacements", "computerPlacements", "playerShots", "computerShots", "queue"]:
+            state[key], position = GameSnapshot.__readList(data, position)
+        if position >= len(data):
+            raise ValueError("Truncated snapshot")
+        randomStateKind = data[position]
+        position += 1
+        if randomStateKind == GameSnapshot.__compactRandomState:
+            state["randomState"], position = GameSnapshot.readVarint(data, position)
+        elif randomStateKind == GameSnapshot.__mersenneTwisterState:
+            values, position = GameSnapshot.__unpack("<B625I", data, position)
+            (hasGaussNext,), position = GameSnapshot.__unpack("<B", data, position)
+            gaussNext = None
+            if hasGaussNext == 1:
+                (gaussNext,), position = GameSnapshot.__unpack("<d", data, position)
+            elif hasGaussNext != 0:
+                raise ValueError("Invalid random generator state")
+            state["randomState"] = (values[0], tuple(values[1:]), gaussNext)
+        else:
+            raise ValueError("Invalid random generator state")
+        if position != len(data):
+            raise ValueError("Trailing bytes in the snapshot")
+        return state
+
+class TestGameSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.state = {"rowsNumber": 8, "columnsNumber": 8, "planesNumber": 2, "targetingMode": "hunt",
+                      "playerPlacements": [50, 12], "computerPlacements": [3, 77], "playerShots": [0, 63, 12],
+                      "computerShots": [5, 6], "queue": [13, 21], "randomState": CompactRandom(1).getstate()}
+
+    def testRoundTrip(self):
+        data = GameSnapshot.encode(self.state)
+        self.assertEqual(GameSnapshot.decode(data), self.state)
+        self.assertLess(len(data), 40)
+
+    def testMersenneTwisterState(self):
+        generator = random.Random(3)
+        generator.gauss(0, 1)
+        self.state["randomState"] = generator.getstate()
+        self.assertEqual(GameSnapshot.decode(GameSnapshot.encode(self.state)), self.state)
+
+    def testInvalidData(self):
+        data = GameSnapshot.encode(self.state)
+        self.assertRaises(ValueError, GameSnapshot.decode, b"XYZ" + data[3:])
+        self.assertRaises(ValueError, GameSnapshot.decode, data[:3] + bytes([9]) + data[4:])
+        self.assertRaises(ValueError, GameSnapshot.decode, data[:-1])
+        self.assertRaises(ValueError, GameSnapshot.decode, data + b"\x00")
+
+    def testTruncatedAndCorruptData(self):
+        generator = random.Random(3)
+        generator.gauss(0, 1)
+        for randomState in [self.state["randomState"], generator.getstate()]:
+            self.state["randomState"] = randomState
+            data = GameSnapshot.encode(self.state)
+            for length in range(len(data)):
+                self.assertRaises(ValueError, GameSnapshot.decode, data[:length])
+            randomGenerator = random.Random(5)
+            for i in range(200):
+                corruptData = bytearray(data)
+                corruptData[randomGenerator.randrange(len(data))] = randomGenerator.randrange(256)
+                try:
+                    GameSnapshot.decode(bytes(corruptData))
+                except ValueError:
+                    pass
@@ -0,0 +1,212 @@
+'''
+GridView class - a read-only view over the grid of a repository (obtaining it copies nothing and it cannot change the
+repository)
+'''
+
+import unittest
+
+class RowView:
+    __slots__ = ["__row"]
+
+    def __init__(self, row):
+        '''
+        The initialiser of the RowView object
+        :param row: the viewed row - list
+        '''
+        self.__row = row
+
+    def __getitem__(self, column):
+        return self.__row[column]
+
+    def __len__(self):
+        return len(self.__row)
+
+    def __iter__(self):
+        return iter(self.__row)
+
+    def __eq__(self, other):
+        try:
+            return list(self) == list(other)
+        except TypeError:
+            return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def count(self, value):
+        '''
+        This function returns how many cells of the row hold a value
+        :param value: the searched value
+        :return: count - integer
+        '''
+        return self.__row.count(value)
+
+class SparseRowView(RowView):
+    __slots__ = ["__cells", "__rowIndex", "__columnsNumber", "__defaultValue"]
+
+    def __init__(self, cells, rowIndex, columnsNumber, defaultValue):
+        '''
+        The initialiser of the SparseRowView object
+        :param cells: the stored cells of the grid - dictionary from (row, column) to value
+        :param rowIndex: the index of the viewed row - integer
+        :param columnsNumber: the number of columns of the grid - integer
+        :param defaultValue: the value of the cells which are not stored
+        '''
+        self.__cells = cells
+        self.__rowIndex = rowIndex
+        self.__columnsNumber = columnsNumber
+        self.__defaultValue = defaultValue
+
+    def __getitem__(self, column):
+        if column < 0:
+            column += self.__columnsNumber
+        if not 0 <= column < self.__columnsNumber:
+            raise IndexError("row index out of range")
+        return self.__cells.get((self.__rowIndex, column), self.__defaultValue)
+
+    def __len__(self):
+        return self.__columnsNumber
+
+    def __iter__(self):
+        for column in range(self.__columnsNumber):
+            yield self.__cells.get((self.__rowIndex, column), self.__defaultValue)
+
+    def count(self, value):
+        return sum(1 for cellValue in self if cellValue == value)
+
+class GridView:
+    def __init__(self, grid):
+        '''
+        The initialiser of the GridView object
+        :param grid: the viewed grid - matrix (list of lists)
+        '''
+        self.__grid = grid
+
+    def getRowsNumber(self):
+        return len(self.__grid)
+
+    def getColumnsNumber(self):
+        return len(self.__grid[0]) if len(self.__grid) > 0 else 0
+
+    def getCell(self, row, column):
+        '''
+        This function returns the value of a cell
+        :param row: the row of the cell
+        :param column: the column of the cell
+        :return: the value of the cell
+        '''
+        return self.__grid[row][column]
+
+    def getRow(self, row):
+        '''
+        This function returns a read-only view of a row
+        :param row: the index of the row
+        :return: RowView
+        '''
+        return RowView(self.__grid[row])
+
+    def __getitem__(self, row):
+        return self.getRow(row)
+
+    def __len__(self):
+        return self.getRowsNumber()
+
+    def __iter__(self):
+        for row in range(self.getRowsNumber()):
+            yield self.getRow(row)
+
+    def __eq__(self, other):
+        try:
+            return len(self) == len(other) and all(row == otherRow for row, otherRow in zip(self, other))
+        except TypeError:
+            return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "GridView({!r})".format(self.toList())
+
+    def toList(self):
+        '''
+        This function exports the grid as a new matrix, which the caller is free to change
+        :return: matrix (list of lists)
+        '''
+        return [row[:] for row in self.__grid]
+
+class SparseGridView(GridView):
+    def __init__(self, cells, rowsNumber, columnsNumber, defaultValue = -1):
+        '''
+        The initialiser of the SparseGridView object
+        :param cells: the stored cells of the grid - dictionary from (row, column) to value
+        :param rowsNumber: the number of rows of the grid - integer
+        :param columnsNumber: the number of columns of the grid - integer
+        :param defaultValue: the value of the cells which are not stored
+        '''
+        super().__init__([])
+        self.__cells = cells
+        self.__rowsNumber = rowsNumber
+        self.__columnsNumber = columnsNumber
+        self.__defaultValue = defaultValue
+
+    def getRowsNumber(self):
+        return self.__rowsNumber
+
+    def getColumnsNumber(self):
+        return self.__columnsNumber
+
+    def getCell(self, row, column):
+        return self.__cells.get((row, column), self.__defaultValue)
+
+    def getRow(self, row):
+        if row < 0:
+            row += self.__rowsNumber
+        if not 0 <= row < self.__rowsNumber:
+            raise IndexError("grid index out of range")
+        return SparseRowView(self.__cells, row, self.__columnsNumber, self.__defaultValue)
+
+    def getStoredCells(self):
+        '''
+        This function returns the cells which do not hold the default value (a sparse bulk export)
+        :return: a read-only view of (cell, value) pairs
+        '''
+        return self.__cells.items()
+
+    def toList(self):
+        grid = [[self.__defaultValue] * self.__columnsNumber for row in range(self.__rowsNumber)]
+        for cell, value in self.__cells.items():
+            grid[cell[0]][cell[1]] = value
+        return grid
+
+class TestGridView(unittest.TestCase):
+    def testDenseView(self):
+        grid = [[-1, 1, -1], [0, -1, -1]]
+        view = GridView(grid)
+        self.assertEqual(view, [[-1, 1, -1], [0, -1, -1]])
+        self.assertEqual([[-1, 1, -1], [0, -1, -1]], view)
+        self.assertNotEqual(view, [[-1, 1, -1], [0, -1, 1]])
+        self.assertEqual(view[1][0], 0)
+        self.assertEqual(view.getCell(0, 1), 1)
+        self.assertEqual(len(view), 2)
+        self.assertEqual(len(view[0]), 3)
+        self.assertEqual(sum(row.count(-1) for row in view), 4)
+        with self.assertRaises(TypeError):
+            view[0][0] = 5
+        exported = view.toList()
+        exported[0][0] = 5
+        self.assertEqual(grid[0][0], -1)
+        grid[0][0] = 1
+        self.assertEqual(view[0][0], 1)
+
+    def testSparseView(self):
+        cells = {(0, 1): 1, (1, 0): 0}
+        view = SparseGridView(cells, 2, 3)
+        self.assertEqual(view, [[-1, 1, -1], [0, -1, -1]])
+        self.assertEqual(view.toList(), [[-1, 1, -1], [0, -1, -1]])
+        self.assertEqual(list(view[1]), [0, -1, -1])
+        self.assertEqual(view[0][-2], 1)
+        self.assertRaises(IndexError, view.__getitem__, 2)
+        self.assertEqual(view[0].count(-1), 2)
+        self.assertEqual(dict(view.getStoredCells()), cells)
+        self.assertEqual(len(SparseGridView({}, 100000, 100000)), 100000)
@@ -0,0 +1,120 @@
+'''
+IndexedSet class - a set which supports constant time removal and uniform random sampling
+'''
+
+import random
+import unittest
+
+class IndexedSet:
+    def __init__(self, items = ()):
+        '''
+        Initialiser of the IndexedSet class
+        :param items: the initial items - iterable
+        '''
+        self.__items = []
+        self.__positions = {}
+        for item in items:
+            self.add(item)
+
+    def copy(self):
+        '''
+        This function returns an independent copy of the set, with the items in the same order
+        :return: indexedSet - IndexedSet
+        '''
+        indexedSetCopy = IndexedSet()
+        indexedSetCopy.__items = self.__items[:]
+        indexedSetCopy.__positions = dict(self.__positions)
+        return indexedSetCopy
+
+    def add(self, item):
+        '''
+        This function adds an item to the set (nothing happens if it is already there)
+        :param item: the given item - hashable
+        :return: nothing
+        '''
+        if item not in self.__positions:
+            self.__positions[item] = len(self.__items)
+            self.__items.append(item)
+
+    def remove(self, item):
+        '''
+        This function removes an item from the set by moving the last item into its place
+        :param item: the given item
+        :return: nothing (nothing happens if the item is not in the set)
+        '''
+        position = self.__positions.pop(item, None)
+        if position is None:
+            return
+        lastItem = self.__items.pop()
+        if position < len(self.__items):
+            self.__items[position] = lastItem
+            self.__positions[lastItem] = position
+
+    def contains(self, item):
+        '''
+        This function tells if an item is in the set
+        :param item: the given item
+        :return: True or False accordingly
+        '''
+        return item in self.__positions
+
+    def choice(self, randomGenerator = random):
+        '''
+        This function returns a uniformly random item of the set
+        :param randomGenerator: the source of randomness - random.Random (or the random module)
+        :return: item - a random item
+                 None if the set is empty
+        '''
+        if len(self.__items) == 0:
+            return None
+        return self.__items[randomGenerator.randrange(len(self.__items))]
+
+    def size(self):
+        '''
+        This function returns the number of the items in the set
+        :return: size - integer
+        '''
+        return len(self.__items)
+
+    def clear(self):
+        '''
+        This function empties the set
+        :return: nothing
+        '''
+        self.__items.clear()
+        self.__positions.clear()
+
+class TestIndexedSet(unittest.TestCase):
+    def setUp(self):
+        self.indexedSet = IndexedSet([1, 2, 3])
+
+    def testAddRemoveSize(self):
+        self.indexedSet.add(2)
+        self.assertEqual(self.indexedSet.size(), 3)
+        self.indexedSet.remove(1)
+        self.indexedSet.remove(1)
+        self.assertEqual(self.indexedSet.size(), 2)
+        self.assertFalse(self.indexedSet.contains(1))
+        self.assertTrue(self.indexedSet.contains(3))
+        self.indexedSet.remove(3)
+        self.indexedSet.remove(2)
+        self.assertEqual(self.indexedSet.size(), 0)
+        self.assertIsNone(self.indexedSet.choice())
+
+    def testChoice(self):
+        self.indexedSet.remove(2)
+        randomGenerator = random.Random(1)
+        choices = set(self.indexedSet.choice(randomGenerator) for i in range(50))
+        self.assertEqual(choices, {1, 3})
+
+    def testClear(self):
+        self.indexedSet.clear()
+        self.assertEqual(self.indexedSet.size(), 0)
+        self.assertFalse(self.indexedSet.contains(2))
+
+    def testCopy(self):
+        indexedSetCopy = self.indexedSet.copy()
+        indexedSetCopy.remove(1)
+        self.assertTrue(self.indexedSet.contains(1))
+        self.assertEqual(indexedSetCopy.size(), 2)
+        self.assertEqual(self.indexedSet.copy().choice(random.Random(1)), self.indexedSet.choice(random.Random(1)))
@@ -0,0 +1,294 @@
+'''
+LayoutCandidates class - every two-plane layout which still agrees with the shots, for exact targeting. The layouts
+of a grid are enumerated once and packed (placement id pairs, plane masks and cabin masks in arrays); a shot only
+visits the layouts which survived the previous ones. Once a cabin kill identifies a plane, the survivors are grouped
+by the remaining plane, each group holding the placements the destroyed plane may still have had.
+'''
+
+from utilities.layoutSampler import LayoutSampler
+from utilities.placementTable import placementTable
+from array import array
+from math import comb
+import copy
+import random
+import unittest
+
+class LayoutCandidates:
+    __packedLayouts = {}
+
+    def __init__(self, table = placementTable):
+        '''
+        The initialiser of the LayoutCandidates object
+        :param table: the placements of the grid - PlacementTable (its two-plane layouts must be few enough to be
+                      enumerated, see LayoutSampler.enumerationLimit)
+        '''
+        if comb(table.getPlacementsNumber(), 2) > LayoutSampler.enumerationLimit:
+            raise ValueError("The layouts of the grid are too many to be enumerated")
+        self.__columnsNumber = table.getColumnsNumber()
+        self.__cellsNumber = table.getRowsNumber() * table.getColumnsNumber()
+        self.__pairs, self.__masks, self.__cabinMasks = LayoutCandidates.__getPackedLayouts(table)
+        self.__placementMasks = [table.getMask(placementId) for placementId in range(table.getPlacementsNumber())]
+        self.__placementCellIndexes = list(map(table.getCellIndexes, range(table.getPlacementsNumber())))
+        self.__cabinBits = [1 << (cabin[0] * self.__columnsNumber + cabin[1])
+                            for cabin in map(table.getCabin, range(table.getPlacementsNumber()))]
+        self.__liveLayouts = None
+        self.__groups = None
+        self.__placementWeights = None
+        self.__knownMask = 0
+        self.reset()
+
+    @staticmethod
+    def __getPackedLayouts(table):
+        '''
+        This function returns the packed two-plane layouts of a grid (computed on the first call for a grid size, the
+        placement ids only depending on it)
+        :param table: the placements of the grid - PlacementTable
+        :return: pairs - array of the two placement ids of every layout, one after the other
+                 masks, cabinMasks - the cells of the planes and of their cabins for every layout (64-bit arrays
+                                     when the grid has at most 64 cells, lists of integers otherwise)
+        '''
+        key = (table.getRowsNumber(), table.getColumnsNumber())
+        if key not in LayoutCandidates.__packedLayouts:
+            pairs = array("H")
+            masks = []
+            cabinMasks = []
+            columnsNumber = table.getColumnsNumber()
+            for first, second in LayoutSampler.enumerateLayouts(table, 2):
+                pairs.append(first)
+                pairs.append(second)
+                masks.append(table.getMask(first) | table.getMask(second))
+                cabinMasks.append(sum(1 << (table.getCabin(placementId)[0] * columnsNumber +
+                                            table.getCabin(placementId)[1]) for placementId in (first, second)))
+            if table.getRowsNumber() * columnsNumber <= 64:
+                masks = array("Q", masks)
+                cabinMasks = array("Q", cabinMasks)
+            LayoutCandidates.__packedLayouts[key] = (pairs, masks, cabinMasks)
+        return LayoutCandidates.__packedLayouts[key]
+
+    def reset(self):
+        '''
+        This function makes every layout possible again
+        :return: nothing
+        '''
+        self.__liveLayouts = array("I", range(len(self.__masks)))
+        self.__groups = None
+        self.__placementWeights = [0] * len(self.__placementMasks)
+        for placementId in self.__pairs:
+            self.__placementWeights[placementId] += 1
+        self.__knownMask = 0
+
+    def copy(self):
+        '''
+        This function returns an independent copy of the candidates (the packed layouts are shared)
+        :return: layoutCandidates - LayoutCandidates
+        '''
+        candidatesCopy = copy.copy(self)
+        candidatesCopy.__liveLayouts = array("I", self.__liveLayouts)
+        if self.__groups is not None:
+            candidatesCopy.__groups = {remainingId: killedIds[:] for remainingId, killedIds in self.__groups.items()}
+        candidatesCopy.__placementWeights = self.__placementWeights[:]
+        return candidatesCopy
+
+    def getCandidatesNumber(self):
+        '''
+        This function returns the number of layouts which agree with the shots
+        :return: candidatesNumber - integer
+        '''
+        if self.__groups is None:
+            return len(self.__liveLayouts)
+        return sum(len(killedIds) for killedIds in self.__groups.values())
+
+    def getPartition(self):
+        '''
+        This function returns the surviving layouts grouped by the plane which has not been destroyed
+        :return: dictionary of remaining placement id: list of the placement ids the destroyed plane may have had
+                 None while no plane has been destroyed
+        '''
+        if self.__groups is None:
+            return None
+        return {remainingId: list(killedIds) for remainingId, killedIds in self.__groups.items()}
+
+    def __filterLayouts(self, bit, hitResult):
+        '''
+        This function keeps the layouts which agree with a shot (only the surviving layouts are visited)
+        :param bit: the bit of the shot cell - integer
+        :param hitResult: the result of the shot - "hit", "cabin" or "miss"
+        :return: nothing
+        '''
+        masks = self.__masks
+        cabinMasks = self.__cabinMasks
+        liveLayouts = self.__liveLayouts
+        if hitResult == "miss":
+            keptLayouts = [layoutIndex for layoutIndex in liveLayouts if masks[layoutIndex] & bit == 0]
+            removedLayouts = [layoutIndex for layoutIndex in liveLayouts if masks[layoutIndex] & bit != 0]
+        elif hitResult == "hit":
+            keptLayouts = [layoutIndex for layoutIndex in liveLayouts
+                           if masks[layoutIndex] & bit != 0 and cabinMasks[layoutIndex] & bit == 0]
+            removedLayouts = [layoutIndex for layoutIndex in liveLayouts
+                              if masks[layoutIndex] & bit == 0 or cabinMasks[layoutIndex] & bit != 0]
+        else:
+            keptLayouts = [layoutIndex for layoutIndex in liveLayouts if cabinMasks[layoutIndex] & bit != 0]
+            removedLayouts = [layoutIndex for layoutIndex in liveLayouts if cabinMasks[layoutIndex] & bit == 0]
+        if len(removedLayouts) > 0:
+            pairs = self.__pairs
+            placementWeights = self.__placementWeights
+            for layoutIndex in removedLayouts:
+                placementWeights[pairs[2 * layoutIndex]] -= 1
+                placementWeights[pairs[2 * layoutIndex + 1]] -= 1
+            liveLayouts = array("I", keptLayouts)
+        self.__liveLayouts = liveLayouts
+        if hitResult == "cabin":
+            self.__partition(bit)
+
+    def __partition(self, killBit):
+        '''
+        This function groups the surviving layouts by the plane whose cabin is not on the killed cell
+        :param killBit: the bit of the killed cabin - integer
+        :return: nothing
+        '''
+        self.__groups = {}
+        for layoutIndex in self.__liveLayouts:
+            first = self.__pairs[2 * layoutIndex]
+            second = self.__pairs[2 * layoutIndex + 1]
+            killedId, remainingId = (first, second) if self.__cabinBits[first] == killBit else (second, first)
+            self.__groups.setdefault(remainingId, []).append(killedId)
+        self.__liveLayouts = array("I")
+        self.__placementWeights = [0] * len(self.__placementMasks)
+        for remainingId, killedIds in self.__groups.items():
+            self.__placementWeights[remainingId] = len(killedIds)
+
+    def __filterGroups(self, bit, hitResult):
+        '''
+        This function keeps, in every group, the destroyed plane placements which agree with a shot, dropping the
+        groups whose remaining plane disagrees with it (or which have no destroyed plane placement left)
+        :param bit: the bit of the shot cell - integer
+        :param hitResult: the result of the shot - "hit", "cabin" or "miss"
+        :return: nothing
+        '''
+        placementMasks = self.__placementMasks
+        for remainingId in list(self.__groups):
+            coversCell = placementMasks[remainingId] & bit != 0
+            isCabin = self.__cabinBits[remainingId] == bit
+            killedIds = self.__groups[remainingId]
+            if hitResult == "miss":
+                killedIds = [killedId for killedId in killedIds if placementMasks[killedId] & bit == 0] \
+                    if coversCell is False else []
+            elif hitResult == "hit" and coversCell is True:
+                killedIds = [killedId for killedId in killedIds if placementMasks[killedId] & bit == 0] \
+                    if isCabin is False else []
+            elif hitResult == "hit":
+                killedIds = [killedId for killedId in killedIds if placementMasks[killedId] & bit != 0]
+            else:
+                killedIds = killedIds if isCabin is True else []
+            if len(killedIds) == 0:
+                del self.__groups[remainingId]
+                self.__placementWeights[remainingId] = 0
+            else:
+                self.__groups[remainingId] = killedIds
+                self.__placementWeights[remainingId] = len(killedIds)
+
+    def registerShot(self, cell, hitResult):
+        '''
+        This function removes the layouts which disagree with a shot
+        :param cell: the shot cell - (row, column) tuple
+        :param hitResult: the result of the shot - "hit", "cabin" or "miss"
+        :return: nothing
+        '''
+        bit = 1 << (cell[0] * self.__columnsNumber + cell[1])
+        if self.__knownMask & bit != 0:
+            return
+        self.__knownMask |= bit
+        if self.__groups is None:
+            self.__filterLayouts(bit, hitResult)
+        else:
+            self.__filterGroups(bit, hitResult)
+
+    def getNextHit(self, randomGenerator = random):
+        '''
+        This function returns the unshot cell which is a cabin in the most surviving layouts (ties are broken by the
+        number of layouts covering the cell, then randomly)
+        :param randomGenerator: the source of randomness - random.Random (or the random module)
+        :return: a tuple representing the cell to be hit
+                 None if no surviving layout has an unshot cell
+        '''
+        cabinScores = [0] * self.__cellsNumber
+        coverScores = [0] * self.__cellsNumber
+        for placementId, weight in enumerate(self.__placementWeights):
+            if weight != 0:
+                cellIndexes = self.__placementCellIndexes[placementId]
+                cabinScores[cellIndexes[0]] += weight
+                for cellIndex in cellIndexes:
+                    coverScores[cellIndex] += weight
+        bestScore = (0, 0)
+        bestCells = []
+        knownMask = self.__knownMask
+        for cellIndex in range(self.__cellsNumber):
+            score = (cabinScores[cellIndex], coverScores[cellIndex])
+            if score >= bestScore and score[1] > 0 and knownMask >> cellIndex & 1 == 0:
+                if score > bestScore:
+                    bestScore = score
+                    bestCells = []
+                bestCells.append(cellIndex)
+        if len(bestCells) == 0:
+            return None
+        cellIndex = bestCells[randomGenerator.randrange(len(bestCells))]
+        return (cellIndex // self.__columnsNumber, cellIndex % self.__columnsNumber)
+
+class TestLayoutCandidates(unittest.TestCase):
+    def setUp(self):
+        self.candidates = LayoutCandidates()
+
+    def testPackedLayouts(self):
+        self.assertEqual(self.candidates.getCandidatesNumber(), 548)
+        self.assertIsNone(self.candidates.getPartition())
+        self.candidates.registerShot((0, 0), "miss")
+        self.assertEqual(self.candidates.getCandidatesNumber(), 548)
+
+    def testShotsFilterLayouts(self):
+        firstId = placementTable.getPlacementId("C1", "up")
+        secondId = placementTable.getPlacementId("F8", "down")
+        planesMask = placementTable.getMask(firstId) | placementTable.getMask(secondId)
+        cabins = [placementTable.getCabin(firstId), placementTable.getCabin(secondId)]
+        randomGenerator = random.Random(3)
+        candidatesNumber = self.candidates.getCandidatesNumber()
+        killsNumber = 0
+        while killsNumber < 2:
+            cell = self.candidates.getNextHit(randomGenerator)
+            if cell in cabins:
+                hitResult = "cabin"
+                killsNumber += 1
+            else:
+                hitResult = "hit" if planesMask & (1 << (cell[0] * 8 + cell[1])) != 0 else "miss"
+            self.candidates.registerShot(cell, hitResult)
+            self.assertLessEqual(self.candidates.getCandidatesNumber(), candidatesNumber)
+            candidatesNumber = self.candidates.getCandidatesNumber()
+            self.assertGreater(candidatesNumber, 0)
+            if killsNumber == 1:
+                partition = self.candidates.getPartition()
+                remainingId = secondId if cell == cabins[0] else firstId
+                self.assertIn(remainingId, partition)
+                self.assertIn(firstId if remainingId == secondId else secondId, partition[remainingId])
+        lastKilledId, firstKilledId = (secondId, firstId) if cell == cabins[1] else (firstId, secondId)
+        self.assertEqual(list(self.candidates.getPartition()), [lastKilledId])
+        self.assertIn(firstKilledId, self.candidates.getPartition()[lastKilledId])
+
+    def testCandidatesOfTablesWhichAreNotKept(self):
+        from utilities.placementTable import PlacementTable
+        for i in range(5):
+            table = PlacementTable(8, 8)
+            self.assertEqual(LayoutCandidates(table).getCandidatesNumber(), 548)
+            del table
+            table = PlacementTable(9, 7)
+            candidates = LayoutCandidates(table)
+            self.assertEqual(candidates.getCandidatesNumber(), 530)
+            cell = candidates.getNextHit(random.Random(i))
+            self.assertTrue(0 <= cell[0] < 9 and 0 <= cell[1] < 7)
+            del table, candidates
+
+    def testCopy(self):
+        candidatesCopy = self.candidates.copy()
+        candidatesCopy.registerShot((3, 3), "miss")
+        self.assertEqual(self.candidates.getCandidatesNumber(), 548)
+        self.assertLess(candidatesCopy.getCandidatesNumber(), 548)
+        self.candidates.registerShot((3, 3), "miss")
+        self.assertEqual(self.candidates.getNextHit(random.Random(1)), candidatesCopy.getNextHit(random.Random(1)))
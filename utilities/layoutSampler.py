@@ -0,0 +1,164 @@
+'''
+LayoutSampler class - draws legal non-overlapping layouts of planes without rejection
+'''
+
+from utilities.placementTable import placementTable
+from math import comb
+import bisect
+import random
+import unittest
+
+class LayoutSampler:
+    enumerationLimit = 200000
+    __layoutsCache = {}
+
+    def __init__(self, planesNumber = 2, table = placementTable):
+        '''
+        The initialiser of the LayoutSampler object
+        :param planesNumber: the number of planes of a layout - integer
+        :param table: the placements of the grid - PlacementTable
+        '''
+        self.__planesNumber = planesNumber
+        self.__table = table
+        self.__layouts = None
+        if comb(table.getPlacementsNumber(), planesNumber) <= LayoutSampler.enumerationLimit:
+            self.__layouts = LayoutSampler.__getLayouts(table, planesNumber)
+
+    @staticmethod
+    def __getLayouts(table, planesNumber):
+        '''
+        This function returns every layout of the grid (computed on the first call for a grid size, the placement ids
+        only depending on it)
+        :param table: the placements of the grid - PlacementTable
+        :param planesNumber: the number of planes of a layout - integer
+        :return: layouts - list of tuples of increasing placement ids
+        '''
+        key = (table.getRowsNumber(), table.getColumnsNumber(), planesNumber)
+        if key not in LayoutSampler.__layoutsCache:
+            LayoutSampler.__layoutsCache[key] = LayoutSampler.enumerateLayouts(table, planesNumber)
+        return LayoutSampler.__layoutsCache[key]
+
+    @staticmethod
+    def enumerateLayouts(table, planesNumber):
+        '''
+        This function enumerates all the sets of pairwise non-overlapping placements
+        :param table: the placements of the grid - PlacementTable
+        :param planesNumber: the number of planes of a layout - integer
+        :return: layouts - list of tuples of increasing placement ids
+        '''
+        layouts = []
+        placementsNumber = table.getPlacementsNumber()
+        masks = [table.getMask(placementId) for placementId in range(placementsNumber)]
+
+        def extend(layout, usedMask, firstId):
+            if len(layout) == planesNumber:
+                layouts.append(tuple(layout))
+                return
+            for placementId in range(firstId, placementsNumber):
+                if masks[placementId] & usedMask == 0:
+                    layout.append(placementId)
+                    extend(layout, usedMask | masks[placementId], placementId + 1)
+                    layout.pop()
+
+        extend([], 0, 0)
+        return layouts
+
+    def getLayoutsNumber(self):
+        '''
+        This function returns the number of layouts the sampler draws from
+        :return: layoutsNumber - integer
+                 None if the layouts are not enumerated (the grid is too large)
+        '''
+        if self.__layouts is None:
+            return None
+        return len(self.__layouts)
+
+    def sample(self, randomGenerator = random):
+        '''
+        This function draws a layout - uniformly from the enumerated layouts or, when there are too many of them,
+        by placing the planes one by one on the placements which are still free (this is not uniform over the layouts:
+        a layout whose first planes leave fewer free placements is drawn more often)
+        :param randomGenerator: the source of randomness - random.Random (or the random module)
+        :return: layout - tuple of placement ids
+        '''
+        if self.__layouts is not None:
+            return self.__layouts[randomGenerator.randrange(len(self.__layouts))]
+        layout = self.__sampleConditionally(randomGenerator, [], set())
+        if layout is None:
+            raise ValueError("The planes cannot be placed in the grid")
+        return tuple(layout)
+
+    def __sampleConditionally(self, randomGenerator, layout, blockedIds):
+        '''
+        This function places the remaining planes on random free placements, backtracking on dead ends. Only the
+        placements overlapping the chosen ones are stored, so the cost does not depend on the size of the grid.
+        :param randomGenerator: the source of randomness
+        :param layout: the placement ids chosen so far - list
+        :param blockedIds: the placement ids which overlap the chosen ones - set
+        :return: layout - list of placement ids
+                 None if the layout cannot be completed
+        '''
+        if len(layout) == self.__planesNumber:
+            return layout
+        excludedIds = sorted(blockedIds)
+        while len(excludedIds) < self.__table.getPlacementsNumber():
+            placementId = randomGenerator.randrange(self.__table.getPlacementsNumber() - len(excludedIds))
+            for excludedId in excludedIds:
+                if excludedId > placementId:
+                    break
+                placementId += 1
+            overlappingIds = set()
+            for cell in self.__table.getCells(placementId):
+                overlappingIds.update(self.__table.getPlacementsCoveringCell(cell[0], cell[1]))
+            layout.append(placementId)
+            if self.__sampleConditionally(randomGenerator, layout, blockedIds | overlappingIds) is not None:
+                return layout
+            layout.pop()
+            bisect.insort(excludedIds, placementId)
+        return None
+
+class TestLayoutSampler(unittest.TestCase):
+    def testLayoutsAreLegal(self):
+        sampler = LayoutSampler()
+        self.assertEqual(sampler.getLayoutsNumber(), 548)
+        randomGenerator = random.Random(7)
+        for i in range(100):
+            first, second = sampler.sample(randomGenerator)
+            self.assertEqual(placementTable.getMask(first) & placementTable.getMask(second), 0)
+
+    def testSeeded(self):
+        sampler = LayoutSampler()
+        self.assertEqual(sampler.sample(random.Random(3)), sampler.sample(random.Random(3)))
+
+    def testConditionalSampling(self):
+        LayoutSampler.enumerationLimit, limit = 0, LayoutSampler.enumerationLimit
+        try:
+            sampler = LayoutSampler(3)
+        finally:
+            LayoutSampler.enumerationLimit = limit
+        self.assertIsNone(sampler.getLayoutsNumber())
+        layout = sampler.sample(random.Random(5))
+        self.assertEqual(len(layout), 3)
+        usedMask = 0
+        for placementId in layout:
+            self.assertEqual(placementTable.getMask(placementId) & usedMask, 0)
+            usedMask |= placementTable.getMask(placementId)
+
+    def testLayoutsOfTablesWhichAreNotKept(self):
+        from utilities.placementTable import PlacementTable
+        for i in range(5):
+            self.assertEqual(LayoutSampler(2, PlacementTable(8, 8)).getLayoutsNumber(), 548)
+            table = PlacementTable(9, 7)
+            self.assertEqual(LayoutSampler(2, table).getLayoutsNumber(), 530)
+            self.assertLess(max(LayoutSampler(2, table).sample(random.Random(i))), table.getPlacementsNumber())
+            del table
+
+    def testLargeBoard(self):
+        from utilities.placementTable import PlacementTable
+        table = PlacementTable.forBoard(1000, 1000)
+        layout = LayoutSampler(5, table).sample(random.Random(1))
+        usedCells = set()
+        for placementId in layout:
+            cells = set(table.getCells(placementId))
+            self.assertEqual(cells & usedCells, set())
+            usedCells |= cells
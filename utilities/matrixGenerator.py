@@ -2,7 +2,6 @@
 MatrixGenerator class - generates matrixes of different values
 '''
 
-from copy import deepcopy
 import unittest
 
 class MatrixGenerator:
@@ -11,16 +10,14 @@ class MatrixGenerator:
         '''
         This function generates a matrix with 'rowCounter' rows, 'columnCounter' columns and fills it with
         'fillingElement'
+        (the element is shared by all the cells, so it should be immutable)
         :param rowCounter: the number of rows of matrix - integer
         :param columnCounter: the number of columns of matrix - integer
         :param fillingElement: the element which the matrix needs to be filled with - any type
         :return: matrix: the generated matrix
         '''
-        matrix = []
         elementaryRow = [fillingElement] * columnCounter
-        for i in range(rowCounter):
-            matrix += [deepcopy(elementaryRow)]
-        return matrix
+        return [elementaryRow[:] for i in range(rowCounter)]
 
 class TestMatrixGenerator(unittest.TestCase):
     def testGenerateMatrix(self):
@@ -0,0 +1,188 @@
+'''
+MoveLog class - the append-only history of a game: the placed planes, then the (shooter, cell, result) triples of the
+shots, each one kept as a single variable-length integer
+'''
+
+from utilities.gameSnapshot import GameSnapshot
+from utilities.placementTable import PlacementTable
+from array import array
+import unittest
+
+class MoveLog:
+    magic = b"PLM"
+    version = 1
+    shooters = ["player", "computer"]
+    hitResults = ["miss", "hit", "cabin"]
+    __playerPlacement = 0
+    __computerPlacement = 1
+    __playerShot = 2
+    __computerShot = 3
+
+    def __init__(self, rowsNumber, columnsNumber, planesNumber):
+        '''
+        The initialiser of the MoveLog object
+        :param rowsNumber: the number of rows of the grids - integer
+        :param columnsNumber: the number of columns of the grids - integer
+        :param planesNumber: the number of planes every side places - integer
+        '''
+        self.__rowsNumber = rowsNumber
+        self.__columnsNumber = columnsNumber
+        self.__planesNumber = planesNumber
+        self.__records = bytearray()
+        self.__moveOffsets = array("I")
+        self.__placements = ([], [])
+
+    def clear(self):
+        '''
+        This function forgets the whole history (a new game starts)
+        :return: nothing
+        '''
+        self.__records = bytearray()
+        self.__moveOffsets = array("I")
+        self.__placements = ([], [])
+
+    def getRowsNumber(self):
+        return self.__rowsNumber
+
+    def getColumnsNumber(self):
+        return self.__columnsNumber
+
+    def getPlanesNumber(self):
+        return self.__planesNumber
+
+    def __appendRecord(self, kind, payload, result = 0):
+        '''
+        This function appends a record: the payload, then 2 bits for the result and 2 bits for the kind
+        :return: nothing
+        '''
+        GameSnapshot.writeVarint(self.__records, (payload << 4) | (result << 2) | kind)
+
+    def appendPlacement(self, side, placementId):
+        '''
+        This function records a placed plane
+        :param side: the owner of the plane - "player" or "computer"
+        :param placementId: the id of the placement of the plane - integer
+        :return: nothing
+        '''
+        sideIndex = MoveLog.shooters.index(side)
+        self.__appendRecord(MoveLog.__playerPlacement + sideIndex, placementId)
+        self.__placements[sideIndex].append(placementId)
+
+    def appendShot(self, shooter, cell, hitResult):
+        '''
+        This function records a shot
+        :param shooter: the side which fired - "player" or "computer"
+        :param cell: the shot cell - (row, column) tuple
+        :param hitResult: the result of the shot - "miss", "hit" or "cabin"
+        :return: nothing
+        '''
+        kind = MoveLog.__playerShot + MoveLog.shooters.index(shooter)
+        self.__moveOffsets.append(len(self.__records))
+        self.__appendRecord(kind, cell[0] * self.__columnsNumber + cell[1], MoveLog.hitResults.index(hitResult))
+
+    def getPlacements(self, side):
+        '''
+        This function returns the placed planes of a side
+        :param side: "player" or "computer"
+        :return: placementIds - list of integers, in placing order
+        '''
+        return list(self.__placements[MoveLog.shooters.index(side)])
+
+    def getMovesNumber(self):
+        return len(self.__moveOffsets)
+
+    def getMove(self, moveIndex):
+        '''
+        This function returns a recorded shot
+        :param moveIndex: the index of the shot (0 for the first one) - integer
+        :return: shooter, cell, hitResult - string, (row, column) tuple, string
+        '''
+        value = GameSnapshot.readVarint(self.__records, self.__moveOffsets[moveIndex])[0]
+        payload = value >> 4
+        shooter = MoveLog.shooters[(value & 3) - MoveLog.__playerShot]
+        return shooter, (payload // self.__columnsNumber, payload % self.__columnsNumber), MoveLog.hitResults[(value >> 2) & 3]
+
+    def toBytes(self):
+        '''
+        This function encodes the log: a versioned header (the grid size and the planes number), then the records
+        :return: data - bytes
+        '''
+        output = bytearray(MoveLog.magic)
+        output.append(MoveLog.version)
+        for value in [self.__rowsNumber, self.__columnsNumber, self.__planesNumber]:
+            GameSnapshot.writeVarint(output, value)
+        return bytes(output + self.__records)
+
+    @staticmethod
+    def fromBytes(data):
+        '''
+        This function decodes a log encoded by toBytes
+        :param data: the encoded log - bytes
+        :return: moveLog - MoveLog
+                 a ValueError is raised if the header or a record does not describe a game of the grid
+        '''
+        if data[:len(MoveLog.magic)] != MoveLog.magic:
+            raise ValueError("Not a move log")
+        position = len(MoveLog.magic)
+        if len(data) <= position or data[position] != MoveLog.version:
+            raise ValueError("Unsupported move log version")
+        position += 1
+        header = []
+        for i in range(3):
+            value, position = GameSnapshot.readVarint(data, position)
+            header.append(value)
+        if 0 in header:
+            raise ValueError("Invalid move log header")
+        moveLog = MoveLog(header[0], header[1], header[2])
+        cellsNumber = header[0] * header[1]
+        placementsNumber = PlacementTable.forBoard(header[0], header[1]).getPlacementsNumber()
+        while position < len(data):
+            value, position = GameSnapshot.readVarint(data, position)
+            kind = value & 3
+            result = (value >> 2) & 3
+            payload = value >> 4
+            if kind >= MoveLog.__playerShot:
+                if payload >= cellsNumber or result >= len(MoveLog.hitResults):
+                    raise ValueError("Invalid shot in the move log")
+                cell = (payload // header[1], payload % header[1])
+                moveLog.appendShot(MoveLog.shooters[kind - MoveLog.__playerShot], cell, MoveLog.hitResults[result])
+            else:
+                if payload >= placementsNumber or result != 0:
+                    raise ValueError("Invalid placement in the move log")
+                moveLog.appendPlacement(MoveLog.shooters[kind], payload)
+        return moveLog
+
+class TestMoveLog(unittest.TestCase):
+    def setUp(self):
+        self.moveLog = MoveLog(8, 8, 2)
+        self.moveLog.appendPlacement("computer", 40)
+        self.moveLog.appendPlacement("player", 7)
+        self.moveLog.appendShot("player", (0, 0), "miss")
+        self.moveLog.appendShot("computer", (7, 7), "cabin")
+        self.moveLog.appendPlacement("player", 70)
+        self.moveLog.appendShot("player", (3, 5), "hit")
+
+    def testRecords(self):
+        self.assertEqual(self.moveLog.getPlacements("player"), [7, 70])
+        self.assertEqual(self.moveLog.getPlacements("computer"), [40])
+        self.assertEqual(self.moveLog.getMovesNumber(), 3)
+        self.assertEqual(self.moveLog.getMove(1), ("computer", (7, 7), "cabin"))
+        self.assertEqual(self.moveLog.getMove(2), ("player", (3, 5), "hit"))
+        self.moveLog.clear()
+        self.assertEqual((self.moveLog.getMovesNumber(), self.moveLog.getPlacements("player")), (0, []))
+
+    def testBytes(self):
+        data = self.moveLog.toBytes()
+        self.assertLessEqual(len(data), 7 + 2 * 6)
+        decodedLog = MoveLog.fromBytes(data)
+        self.assertEqual(decodedLog.toBytes(), data)
+        self.assertEqual([decodedLog.getMove(i) for i in range(3)], [self.moveLog.getMove(i) for i in range(3)])
+        self.assertRaises(ValueError, MoveLog.fromBytes, b"PLN" + data[3:])
+        self.assertRaises(ValueError, MoveLog.fromBytes, data[:-1] + bytes([data[-1] | 0x80]))
+
+    def testInvalidPlacementsAndHeader(self):
+        invalidLog = MoveLog(8, 8, 2)
+        invalidLog.appendPlacement("player", 80)
+        self.assertRaises(ValueError, MoveLog.fromBytes, invalidLog.toBytes())
+        for rowsNumber, columnsNumber, planesNumber in [(0, 8, 2), (8, 0, 2), (8, 8, 0)]:
+            self.assertRaises(ValueError, MoveLog.fromBytes, MoveLog(rowsNumber, columnsNumber, planesNumber).toBytes())
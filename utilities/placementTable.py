@@ -0,0 +1,413 @@
+'''
+PlacementTable class - every in-bounds (cabin, orientation) placement of a plane, with dense ids
+'''
+
+from utilities.gameConstants import GameConstants
+from array import array
+import unittest
+
+class PlacementTable:
+    orientations = ["up", "down", "left", "right"]
+    eagerCellsLimit = 4096
+    __tables = {}
+
+    def __init__(self, rowsNumber = GameConstants.rowsNumber, columnsNumber = GameConstants.columnsNumber):
+        '''
+        The initialiser of the PlacementTable object. The placements of one orientation have consecutive ids, their cabins
+        filling a rectangle of the grid row by row, so ids are computed arithmetically. On grids of at most eagerCellsLimit
+        cells the cells, masks and per cell indexes of every placement are computed once here, on larger grids on demand.
+        :param rowsNumber: the number of rows of the grid - integer
+        :param columnsNumber: the number of columns of the grid - integer
+        '''
+        self.__rowsNumber = rowsNumber
+        self.__columnsNumber = columnsNumber
+        self.__offsets = []
+        self.__cabinLimits = []
+        self.__firstIds = []
+        placementsNumber = 0
+        for orientation in PlacementTable.orientations:
+            sign = GameConstants.directionSign[orientation]
+            offsets = tuple((sign * direction[0], sign * direction[1]) for direction in GameConstants.directions[orientation])
+            minimumRow = -min(offset[0] for offset in offsets)
+            maximumRow = rowsNumber - 1 - max(offset[0] for offset in offsets)
+            minimumColumn = -min(offset[1] for offset in offsets)
+            maximumColumn = columnsNumber - 1 - max(offset[1] for offset in offsets)
+            self.__offsets.append(offsets)
+            self.__cabinLimits.append((minimumRow, maximumRow, minimumColumn, maximumColumn))
+            self.__firstIds.append(placementsNumber)
+            placementsNumber += max(maximumRow - minimumRow + 1, 0) * max(maximumColumn - minimumColumn + 1, 0)
+        self.__placementsNumber = placementsNumber
+        self.__cells = None
+        if rowsNumber * columnsNumber <= PlacementTable.eagerCellsLimit:
+            self.__computeEagerly()
+
+    @staticmethod
+    def __idTypecode(placementsNumber):
+        '''
+        This function returns the smallest array typecode which holds the placement ids of a grid
+        :param placementsNumber: the number of placements - integer
+        :return: typecode - "H" or "I"
+        '''
+        return "H" if placementsNumber <= 1 << 16 else "I"
+
+    def __computeEagerly(self):
+        '''
+        This function computes the cells, the masks and the per cell indexes of every placement. The indexes are packed
+        in one array: for every cell the placements with their cabin on it, then the placements with their body on it,
+        the bounds of both runs being kept in cellPlacementStarts (cell i owns entries 2 * i to 2 * i + 2)
+        :return: nothing
+        '''
+        self.__placementIds = {}
+        cellsNumber = self.__rowsNumber * self.__columnsNumber
+        cabinPlacements = [[] for cellIndex in range(cellsNumber)]
+        bodyPlacements = [[] for cellIndex in range(cellsNumber)]
+        cells = [self.__computeCells(placementId) for placementId in range(self.__placementsNumber)]
+        self.__masks = [self.__computeMask(placementCells) for placementCells in cells]
+        self.__cellIndexes = [self.__computeCellIndexes(placementCells) for placementCells in cells]
+        self.__placementIdsByMask = {mask: placementId for placementId, mask in enumerate(self.__masks)}
+        for placementId in range(self.__placementsNumber):
+            cabin = cells[placementId][0]
+            cabinLocation = GameConstants.coordinatesToCellString(cabin[0], cabin[1])
+            self.__placementIds[(cabinLocation, self.getOrientation(placementId))] = placementId
+            cabinPlacements[cabin[0] * self.__columnsNumber + cabin[1]].append(placementId)
+            for cell in cells[placementId][1:]:
+                bodyPlacements[cell[0] * self.__columnsNumber + cell[1]].append(placementId)
+        self.__cellPlacementIds = array(PlacementTable.__idTypecode(self.__placementsNumber))
+        self.__cellPlacementStarts = array("I", [0])
+        for cellIndex in range(cellsNumber):
+            self.__cellPlacementIds.extend(cabinPlacements[cellIndex])
+            self.__cellPlacementStarts.append(len(self.__cellPlacementIds))
+            self.__cellPlacementIds.extend(bodyPlacements[cellIndex])
+            self.__cellPlacementStarts.append(len(self.__cellPlacementIds))
+        self.__cells = cells
+
+    @staticmethod
+    def forBoard(rowsNumber, columnsNumber):
+        '''
+        This function returns the placement table of a grid size (every size gets one shared table)
+        :param rowsNumber: the number of rows of the grid - integer
+        :param columnsNumber: the number of columns of the grid - integer
+        :return: table - PlacementTable
+        '''
+        key = (rowsNumber, columnsNumber)
+        if key not in PlacementTable.__tables:
+            PlacementTable.__tables[key] = PlacementTable(rowsNumber, columnsNumber)
+        return PlacementTable.__tables[key]
+
+    def __computeCells(self, placementId):
+        '''
+        This function computes the cells covered by a placement
+        :param placementId: the id of the placement - integer
+        :return: cells - tuple of (row, column) tuples, the cabin being the first one
+        '''
+        row, column = self.getCabin(placementId)
+        return tuple((row + offset[0], column + offset[1]) for offset in self.__offsets[self.__orientationIndex(placementId)])
+
+    def __computeCellIndexes(self, cells):
+        '''
+        This function computes the indexes (row * columnsNumber + column) of some cells
+        :param cells: the cells - iterable of (row, column) tuples
+        :return: cellIndexes - tuple of integers
+        '''
+        return tuple(cell[0] * self.__columnsNumber + cell[1] for cell in cells)
+
+    def __computeMask(self, cells):
+        '''
+        This function computes the bitmask of some cells
+        :param cells: the cells - iterable of (row, column) tuples
+        :return: mask - integer
+        '''
+        mask = 0
+        for cell in cells:
+            mask |= 1 << (cell[0] * self.__columnsNumber + cell[1])
+        return mask
+
+    def __orientationIndex(self, placementId):
+        '''
+        This function returns the index (in orientations) of the orientation of a placement
+        :param placementId: the id of the placement - integer
+        :return: orientationIndex - integer
+        '''
+        orientationIndex = 3
+        while self.__firstIds[orientationIndex] > placementId:
+            orientationIndex -= 1
+        return orientationIndex
+
+    def __placementIdFromCabin(self, row, column, orientationIndex):
+        '''
+        This function computes the id of a placement from its cabin
+        :param row: the row of the cabin - integer
+        :param column: the column of the cabin - integer
+        :param orientationIndex: the index of the orientation in orientations - integer
+        :return: placementId - integer
+                 None if the plane does not fit in the grid
+        '''
+        minimumRow, maximumRow, minimumColumn, maximumColumn = self.__cabinLimits[orientationIndex]
+        if row < minimumRow or row > maximumRow or column < minimumColumn or column > maximumColumn:
+            return None
+        width = maximumColumn - minimumColumn + 1
+        return self.__firstIds[orientationIndex] + (row - minimumRow) * width + column - minimumColumn
+
+    def getRowsNumber(self):
+        '''
+        rowsNumber getter
+        :return: rowsNumber - the number of rows of the grid
+        '''
+        return self.__rowsNumber
+
+    def getColumnsNumber(self):
+        '''
+        columnsNumber getter
+        :return: columnsNumber - the number of columns of the grid
+        '''
+        return self.__columnsNumber
+
+    def getPlacementsNumber(self):
+        '''
+        This function returns the number of in-bounds placements
+        :return: placementsNumber - integer
+        '''
+        return self.__placementsNumber
+
+    def getPlacementId(self, cabinLocation, cabinOrientation):
+        '''
+        This function looks a placement up by its cabin
+        :param cabinLocation: the cell of the cabin - string (e.g. A2, C7, H1)
+        :param cabinOrientation: the way the cabin points to (up/down/left/right)
+        :return: placementId - integer
+                 None if the plane does not fit in the grid (or the data is invalid)
+        '''
+        if self.__cells is not None:
+            return self.__placementIds.get((cabinLocation, cabinOrientation))
+        if cabinOrientation not in PlacementTable.orientations:
+            return None
+        try:
+            row, column = GameConstants.cellStringToCoordinates(cabinLocation)
+        except ValueError:
+            return None
+        return self.__placementIdFromCabin(row, column, PlacementTable.orientations.index(cabinOrientation))
+
+    def getPlacementIdFromMask(self, mask):
+        '''
+        This function recognises a placement from the bitmask of its cells (a dictionary lookup on the eagerly computed
+        tables, otherwise a check of the one candidate of every orientation whose first cell is the lowest bit)
+        :param mask: the cells - integer bitmask (bit row * columnsNumber + column)
+        :return: placementId - integer
+                 None if the cells are not exactly the cells of a placement
+        '''
+        if self.__cells is not None:
+            return self.__placementIdsByMask.get(mask)
+        if mask <= 0:
+            return None
+        firstRow, firstColumn = divmod((mask & -mask).bit_length() - 1, self.__columnsNumber)
+        for orientationIndex in range(4):
+            firstOffset = min(self.__offsets[orientationIndex])
+            placementId = self.__placementIdFromCabin(firstRow - firstOffset[0], firstColumn - firstOffset[1], orientationIndex)
+            if placementId is not None and self.getMask(placementId) == mask:
+                return placementId
+        return None
+
+    def getCells(self, placementId):
+        '''
+        This function returns the cells covered by a placement, the cabin being the first one
+        :param placementId: the id of the placement - integer
+        :return: cells - tuple of (row, column) tuples
+        '''
+        if self.__cells is not None:
+            return self.__cells[placementId]
+        return self.__computeCells(placementId)
+
+    def getCellIndexes(self, placementId):
+        '''
+        This function returns the indexes (row * columnsNumber + column) of the cells covered by a placement, the cabin
+        being the first one
+        :param placementId: the id of the placement - integer
+        :return: cellIndexes - tuple of integers
+        '''
+        if self.__cells is not None:
+            return self.__cellIndexes[placementId]
+        return self.__computeCellIndexes(self.__computeCells(placementId))
+
+    def getMask(self, placementId):
+        '''
+        This function returns the bitmask of the cells covered by a placement (bit row * columnsNumber + column)
+        :param placementId: the id of the placement - integer
+        :return: mask - integer
+        '''
+        if self.__cells is not None:
+            return self.__masks[placementId]
+        return self.__computeMask(self.__computeCells(placementId))
+
+    def getCabin(self, placementId):
+        '''
+        This function returns the cabin coordinates of a placement
+        :param placementId: the id of the placement - integer
+        :return: (row, column) tuple
+        '''
+        if self.__cells is not None:
+            return self.__cells[placementId][0]
+        orientationIndex = self.__orientationIndex(placementId)
+        minimumRow, maximumRow, minimumColumn, maximumColumn = self.__cabinLimits[orientationIndex]
+        rowOffset, columnOffset = divmod(placementId - self.__firstIds[orientationIndex], maximumColumn - minimumColumn + 1)
+        return (minimumRow + rowOffset, minimumColumn + columnOffset)
+
+    def getOrientation(self, placementId):
+        '''
+        This function returns the orientation of a placement
+        :param placementId: the id of the placement - integer
+        :return: orientation - string (up/down/left/right)
+        '''
+        return PlacementTable.orientations[self.__orientationIndex(placementId)]
+
+    def __cellPlacements(self, row, column, first, last):
+        '''
+        This function returns a part of the eagerly computed placements of a cell
+        :param row: the row of the cell
+        :param column: the column of the cell
+        :param first: 0 for the run of the cabin placements, 1 for the one of the body placements
+        :param last: 1 to stop after the cabin placements, 2 to include the body placements
+        :return: placementIds - array of integers
+        '''
+        startIndex = 2 * (row * self.__columnsNumber + column)
+        starts = self.__cellPlacementStarts
+        return self.__cellPlacementIds[starts[startIndex + first]:starts[startIndex + last]]
+
+    def getPlacementsCoveringCell(self, row, column):
+        '''
+        This function returns the placements which cover a cell (the ones with their cabin on it, then the ones with their
+        body on it)
+        :param row: the row of the cell
+        :param column: the column of the cell
+        :return: placementIds - array of integers
+        '''
+        if self.__cells is not None:
+            return self.__cellPlacements(row, column, 0, 2)
+        placementIds = self.getPlacementsWithCabin(row, column)
+        placementIds.extend(self.getPlacementsWithBody(row, column))
+        return placementIds
+
+    def getPlacementsWithCabin(self, row, column):
+        '''
+        This function returns the placements which have their cabin on a cell
+        :param row: the row of the cell
+        :param column: the column of the cell
+        :return: placementIds - array of integers
+        '''
+        if self.__cells is not None:
+            return self.__cellPlacements(row, column, 0, 1)
+        placementIds = array(PlacementTable.__idTypecode(self.__placementsNumber))
+        for orientationIndex in range(4):
+            placementId = self.__placementIdFromCabin(row, column, orientationIndex)
+            if placementId is not None:
+                placementIds.append(placementId)
+        return placementIds
+
+    def getPlacementsWithBody(self, row, column):
+        '''
+        This function returns the placements which cover a cell with another part than their cabin
+        :param row: the row of the cell
+        :param column: the column of the cell
+        :return: placementIds - array of integers
+        '''
+        if self.__cells is not None:
+            return self.__cellPlacements(row, column, 1, 2)
+        placementIds = []
+        for orientationIndex in range(4):
+            for offset in self.__offsets[orientationIndex][1:]:
+                placementId = self.__placementIdFromCabin(row - offset[0], column - offset[1], orientationIndex)
+                if placementId is not None:
+                    placementIds.append(placementId)
+        return array(PlacementTable.__idTypecode(self.__placementsNumber), sorted(placementIds))
+
+placementTable = PlacementTable.forBoard(GameConstants.rowsNumber, GameConstants.columnsNumber)
+
+class TestPlacementTable(unittest.TestCase):
+    def testPlacementsNumber(self):
+        self.assertEqual(placementTable.getPlacementsNumber(), 80)
+
+    def testGetPlacementId(self):
+        placementId = placementTable.getPlacementId("A5", "left")
+        self.assertIsNotNone(placementId)
+        self.assertEqual(placementTable.getCabin(placementId), (4, 0))
+        self.assertEqual(placementTable.getOrientation(placementId), "left")
+        self.assertIsNone(placementTable.getPlacementId("A5", "right"))
+        self.assertIsNone(placementTable.getPlacementId("K9", "up"))
+
+    def testCellsAndMask(self):
+        placementId = placementTable.getPlacementId("A5", "left")
+        cells = placementTable.getCells(placementId)
+        self.assertEqual(cells[0], (4, 0))
+        self.assertEqual(set(cells), {(4, 0), (2, 1), (3, 1), (4, 1), (5, 1), (6, 1), (4, 2), (3, 3), (4, 3), (5, 3)})
+        mask = 0
+        for cell in cells:
+            mask |= 1 << (cell[0] * 8 + cell[1])
+        self.assertEqual(placementTable.getMask(placementId), mask)
+        self.assertEqual(placementTable.getCellIndexes(placementId), tuple(cell[0] * 8 + cell[1] for cell in cells))
+
+    def testCellIndexes(self):
+        for row in range(8):
+            for column in range(8):
+                for placementId in placementTable.getPlacementsCoveringCell(row, column):
+                    self.assertIn((row, column), placementTable.getCells(placementId))
+                for placementId in placementTable.getPlacementsWithCabin(row, column):
+                    self.assertEqual(placementTable.getCabin(placementId), (row, column))
+                for placementId in placementTable.getPlacementsWithBody(row, column):
+                    self.assertIn((row, column), placementTable.getCells(placementId)[1:])
+                self.assertEqual(list(placementTable.getPlacementsCoveringCell(row, column)),
+                                 list(placementTable.getPlacementsWithCabin(row, column)) +
+                                 list(placementTable.getPlacementsWithBody(row, column)))
+        covering = sum(len(placementTable.getPlacementsCoveringCell(row, column)) for row in range(8) for column in range(8))
+        self.assertEqual(covering, 10 * placementTable.getPlacementsNumber())
+        self.assertEqual(len(placementTable.getPlacementsWithCabin(0, 0)), 0)
+        self.assertEqual(len(placementTable.getPlacementsWithCabin(3, 3)), 4)
+
+    def testGetPlacementIdFromMask(self):
+        placementId = placementTable.getPlacementId("A5", "left")
+        self.assertEqual(placementTable.getPlacementIdFromMask(placementTable.getMask(placementId)), placementId)
+        self.assertIsNone(placementTable.getPlacementIdFromMask(placementTable.getMask(placementId) >> 1))
+        self.assertIsNone(placementTable.getPlacementIdFromMask(0))
+
+    def testIdsAreDense(self):
+        ids = set()
+        for orientation in PlacementTable.orientations:
+            for row in range(8):
+                for column in range(8):
+                    placementId = placementTable.getPlacementId(GameConstants.coordinatesToCellString(row, column), orientation)
+                    if placementId is not None:
+                        ids.add(placementId)
+        self.assertEqual(ids, set(range(placementTable.getPlacementsNumber())))
+
+    def testLazyTableMatchesEagerTable(self):
+        PlacementTable.eagerCellsLimit, limit = 0, PlacementTable.eagerCellsLimit
+        try:
+            lazyTable = PlacementTable(9, 11)
+        finally:
+            PlacementTable.eagerCellsLimit = limit
+        eagerTable = PlacementTable(9, 11)
+        self.assertEqual(lazyTable.getPlacementsNumber(), eagerTable.getPlacementsNumber())
+        for placementId in range(eagerTable.getPlacementsNumber()):
+            self.assertEqual(lazyTable.getCells(placementId), eagerTable.getCells(placementId))
+            self.assertEqual(lazyTable.getMask(placementId), eagerTable.getMask(placementId))
+            self.assertEqual(lazyTable.getCellIndexes(placementId), eagerTable.getCellIndexes(placementId))
+            self.assertEqual(lazyTable.getOrientation(placementId), eagerTable.getOrientation(placementId))
+            self.assertEqual(lazyTable.getPlacementIdFromMask(eagerTable.getMask(placementId)), placementId)
+            cabin = eagerTable.getCabin(placementId)
+            cabinLocation = GameConstants.coordinatesToCellString(cabin[0], cabin[1])
+            self.assertEqual(lazyTable.getPlacementId(cabinLocation, eagerTable.getOrientation(placementId)), placementId)
+        for row in range(9):
+            for column in range(11):
+                self.assertEqual(lazyTable.getPlacementsCoveringCell(row, column), eagerTable.getPlacementsCoveringCell(row, column))
+                self.assertEqual(lazyTable.getPlacementsWithCabin(row, column), eagerTable.getPlacementsWithCabin(row, column))
+                self.assertEqual(lazyTable.getPlacementsWithBody(row, column), eagerTable.getPlacementsWithBody(row, column))
+        self.assertIsNone(lazyTable.getPlacementId("A5", "right"))
+        self.assertIsNone(lazyTable.getPlacementId("9A", "up"))
+        self.assertIsNone(lazyTable.getPlacementIdFromMask(eagerTable.getMask(0) | 1 << 98))
+        self.assertIsNone(lazyTable.getPlacementIdFromMask(0))
+
+    def testLargeBoard(self):
+        table = PlacementTable.forBoard(2000, 3000)
+        self.assertIs(table, PlacementTable.forBoard(2000, 3000))
+        self.assertEqual(table.getPlacementsNumber(), 2 * 1997 * 2996 + 2 * 1996 * 2997)
+        placementId = table.getPlacementId("ABC1000", "right")
+        self.assertEqual(table.getCabin(placementId), (999, 730))
+        self.assertIn(placementId, table.getPlacementsCoveringCell(999, 727))
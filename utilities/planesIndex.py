@@ -0,0 +1,118 @@
+'''
+PlanesIndex class - keeps the planes of a player indexed by their cells, for constant time hit resolution
+'''
+
+import copy
+import unittest
+
+class PlanesIndex:
+    def __init__(self):
+        '''
+        Initialiser of the PlanesIndex class
+        '''
+        self.__planesList = []
+        self.__cabinIndex = {}
+        self.__cellOwner = {}
+        self.__remainingCells = []
+        self.__remainingPlanesNumber = 0
+
+    def copy(self):
+        '''
+        This function returns an independent copy of the index (the planes themselves are shared)
+        :return: planesIndex - PlanesIndex
+        '''
+        indexCopy = copy.copy(self)
+        indexCopy.__planesList = self.__planesList[:]
+        indexCopy.__cabinIndex = dict(self.__cabinIndex)
+        indexCopy.__cellOwner = dict(self.__cellOwner)
+        indexCopy.__remainingCells = self.__remainingCells[:]
+        return indexCopy
+
+    def addPlane(self, plane):
+        '''
+        This function indexes a newly placed plane
+        :param plane: the given plane - Plane
+        :return: nothing
+        '''
+        planeIndex = len(self.__planesList)
+        planeCells = plane.getPlaneCellsList()
+        self.__planesList.append(plane)
+        self.__cabinIndex[planeCells[0]] = planeIndex
+        for planeCell in planeCells:
+            self.__cellOwner[planeCell] = planeIndex
+        self.__remainingCells.append(len(planeCells))
+        self.__remainingPlanesNumber += 1
+
+    def registerHit(self, cellCoordinates):
+        '''
+        This function registers the first hit of a plane cell
+        :param cellCoordinates: the coordinates of the hit cell - (row, column) tuple
+        :return: True if the cell was the cabin of an active plane (the plane is destroyed)
+                 False otherwise
+        '''
+        planeIndex = self.__cellOwner.get(cellCoordinates)
+        if planeIndex is None:
+            return False
+        self.__remainingCells[planeIndex] -= 1
+        if self.__cabinIndex.get(cellCoordinates) == planeIndex:
+            del self.__cabinIndex[cellCoordinates]
+            self.__remainingPlanesNumber -= 1
+            return True
+        return False
+
+    def getPlanesList(self):
+        '''
+        This function returns the planes in the order they were placed (destroyed ones included)
+        :return: planesList - list of Plane objects
+        '''
+        return self.__planesList
+
+    def getRemainingPlanesNumber(self):
+        '''
+        This function returns the number of planes whose cabin has not been hit
+        :return: remainingPlanesNumber - integer
+        '''
+        return self.__remainingPlanesNumber
+
+    def getRemainingCellsNumber(self, planeIndex):
+        '''
+        This function returns the number of cells of a plane which have not been hit
+        :param planeIndex: the index of the plane (in placing order) - integer
+        :return: remainingCellsNumber - integer
+        '''
+        return self.__remainingCells[planeIndex]
+
+    def clear(self):
+        '''
+        This function removes all the planes
+        :return: nothing
+        '''
+        self.__planesList.clear()
+        self.__cabinIndex.clear()
+        self.__cellOwner.clear()
+        self.__remainingCells.clear()
+        self.__remainingPlanesNumber = 0
+
+class TestPlanesIndex(unittest.TestCase):
+    def setUp(self):
+        from model.plane import Plane
+        self.planesIndex = PlanesIndex()
+        self.planesIndex.addPlane(Plane("A5", "left"))
+        self.planesIndex.addPlane(Plane("F8", "down"))
+
+    def testRegisterHit(self):
+        self.assertEqual(self.planesIndex.getRemainingPlanesNumber(), 2)
+        self.assertFalse(self.planesIndex.registerHit((0, 0)))
+        self.assertFalse(self.planesIndex.registerHit((3, 1)))
+        self.assertEqual(self.planesIndex.getRemainingCellsNumber(0), 9)
+        self.assertTrue(self.planesIndex.registerHit((4, 0)))
+        self.assertEqual(self.planesIndex.getRemainingPlanesNumber(), 1)
+        self.assertEqual(self.planesIndex.getRemainingCellsNumber(0), 8)
+        self.assertTrue(self.planesIndex.registerHit((7, 5)))
+        self.assertEqual(self.planesIndex.getRemainingPlanesNumber(), 0)
+
+    def testClear(self):
+        self.planesIndex.clear()
+        self.assertEqual(self.planesIndex.getRemainingPlanesNumber(), 0)
+        self.assertEqual(self.planesIndex.getPlanesList(), [])
+        self.assertFalse(self.planesIndex.registerHit((4, 0)))
@@ -2,36 +2,73 @@
 Queue class - used in a BFS-like strategy for the computer moves
 '''
 
+from collections import deque
 import unittest
 
 class Queue:
-    def __init__(self):
+    def __init__(self, isItemStale = None):
         '''
         Initialiser of the Queue class
+        :param isItemStale: function which tells if a queued item is no longer needed (such items are dropped
+                            when they reach the front of the queue) - None if items never become stale
         '''
-        self.__data = []
+        self.__data = deque()
+        self.__queuedItems = set()
+        self.__isItemStale = isItemStale
+
+    def copy(self, isItemStale = None):
+        '''
+        This function returns an independent copy of the queue
+        :param isItemStale: the stale items test of the copy (see the initialiser)
+        :return: queue - Queue
+        '''
+        queueCopy = Queue(isItemStale)
+        queueCopy.__data = deque(self.__data)
+        queueCopy.__queuedItems = set(self.__queuedItems)
+        return queueCopy
 
     def push(self, item):
         '''
         This function pushes an item into the queue (at the end of the queue)
-        :param item: the given item
-        :return: nothing
+        :param item: the given item - hashable
+        :return: nothing (an item which is already in the queue is not pushed again)
         '''
+        if item in self.__queuedItems:
+            return
+        self.__queuedItems.add(item)
         self.__data.append(item)
 
     def pop(self):
         '''
-        This function deletes the first item of the queue and returns it
+        This function deletes the first item of the queue which is not stale and returns it
         :return: item - the first item in the queue
-                 None if there are no elements in the queue
+                 None if there are no (non-stale) elements in the queue
         '''
-        if len(self.__data) == 0:
-            return None
-        return self.__data.pop(0)
+        while len(self.__data) > 0:
+            item = self.__data.popleft()
+            self.__queuedItems.discard(item)
+            if self.__isItemStale is None or self.__isItemStale(item) is False:
+                return item
+        return None
+
+    def contains(self, item):
+        '''
+        This function tells if an item is in the queue
+        :param item: the given item
+        :return: True or False accordingly
+        '''
+        return item in self.__queuedItems
+
+    def getItems(self):
+        '''
+        This function returns the items of the queue, from the first to the last one (stale ones included)
+        :return: items - list
+        '''
+        return list(self.__data)
 
     def size(self):
         '''
-        This function returns the number of the elements in the queue
+        This function returns the number of the elements in the queue (stale ones included)
         :return: size - integer
         '''
         return len(self.__data)
@@ -42,6 +79,7 @@ class Queue:
         :return: nothing
         '''
         self.__data.clear()
+        self.__queuedItems.clear()
 
 class TestQueue(unittest.TestCase):
     def setUp(self):
@@ -56,11 +94,46 @@ class TestQueue(unittest.TestCase):
         self.assertEqual(self.queue.pop(), 1)
         self.assertEqual(self.queue.pop(), 2)
         self.assertEqual(self.queue.pop(), 3)
+        self.assertIsNone(self.queue.pop())
 
     def testClear(self):
         self.queue.push(1)
-        self.queue.push(1)
-        self.queue.push(1)
+        self.queue.push(2)
+        self.queue.push(3)
         self.assertEqual(self.queue.size(), 3)
         self.queue.clear()
-        self.assertEqual(self.queue.size(), 0)
\ No newline at end of file
+        self.assertEqual(self.queue.size(), 0)
+        self.assertFalse(self.queue.contains(1))
+
+    def testDuplicatesAreIgnored(self):
+        self.queue.push(1)
+        self.queue.push(2)
+        self.queue.push(1)
+        self.assertEqual(self.queue.size(), 2)
+        self.assertEqual(self.queue.getItems(), [1, 2])
+        self.assertTrue(self.queue.contains(1))
+        self.assertEqual(self.queue.pop(), 1)
+        self.assertFalse(self.queue.contains(1))
+        self.queue.push(1)
+        self.assertEqual(self.queue.getItems(), [2, 1])
+
+    def testStaleItemsAreDropped(self):
+        knownItems = set()
+        queue = Queue(lambda item: item in knownItems)
+        for item in range(5):
+            queue.push(item)
+        knownItems.update([0, 1, 3])
+        self.assertEqual(queue.pop(), 2)
+        self.assertEqual(queue.pop(), 4)
+        self.assertIsNone(queue.pop())
+        self.assertEqual(queue.size(), 0)
+
+    def testCopy(self):
+        for item in range(3):
+            self.queue.push(item)
+        queueCopy = self.queue.copy(lambda item: item == 0)
+        self.queue.pop()
+        queueCopy.push(5)
+        self.assertEqual(self.queue.getItems(), [1, 2])
+        self.assertEqual(queueCopy.getItems(), [0, 1, 2, 5])
+        self.assertEqual(queueCopy.pop(), 1)
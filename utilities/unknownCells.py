@@ -0,0 +1,116 @@
+'''
+UnknownCells class - the cells of a grid which have not been shot yet, with constant time uniform sampling
+'''
+
+from utilities.indexedSet import IndexedSet
+import copy
+import random
+import unittest
+
+class UnknownCells:
+    def __init__(self, rowsNumber, columnsNumber):
+        '''
+        Initialiser of the UnknownCells class. While less than half of the grid is known, only the known cells are
+        stored and a draw takes fewer than two attempts on average; past that point the unknown cells are moved into an
+        IndexedSet once, so memory and time never depend on the grid area before the grid is half shot.
+        :param rowsNumber: the number of rows of the grid - integer
+        :param columnsNumber: the number of columns of the grid - integer
+        '''
+        self.__rowsNumber = rowsNumber
+        self.__columnsNumber = columnsNumber
+        self.__knownCells = set()
+        self.__unknownCells = None
+
+    def reset(self):
+        '''
+        This function marks every cell as unknown
+        :return: nothing
+        '''
+        self.__knownCells.clear()
+        self.__unknownCells = None
+
+    def copy(self):
+        '''
+        This function returns an independent copy of the cells (a draw from the copy gives what the original would)
+        :return: unknownCells - UnknownCells
+        '''
+        cellsCopy = copy.copy(self)
+        cellsCopy.__knownCells = set(self.__knownCells)
+        if self.__unknownCells is not None:
+            cellsCopy.__unknownCells = self.__unknownCells.copy()
+        return cellsCopy
+
+    def remove(self, cell):
+        '''
+        This function marks a cell as known
+        :param cell: the given cell - (row, column) tuple
+        :return: nothing
+        '''
+        if self.__unknownCells is not None:
+            self.__unknownCells.remove(cell)
+            return
+        self.__knownCells.add(cell)
+        if 2 * len(self.__knownCells) >= self.__rowsNumber * self.__columnsNumber:
+            self.__unknownCells = IndexedSet((row, column) for row in range(self.__rowsNumber)
+                                             for column in range(self.__columnsNumber)
+                                             if (row, column) not in self.__knownCells)
+            self.__knownCells.clear()
+
+    def contains(self, cell):
+        '''
+        This function tells if a cell of the grid is unknown
+        :param cell: the given cell - (row, column) tuple
+        :return: True or False accordingly
+        '''
+        if self.__unknownCells is not None:
+            return self.__unknownCells.contains(cell)
+        return cell not in self.__knownCells
+
+    def size(self):
+        '''
+        This function returns the number of unknown cells
+        :return: size - integer
+        '''
+        if self.__unknownCells is not None:
+            return self.__unknownCells.size()
+        return self.__rowsNumber * self.__columnsNumber - len(self.__knownCells)
+
+    def choice(self, randomGenerator = random):
+        '''
+        This function returns a uniformly random unknown cell
+        :param randomGenerator: the source of randomness - random.Random (or the random module)
+        :return: a (row, column) tuple
+                 None if every cell is known
+        '''
+        if self.__unknownCells is not None:
+            return self.__unknownCells.choice(randomGenerator)
+        while True:
+            cell = (randomGenerator.randrange(self.__rowsNumber), randomGenerator.randrange(self.__columnsNumber))
+            if cell not in self.__knownCells:
+                return cell
+
+class TestUnknownCells(unittest.TestCase):
+    def testSmallGrid(self):
+        unknownCells = UnknownCells(2, 3)
+        randomGenerator = random.Random(2)
+        unknownCells.remove((0, 0))
+        self.assertEqual(unknownCells.size(), 5)
+        self.assertFalse(unknownCells.contains((0, 0)))
+        unknownCells.remove((0, 1))
+        unknownCells.remove((0, 2))
+        unknownCells.remove((1, 0))
+        self.assertTrue(unknownCells.contains((1, 1)))
+        self.assertEqual(set(unknownCells.choice(randomGenerator) for i in range(30)), {(1, 1), (1, 2)})
+        unknownCells.remove((1, 1))
+        unknownCells.remove((1, 2))
+        self.assertEqual(unknownCells.size(), 0)
+        self.assertIsNone(unknownCells.choice(randomGenerator))
+        unknownCells.reset()
+        self.assertEqual(unknownCells.size(), 6)
+
+    def testLargeGrid(self):
+        unknownCells = UnknownCells(5000, 5000)
+        unknownCells.remove((10, 20))
+        self.assertEqual(unknownCells.size(), 5000 * 5000 - 1)
+        cell = unknownCells.choice(random.Random(0))
+        self.assertTrue(unknownCells.contains(cell))
@@ -2,8 +2,10 @@
 InputValidator class - responsible for the validation of the user input
 '''
 
+import re
 import unittest
 from utilities.gameConstants import GameConstants
+from utilities.placementTable import PlacementTable, placementTable
 
 class InputValidator:
     @staticmethod
@@ -33,75 +35,74 @@ class InputValidator:
         return givenValue >= lowerBound and givenValue <= upperBound
 
     @staticmethod
-    def checkIfCellIsCorrect(cellString):
+    def checkIfCellIsCorrect(cellString, rowsNumber = GameConstants.rowsNumber, columnsNumber = GameConstants.columnsNumber):
         '''
         This function checks if a user-entered string represents a valid cell
         :param cellString: user-entered string
-        :return: True if the provided strings denotes a valid cell (e.g. A3, B7, C2 etc.)
+        :param rowsNumber: the number of rows of the grid - integer
+        :param columnsNumber: the number of columns of the grid - integer
+        :return: True if the provided strings denotes a valid cell (e.g. A3, B7, C2, AB12 etc.)
                  False otherwise
         '''
-        columns = "ABCDEFGH"
-        rows = "12345678"
-        if len(cellString) != 2:
+        if re.fullmatch("[A-Z]+[1-9][0-9]*", cellString) is None:
             return False
-        if cellString[0] not in columns:
-            return False
-        if cellString[1] not in rows:
-            return False
-        return True
+        row, column = GameConstants.cellStringToCoordinates(cellString)
+        return row < rowsNumber and column < columnsNumber
 
     @staticmethod
-    def __checkForEnoughTilesForPlane(matrix):
+    def getDrawnMask(matrix):
         '''
-        This function checks if a matrix has enough completed tiles for a plane
+        This function collects the drawn tiles (the cells holding 2) of a matrix into a bitmask
         :param matrix: the grid of planes
-        :return: True or False accordingly
+        :return: mask - integer (bit row * columnsNumber + column)
         '''
-        planeTilesCounter = 0
-        for line in matrix:
-            planeTilesCounter += line.count(2)
-        if planeTilesCounter != 10:
-            return False
+        mask = 0
+        columnsNumber = len(matrix[0])
+        for i in range(len(matrix)):
+            for j in range(len(matrix[i])):
+                if matrix[i][j] == 2:
+                    mask |= 1 << (i * columnsNumber + j)
+        return mask
 
     @staticmethod
-    def __getEnclosingPlaneMatrixLimits(matrix):
+    def recognizeDrawnPlane(mask, table = placementTable):
         '''
-        This function returns the upper-left corner and down-right corner of a 'plane'
-        :param matrix: the grid of planes
-        :return: minimumRow, minimumColumn, maximumRow, maximumColumn - integers
+        This function recognises the plane formed by drawn tiles, with one lookup among the masks of all the placements
+        :param mask: the drawn tiles - integer bitmask
+        :param table: the placements of the grid - PlacementTable
+        :return: True or False whether the tiles form exactly one plane
+                 if they do, it will return the cabin location and the orientation as well
         '''
-        minimumRow = minimumColumn = 8
-        maximumRow = maximumColumn = -1
-        for i in range(8):
-            for j in range(8):
-                if matrix[i][j] == 2:
-                    minimumRow = min(minimumRow, i)
-                    maximumRow = max(maximumRow, i)
-                    minimumColumn = min(minimumColumn, j)
-                    maximumColumn = max(maximumColumn, j)
-        return minimumRow, minimumColumn, maximumRow, maximumColumn
+        if bin(mask).count("1") != len(GameConstants.directions["up"]):
+            return False, None, None
+        placementId = table.getPlacementIdFromMask(mask)
+        if placementId is None:
+            return False, None, None
+        cabin = table.getCabin(placementId)
+        return True, GameConstants.coordinatesToCellString(cabin[0], cabin[1]), table.getOrientation(placementId)
 
     @staticmethod
-    def __checkIfAlike(constantMatrix, planeMatrix, minimumRow, minimumColumn, maximumRow, maximumColumn):
+    def recognizeDrawnPlanes(mask, table = placementTable):
         '''
-        This function checks if the constant matrix and the plane matrix are alike in the given boundaries
-        :param constantMatrix:
-        :param planeMatrix:
-        :param minimumRow: the minimum row of the so-called plane
-        :param minimumColumn: the minimum column of the so-called plane
-        :param maximumRow: the maximum row of the so-called plane
-        :param maximumColumn: the maximum column of the so-called plane
-        :return: True or False accordingly
+        This function splits drawn tiles into planes (an exact cover: the lowest drawn tile must belong to one of the
+        placements covering it which fit in the drawn tiles, the rest is split the same way)
+        :param mask: the drawn tiles - integer bitmask
+        :param table: the placements of the grid - PlacementTable
+        :return: planes - list of (cabin location, orientation) tuples
+                 None if the tiles cannot be split into planes
         '''
-        for i in range(maximumRow - minimumRow + 1):
-            for j in range(maximumColumn - minimumColumn + 1):
-                if constantMatrix[i][j] == 1:
-                    if planeMatrix[minimumRow + i][minimumColumn + j] != 2:
-                        return False
-                else:
-                    if planeMatrix[minimumRow + i][minimumColumn + j] == 2:
-                        return False
-        return True
+        if mask == 0:
+            return []
+        firstRow, firstColumn = divmod((mask & -mask).bit_length() - 1, table.getColumnsNumber())
+        for placementId in table.getPlacementsCoveringCell(firstRow, firstColumn):
+            placementMask = table.getMask(placementId)
+            if placementMask & mask == placementMask:
+                otherPlanes = InputValidator.recognizeDrawnPlanes(mask & ~placementMask, table)
+                if otherPlanes is not None:
+                    cabin = table.getCabin(placementId)
+                    plane = (GameConstants.coordinatesToCellString(cabin[0], cabin[1]), table.getOrientation(placementId))
+                    return [plane] + otherPlanes
+        return None
 
     @staticmethod
     def checkIfDrawnPlaneIsCorrect(matrix):
@@ -111,20 +112,8 @@ class InputValidator:
         :return: True or False whether the plane is drawn correctly on the grid
                  if it is correctly placed, it will return the cabin location as well
         '''
-        if InputValidator.__checkForEnoughTilesForPlane(matrix) == False:
-            return False, None, None
-        minimumRow, minimumColumn, maximumRow, maximumColumn = InputValidator.__getEnclosingPlaneMatrixLimits(matrix)
-        if maximumRow - minimumRow + 1 == 4 and maximumColumn - minimumColumn + 1 == 5:
-            if InputValidator.__checkIfAlike(GameConstants.upPlane, matrix, minimumRow, minimumColumn, maximumRow, maximumColumn) == True:
-                return True, GameConstants.coordinatesToCellString(minimumRow, minimumColumn + 2), "up"
-            if InputValidator.__checkIfAlike(GameConstants.downPlane, matrix, minimumRow, minimumColumn, maximumRow, maximumColumn) == True:
-                return True, GameConstants.coordinatesToCellString(maximumRow, minimumColumn + 2), "down"
-        elif maximumRow - minimumRow + 1 == 5 and maximumColumn - minimumColumn + 1 == 4:
-            if InputValidator.__checkIfAlike(GameConstants.leftPlane, matrix, minimumRow, minimumColumn, maximumRow, maximumColumn) == True:
-                return True, GameConstants.coordinatesToCellString(minimumRow + 2, minimumColumn), "left"
-            if InputValidator.__checkIfAlike(GameConstants.rightPlane, matrix, minimumRow, minimumColumn, maximumRow, maximumColumn) == True:
-                return True, GameConstants.coordinatesToCellString(minimumRow + 2, maximumColumn), "right"
-        return False, None, None
+        table = PlacementTable.forBoard(len(matrix), len(matrix[0]))
+        return InputValidator.recognizeDrawnPlane(InputValidator.getDrawnMask(matrix), table)
 
 class TestInputValidator(unittest.TestCase):
     def testGetIntegerFromString(self):
@@ -148,6 +137,12 @@ class TestInputValidator(unittest.TestCase):
         self.assertFalse(InputValidator.checkIfCellIsCorrect("2X"))
         self.assertFalse(InputValidator.checkIfCellIsCorrect("2A"))
         self.assertTrue(InputValidator.checkIfCellIsCorrect("H8"))
+        self.assertFalse(InputValidator.checkIfCellIsCorrect("I8"))
+        self.assertFalse(InputValidator.checkIfCellIsCorrect("A0"))
+        self.assertFalse(InputValidator.checkIfCellIsCorrect("A03"))
+        self.assertTrue(InputValidator.checkIfCellIsCorrect("AB100", 100, 28))
+        self.assertFalse(InputValidator.checkIfCellIsCorrect("AB101", 100, 28))
+        self.assertFalse(InputValidator.checkIfCellIsCorrect("AC100", 100, 28))
 
     def testCheckIfDrawnPlaneIsCorrect(self):
         matrix = [[-1, 2, 2, -1, -1, -1, -1, -1],
@@ -164,4 +159,32 @@ class TestInputValidator(unittest.TestCase):
         answer, location, orientation = InputValidator.checkIfDrawnPlaneIsCorrect(matrix)
         self.assertTrue(answer)
         self.assertEqual(location, "C1")
-        self.assertEqual(orientation, "up")
\ No newline at end of file
+        self.assertEqual(orientation, "up")
+
+    def testCheckIfDrawnPlaneIsCorrectCountsTiles(self):
+        matrix = [[-1, -1, 2, -1, -1, -1, -1, -1],
+                  [2, 2, 2, 2, 2, -1, -1, -1],
+                  [-1, -1, 2, -1, -1, -1, -1, -1],
+                  [-1, 2, 2, 2, -1, -1, -1, -1],
+                  [-1, -1, -1, -1, -1, -1, -1, -1],
+                  [-1, -1, -1, -1, -1, -1, -1, 2],
+                  [-1, -1, -1, -1, -1, -1, -1, -1],
+                  [-1, -1, -1, -1, -1, -1, -1, -1]]
+        self.assertEqual(InputValidator.checkIfDrawnPlaneIsCorrect(matrix), (False, None, None))
+        matrix[5][7] = -1
+        matrix[3][2] = -1
+        self.assertEqual(InputValidator.checkIfDrawnPlaneIsCorrect(matrix), (False, None, None))
+
+    def testRecognizeDrawnPlanes(self):
+        firstMask = placementTable.getMask(placementTable.getPlacementId("A5", "left"))
+        secondMask = placementTable.getMask(placementTable.getPlacementId("F8", "down"))
+        self.assertEqual(InputValidator.recognizeDrawnPlane(secondMask), (True, "F8", "down"))
+        self.assertEqual(InputValidator.recognizeDrawnPlane(firstMask | secondMask), (False, None, None))
+        self.assertEqual(sorted(InputValidator.recognizeDrawnPlanes(firstMask | secondMask)), [("A5", "left"), ("F8", "down")])
+        self.assertIsNone(InputValidator.recognizeDrawnPlanes(firstMask | secondMask | 1))
+        self.assertEqual(InputValidator.recognizeDrawnPlanes(0), [])
+
+    def testRecognizeDrawnPlaneLargeBoard(self):
+        table = PlacementTable.forBoard(500, 700)
+        placementId = table.getPlacementId("ZA300", "right")
+        self.assertEqual(InputValidator.recognizeDrawnPlane(table.getMask(placementId), table), (True, "ZA300", "right"))
@@ -1,33 +1,26 @@
 '''
-PlaneValidator class - validates if a plane can be places in a 8x8 grid
+PlaneValidator class - validates if a plane can be places in the grid
 '''
 
+from utilities.gameConstants import GameConstants
+from validation.inputValidator import InputValidator
 import unittest
 
 class PlaneValidator:
     @staticmethod
-    def checkPlane(plane):
+    def checkPlane(plane, rowsNumber = GameConstants.rowsNumber, columnsNumber = GameConstants.columnsNumber):
         '''
         This function checks if the user typed valid cabin information in
         :param plane: the given plane
+        :param rowsNumber: the number of rows of the grid - integer
+        :param columnsNumber: the number of columns of the grid - integer
         :return: True if both the strings represent valid cabin information
                  False otherwise
         '''
         directions = ["up", "down", "left", "right"]
-        columns = "ABCDEFGH"
-        rows = "12345678"
-        cabinCellString = plane.getCabinLocation()
-        cabinOrientation = plane.getCabinOrientation()
-
-        if len(cabinCellString) != 2:
-            return False
-        if cabinOrientation not in directions:
-            return False
-        if cabinCellString[0] not in columns:
-            return False
-        if cabinCellString[1] not in rows:
+        if plane.getCabinOrientation() not in directions:
             return False
-        return True
+        return InputValidator.checkIfCellIsCorrect(plane.getCabinLocation(), rowsNumber, columnsNumber)
 
     @staticmethod
     def checkPlaneCells(plane):
@@ -37,15 +30,7 @@ class PlaneValidator:
         :return: True if the plane can be placed in the grid
                  False otherwise
         '''
-        planeCells = plane.getPlaneCellsList()
-        for planeCell in planeCells:
-            row = planeCell[0]
-            column = planeCell[1]
-            if row not in range(8):
-                return False
-            if column not in range(8):
-                return False
-        return True
+        return plane.getPlacementId() is not None
 
 class TestPlaneValidator(unittest.TestCase):
     def testCheckPlane(self):
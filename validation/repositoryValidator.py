@@ -22,6 +22,31 @@ class RepositoryValidator:
                 return True
         return False
 
+    @staticmethod
+    def checkIfPlaneOverlapsCells(plane, occupiedCells):
+        '''
+        This function checks if a specific plane overlaps with the stored cells of the existing planes
+        :param plane: the given plane - Plane
+        :param occupiedCells: the cells of the existing planes - set or dictionary of (row, column) tuples
+        :return: True if the plane overlaps with an existing plane
+                 False otherwise
+        '''
+        for planeCell in plane.getPlaneCellsList():
+            if planeCell in occupiedCells:
+                return True
+        return False
+
+    @staticmethod
+    def checkIfMaskOverlaps(planeMask, planesMask):
+        '''
+        This function checks if the mask of a plane overlaps with the mask of the existing planes
+        :param planeMask: the cells of the given plane - integer bitmask
+        :param planesMask: the cells of the existing planes - integer bitmask
+        :return: True if the plane overlaps with an existing plane
+                 False otherwise
+        '''
+        return planeMask & planesMask != 0
+
 class TestRepositoryValidator(unittest.TestCase):
     def testCheckIfPlaneOverlaps(self):
         from model.plane import Plane
@@ -34,4 +59,14 @@ class TestRepositoryValidator(unittest.TestCase):
                   [-1, -1, -1, -1, -1, -1, -1, -1],
                   [-1, -1, -1, -1, -1, -1, -1, -1]]
         self.assertTrue(RepositoryValidator.checkIfPlaneOverlaps(Plane("A3", "left"), matrix))
-        self.assertFalse(RepositoryValidator.checkIfPlaneOverlaps(Plane("F7", "down"), matrix))
\ No newline at end of file
+        self.assertFalse(RepositoryValidator.checkIfPlaneOverlaps(Plane("F7", "down"), matrix))
+
+    def testCheckIfPlaneOverlapsCells(self):
+        from model.plane import Plane
+        occupiedCells = {(4, 0), (4, 1), (4, 2), (4, 3), (4, 4), (3, 2), (2, 1), (2, 2), (2, 3), (1, 2)}
+        self.assertTrue(RepositoryValidator.checkIfPlaneOverlapsCells(Plane("A3", "left"), occupiedCells))
+        self.assertFalse(RepositoryValidator.checkIfPlaneOverlapsCells(Plane("F7", "down"), occupiedCells))
+
+    def testCheckIfMaskOverlaps(self):
+        self.assertTrue(RepositoryValidator.checkIfMaskOverlaps(0b0110, 0b0100))
+        self.assertFalse(RepositoryValidator.checkIfMaskOverlaps(0b0110, 0b1001))
\ No newline at end of file